@@ -1,10 +1,54 @@
 # this is brightdata/__init__.py
+"""
+Public names are resolved lazily (PEP 562): ``import brightdata`` loads
+nothing heavy, ``brightdata.scrape_url`` pulls in `auto` – and with it
+aiohttp / Playwright – on first access only.
+"""
 
-from .web_unlocker import WebUnlocker
-from .webscraper_api import BrightdataBaseSpecializedScraper
-# from .auto import scrape_url, trigger_scrape_url, trigger_scrape_url_with_fallback
-from .auto import scrape_url, scrape_url_async, scrape_urls, scrape_urls_async
-from .auto import crawl_single_url, crawl_website, crawl_single_url_async, crawl_website_async
-from .browserapi import BrowserAPI
-from .crawlerapi import CrawlerAPI, crawl_url, crawl_domain
+from __future__ import annotations
 
+import importlib
+from typing import TYPE_CHECKING, Any
+
+_LAZY = {
+    "WebUnlocker":                      ".web_unlocker",
+    "BrightdataBaseSpecializedScraper": ".webscraper_api",
+    "scrape_url":                       ".auto",
+    "scrape_url_async":                 ".auto",
+    "scrape_urls":                      ".auto",
+    "scrape_urls_async":                ".auto",
+    "scrape_urls_iter":                 ".auto",
+    "scrape_urls_sharded":              ".auto",
+    "crawl_single_url":                 ".auto",
+    "crawl_website":                    ".auto",
+    "crawl_single_url_async":           ".auto",
+    "crawl_website_async":              ".auto",
+    "BrowserAPI":                       ".browserapi",
+    "CrawlerAPI":                       ".crawlerapi",
+    "crawl_url":                        ".crawlerapi",
+    "crawl_domain":                     ".crawlerapi",
+}
+
+__all__ = list(_LAZY)
+
+
+def __getattr__(name: str) -> Any:
+    module = _LAZY.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value                     # next access skips __getattr__
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
+
+
+if TYPE_CHECKING:                               # static analysers / IDEs
+    from .web_unlocker import WebUnlocker
+    from .webscraper_api import BrightdataBaseSpecializedScraper
+    from .auto import scrape_url, scrape_url_async, scrape_urls, scrape_urls_async, scrape_urls_iter, scrape_urls_sharded
+    from .auto import crawl_single_url, crawl_website, crawl_single_url_async, crawl_website_async
+    from .browserapi import BrowserAPI
+    from .crawlerapi import CrawlerAPI, crawl_url, crawl_domain
@@ -21,18 +21,24 @@ import logging
 import os
 logging.getLogger("asyncio").setLevel(logging.INFO)
 import asyncio
-from typing import Any, Dict, List, Union
-
-from dotenv import load_dotenv
+import multiprocessing as mp
+import queue as _queue
+import traceback
+from collections import defaultdict
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional, Tuple, Union
+from urllib.parse import urlparse
 
 from brightdata.browserapi import BrowserAPI, BrowserPool
 from brightdata.web_unlocker import WebUnlocker
 from brightdata.models import ScrapeResult, CrawlResult
-from brightdata.webscraper_api.registry import get_scraper_for
+from brightdata.webscraper_api.registry import get_scraper_for, get_router
+from brightdata.webscraper_api.engine import get_engine
+from brightdata.webscraper_api.scheduler import SnapshotScheduler
+from brightdata.webscraper_api.coalescer import TriggerCoalescer, split_result_by_input
 from brightdata.crawlerapi import CrawlerAPI, crawl_url, crawl_domain
 from brightdata.utils import show_scrape_results
+from brightdata.utils.env import getenv
 
-load_dotenv()
 logger = logging.getLogger(__name__)
 
 
@@ -53,7 +59,7 @@ def trigger_scrape_url(
     *,
     raise_if_unknown: bool = False,
 ) -> Snapshot | None:
-    token = bearer_token or os.getenv("BRIGHTDATA_TOKEN")
+    token = bearer_token or getenv("BRIGHTDATA_TOKEN")
     if not token:
         raise RuntimeError("Provide bearer_token or set BRIGHTDATA_TOKEN")
 
@@ -71,12 +77,42 @@ def trigger_scrape_url(
     return scraper.collect_by_url(url)
 
 
+async def trigger_scrape_url_async(
+    url: str,
+    bearer_token: str | None = None,
+    *,
+    coalescer: TriggerCoalescer | None = None,
+    raise_if_unknown: bool = False,
+) -> Snapshot | None:
+    """
+    Async twin of `trigger_scrape_url`.  With a *coalescer* the trigger is
+    merged with every other URL of the same dataset triggered within the
+    coalescer's window – all of them get the same snapshot_id back.
+    """
+    token = bearer_token or getenv("BRIGHTDATA_TOKEN")
+    if not token:
+        raise RuntimeError("Provide bearer_token or set BRIGHTDATA_TOKEN")
+
+    ScraperCls = get_scraper_for(url)
+    if ScraperCls is None:
+        if raise_if_unknown:
+            raise ValueError(f"No scraper registered for {url}")
+        return None
+
+    scraper = ScraperCls(bearer_token=token, coalescer=coalescer)
+    if not hasattr(scraper, "collect_by_url_async"):
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, scraper.collect_by_url, url)
+
+    return await scraper.collect_by_url_async(url)
+
+
 # ─────────────────────────────────────────────────────────────── single URL (sync)
 def scrape_url(
     url: str,
     *,
     bearer_token: str | None = None,
-    poll_interval: int = 8,
+    poll_interval: Optional[float] = None,
     poll_timeout:  int = 180,
     flexible_timeout: bool = False,
     fallback_to_browser_api: bool = False,
@@ -120,17 +156,13 @@ async def scrape_url_async(
     url: str,
     *,
     bearer_token: str | None = None,
-    poll_interval: int = 8,
+    poll_interval: Optional[float] = None,
     poll_timeout:  int = 180,
     flexible_timeout: bool = False,
     fallback_to_browser_api: bool = False,
 ) -> ScrapeResult | Dict[str, ScrapeResult] | None:
-    # 1) trigger in thread (blocking)
-    loop = asyncio.get_running_loop()
-    snap = await loop.run_in_executor(
-        None,
-        lambda: trigger_scrape_url(url, bearer_token=bearer_token)
-    )
+    # 1) trigger on the caller's loop
+    snap = await trigger_scrape_url_async(url, bearer_token)
 
     if snap is None:
         if not fallback_to_browser_api:
@@ -167,169 +199,192 @@ async def scrape_url_async(
 
 # ─────────────────────────────────────────────────────────────── many URLs (async)
 
+async def scrape_urls_iter(
+    urls: List[str],
+    *,
+    bearer_token: str | None = None,
+    poll_interval: Optional[float] = None,
+    poll_timeout:  int = 180,
+    fallback_to_browser_api: bool = False,
+    pool_size: int = 8,
+    flexible_timeout: bool = False,
+    max_polls_per_sec: float = 10.0,
+    coalesce: bool = False,
+    coalesce_window: float = 0.25,
+    coalesce_max_batch: int = 500,
+    max_concurrent_triggers: int = 32,
+) -> AsyncIterator[Tuple[str, Union[ScrapeResult, Dict[str, ScrapeResult], None]]]:
+    """
+    Like `scrape_urls_async`, but yields ``(url, result)`` pairs in
+    *completion* order instead of returning one dict at the end::
+
+        async for url, res in scrape_urls_iter(urls):
+            store(url, res)
+
+    A slow snapshot no longer holds back the finished ones, and a result is
+    dropped from here as soon as it has been yielded.  A URL listed more than
+    once is triggered and yielded once.  To stop early, close
+    the iterator – the polls still outstanding are cancelled::
+
+        async with contextlib.aclosing(scrape_urls_iter(urls)) as it:
+            async for url, res in it:
+                if enough(res):
+                    break
+    """
+
+    engine = get_engine(bearer_token)
+    uniq = list(dict.fromkeys(urls))            # a repeated URL is triggered (and billed) once
+    async with engine.pooling():
+        # 1) trigger all in parallel --------------------------------------------
+        if coalesce:
+            async with TriggerCoalescer(
+                engine,
+                window=coalesce_window,
+                max_batch=coalesce_max_batch,
+            ) as coalescer:
+                snaps = await asyncio.gather(*(
+                    trigger_scrape_url_async(u, bearer_token, coalescer=coalescer)
+                    for u in uniq
+                ))
+        else:
+            sem = asyncio.Semaphore(max_concurrent_triggers)
+
+            async def _trigger(u: str) -> Snapshot | None:
+                async with sem:
+                    return await trigger_scrape_url_async(u, bearer_token)
+
+            snaps = await asyncio.gather(*(_trigger(u) for u in uniq))
+        url_to_snap = dict(zip(uniq, snaps))
+        url_to_cls  = {
+            u: r.scraper if r else None
+            for u, r in zip(url_to_snap, get_router().route_many(url_to_snap))
+        }
+
+        # snapshot_id → URLs (only >1 when triggers were coalesced)
+        sid_urls: Dict[str, List[str]] = defaultdict(list)
+        for u, s in url_to_snap.items():
+            if isinstance(s, str):
+                sid_urls[s].append(u)
+        splits: Dict[str, asyncio.Task] = {}
+
+        # 2) prepare Browser-API pool for fallbacks -----------------------------
+        missing = [u for u, s in url_to_snap.items() if s is None]
+        pool: BrowserPool | None = None
+        if fallback_to_browser_api and missing:
+            pool = BrowserPool(size=min(pool_size, len(missing)))
+
+        # 3) schedule polling – one SnapshotScheduler drives every snapshot ----
+        scheduler = SnapshotScheduler(
+            engine,
+            poll_interval=poll_interval,
+            max_polls_per_sec=max_polls_per_sec,
+        )
+        tasks: Dict[asyncio.Future, str] = {}
+        try:
+            for url, snap in url_to_snap.items():
+                ScraperCls = url_to_cls[url]
+
+                # —— 3a. fallback to Browser-API ————————————
+                if snap is None or ScraperCls is None:
+                    if pool is not None:
+                        async def _fallback(u=url):
+                            return await pool.fetch_async(u)
+                        tasks[asyncio.create_task(_fallback())] = url
+                    else:
+                        tasks[asyncio.create_task(asyncio.sleep(0, result=None))] = url
+                    continue
+
+                # —— 3b. Bright-Data polling ————————————————
+                # pick timeout (respect MIN_POLL_TIMEOUT if asked)
+                effective_timeout = poll_timeout
+                if flexible_timeout and getattr(ScraperCls, "MIN_POLL_TIMEOUT", None):
+                    effective_timeout = max(poll_timeout, ScraperCls.MIN_POLL_TIMEOUT)
+
+                # single-bucket vs. multi-bucket handling
+                if isinstance(snap, dict):          # multi-bucket snapshot
+                    subfuts = {
+                        b: scheduler.submit(sid, timeout=effective_timeout)
+                        for b, sid in snap.items()
+                    }
+                    async def _gather_multi(s=subfuts):
+                        done = await asyncio.gather(*s.values())
+                        return dict(zip(s.keys(), done))
+                    tasks[asyncio.create_task(_gather_multi())] = url
+                elif len(sid_urls[snap]) > 1:       # coalesced: shared snapshot_id
+                    if snap not in splits:
+                        async def _split(f=scheduler.submit(snap, timeout=effective_timeout),
+                                         us=sid_urls[snap]):
+                            return split_result_by_input(await f, us)
+                        splits[snap] = asyncio.create_task(_split())
+                    async def _pick(t=splits[snap], u=url):
+                        return (await t)[u]
+                    tasks[asyncio.create_task(_pick())] = url
+                else:                               # single snapshot_id
+                    tasks[scheduler.submit(snap, timeout=effective_timeout)] = url
+
+            # 4) yield in completion order ---------------------------------------
+            pending = set(tasks)
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for fut in done:
+                    yield tasks.pop(fut), fut.result()
+        finally:
+            for fut in tasks:
+                fut.cancel()
+            for t in splits.values():
+                t.cancel()
+            await scheduler.close()
+            if pool is not None:
+                await pool.close()
+
+
 async def scrape_urls_async(
     urls: List[str],
     *,
     bearer_token: str | None = None,
-    poll_interval: int = 8,
+    poll_interval: Optional[float] = None,
     poll_timeout:  int = 180,
     fallback_to_browser_api: bool = False,
     pool_size: int = 8,
     flexible_timeout: bool = False,          # ← NEW
+    max_polls_per_sec: float = 10.0,
+    coalesce: bool = False,
+    coalesce_window: float = 0.25,
+    coalesce_max_batch: int = 500,
+    max_concurrent_triggers: int = 32,
 ) -> Dict[str, Union[ScrapeResult, Dict[str, ScrapeResult], None]]:
+    """
+    Trigger every URL, then let **one** `SnapshotScheduler` poll all the
+    resulting snapshots at an aggregate rate of *max_polls_per_sec*.
 
-    loop = asyncio.get_running_loop()
-
-    # 1) trigger all in parallel ------------------------------------------------
-    trigger_futs = {
-        u: loop.run_in_executor(
-               None, lambda _u=u: trigger_scrape_url(_u, bearer_token)
-           )
-        for u in urls
-    }
-    snaps = await asyncio.gather(*trigger_futs.values())
-    url_to_snap = dict(zip(urls, snaps))
-
-    # 2) prepare Browser-API pool for fallbacks ---------------------------------
-    missing = [u for u, s in url_to_snap.items() if s is None]
-    pool: BrowserPool | None = None
-    if fallback_to_browser_api and missing:
-        pool = BrowserPool(size=min(pool_size, len(missing)))
-
-    # 3) schedule polling tasks -------------------------------------------------
-    tasks: Dict[str, asyncio.Task] = {}
-    for url, snap in url_to_snap.items():
-        ScraperCls = get_scraper_for(url)
-
-        # —— 3a. fallback to Browser-API ————————————
-        if snap is None or ScraperCls is None:
-            if pool is not None:
-                async def _fallback(u=url):
-                    api = await pool.acquire()
-                    return await api.fetch_async(u)
-                tasks[url] = asyncio.create_task(_fallback())
-            else:
-                tasks[url] = asyncio.create_task(asyncio.sleep(0, result=None))
-            continue
-
-        # —— 3b. Bright-Data polling ————————————————
-        scraper = ScraperCls(bearer_token=bearer_token)
-
-        # pick timeout (respect MIN_POLL_TIMEOUT if asked)
-        effective_timeout = poll_timeout
-        if flexible_timeout and getattr(ScraperCls, "MIN_POLL_TIMEOUT", None):
-            effective_timeout = max(poll_timeout, ScraperCls.MIN_POLL_TIMEOUT)
-
-        # single-bucket vs. multi-bucket handling
-        if isinstance(snap, dict):          # multi-bucket snapshot
-            subtasks = {
-                b: asyncio.create_task(
-                       scraper.poll_until_ready_async(
-                           sid,
-                           poll_interval=poll_interval,
-                           timeout=effective_timeout,
-                       )
-                   )
-                for b, sid in snap.items()
-            }
-            async def _gather_multi(s=subtasks):
-                done = await asyncio.gather(*s.values())
-                return dict(zip(s.keys(), done))
-            tasks[url] = asyncio.create_task(_gather_multi())
-        else:                               # single snapshot_id
-            tasks[url] = asyncio.create_task(
-                scraper.poll_until_ready_async(
-                    snap,
-                    poll_interval=poll_interval,
-                    timeout=effective_timeout,
-                )
-            )
-
-    # 4) collect & cleanup ------------------------------------------------------
-    gathered = await asyncio.gather(*tasks.values())
-    results  = dict(zip(tasks.keys(), gathered))
-    if pool is not None:
-        await pool.close()
-    return results
-
-# async def scrape_urls_async(
-#     urls: List[str],
-#     *,
-#     bearer_token: str | None = None,
-#     poll_interval: int = 8,
-#     poll_timeout:  int = 180,
-#     fallback_to_browser_api: bool = False,
-#     pool_size: int = 8,
-# ) -> Dict[str, Union[ScrapeResult, Dict[str, ScrapeResult], None]]:
-#     loop = asyncio.get_running_loop()
-    
-#     # 1) trigger all in parallel
-#     trigger_futs = {
-#         u: loop.run_in_executor(
-#                None, lambda _u=u: trigger_scrape_url(_u, bearer_token)
-#            )
-#         for u in urls
-#     }
-#     snaps = await asyncio.gather(*trigger_futs.values())
-#     url_to_snap = dict(zip(urls, snaps))
-
-#     # 2) prepare Browser-API pool for fallbacks
-#     missing = [u for u, s in url_to_snap.items() if s is None]
-#     pool = None
-#     if fallback_to_browser_api and missing:
-#         pool = BrowserPool(size=min(pool_size, len(missing)),
-#                         #    browser_kwargs=dict(load_state="domcontentloaded")
-#                            )
-    
-#     # 3) schedule all tasks
-#     tasks: Dict[str, asyncio.Task] = {}
-#     for url, snap in url_to_snap.items():
-#         ScraperCls = get_scraper_for(url)
-
-#         # —— fallback to BrowserAPI —— 
-#         if snap is None or ScraperCls is None:
-#             if pool is not None:
-#                 async def _fallback(u=url):
-#                     api = await pool.acquire()
-#                     # ← replaced get_page_source_with_a_delay_async with fetch_async
-#                     return await api.fetch_async(u)
-#                 tasks[url] = asyncio.create_task(_fallback())
-#             else:
-#                 tasks[url] = asyncio.create_task(asyncio.sleep(0, result=None))
-#             continue
-
-#         # —— Bright-Data snapshot polling ——
-#         scraper = ScraperCls(bearer_token=bearer_token)
-#         if isinstance(snap, dict):
-#             subtasks = {
-#                 b: asyncio.create_task(
-#                        scraper.poll_until_ready_async(
-#                            sid,
-#                            poll_interval=poll_interval,
-#                            timeout=poll_timeout
-#                        )
-#                    )
-#                 for b, sid in snap.items()
-#             }
-#             async def _gather_multi(s=subtasks):
-#                 done = await asyncio.gather(*s.values())
-#                 return dict(zip(s.keys(), done))
-#             tasks[url] = asyncio.create_task(_gather_multi())
-#         else:
-#             tasks[url] = asyncio.create_task(
-#                 scraper.poll_until_ready_async(
-#                     snap,
-#                     poll_interval=poll_interval,
-#                     timeout=poll_timeout
-#                 )
-#             )
-
-#     # 4) collect & cleanup
-#     gathered = await asyncio.gather(*tasks.values())
-#     results  = dict(zip(tasks.keys(), gathered))
-#     if pool is not None:
-#         await pool.close()
-#     return results
+    Everything runs on the caller's loop: triggers go through each scraper's
+    ``collect_by_url_async`` (at most *max_concurrent_triggers* at a time)
+    over one pooled HTTP session – no thread or event loop per URL.
+
+    ``coalesce=True`` merges the single-URL triggers of one dataset into
+    multi-record POSTs (see `TriggerCoalescer`); the shared snapshot is polled
+    once and its rows are split back to the URL that requested them.
+
+    Collects `scrape_urls_iter`; use that directly to process results as
+    they complete.
+    """
+    results: Dict[str, Union[ScrapeResult, Dict[str, ScrapeResult], None]] = {}
+    async for url, res in scrape_urls_iter(
+        urls,
+        bearer_token=bearer_token,
+        poll_interval=poll_interval,
+        poll_timeout=poll_timeout,
+        fallback_to_browser_api=fallback_to_browser_api,
+        pool_size=pool_size,
+        flexible_timeout=flexible_timeout,
+        max_polls_per_sec=max_polls_per_sec,
+        coalesce=coalesce,
+        coalesce_window=coalesce_window,
+        coalesce_max_batch=coalesce_max_batch,
+        max_concurrent_triggers=max_concurrent_triggers,
+    ):
+        results[url] = res
+    return {u: results[u] for u in dict.fromkeys(urls) if u in results}
 
 
 # ─────────────────────────────────────────────────────────────── many URLs (sync)
@@ -337,7 +392,7 @@ def scrape_urls(
     urls: List[str],
     *,
     bearer_token: str | None = None,
-    poll_interval: int = 8,
+    poll_interval: Optional[float] = None,
     poll_timeout:  int = 180,
     fallback_to_browser_api: bool = False,
 ) -> Dict[str, Union[ScrapeResult, Dict[str, ScrapeResult], None]]:
@@ -352,6 +407,131 @@ def scrape_urls(
     )
 
 
+# ─────────────────────────────────────────────────────────────── many URLs (multi-process)
+def _shard_urls(urls: List[str], workers: int) -> List[List[str]]:
+    """
+    Split *urls* into ≤ *workers* shards.  URLs of one scraper class (or,
+    without a scraper, one host) stay together, so each worker can coalesce /
+    pool per dataset; groups bigger than a fair share are cut into pieces.
+    """
+    groups: Dict[str, List[str]] = defaultdict(list)
+    uniq = list(dict.fromkeys(urls))                     # de-dupe, keep order
+    for u, route in zip(uniq, get_router().route_many(uniq)):
+        cls = route.scraper if route else None
+        groups[cls.__name__ if cls else urlparse(u).netloc.lower()].append(u)
+
+    total = sum(len(g) for g in groups.values())
+    share = max(1, -(-total // workers))                 # ceil
+    pieces = [g[i:i + share] for g in groups.values() for i in range(0, len(g), share)]
+    pieces.sort(key=len, reverse=True)
+
+    shards: List[List[str]] = [[] for _ in range(workers)]
+    for piece in pieces:                                 # greedy: fill the lightest
+        min(shards, key=len).extend(piece)
+    return [s for s in shards if s]
+
+
+def _shard_worker(urls: List[str], options: Dict[str, Any], batch_size: int, out) -> None:
+    """Process entry point: own loop, own pooled engine, results → *out* per batch."""
+    async def _run() -> None:
+        for i in range(0, len(urls), batch_size):
+            res = await scrape_urls_async(urls[i:i + batch_size], **options)
+            out.put(("results", list(res.items())))
+
+    try:
+        asyncio.run(_run())
+    except BaseException:
+        out.put(("error", traceback.format_exc()))
+    finally:
+        out.put(("done", None))
+
+
+def scrape_urls_sharded(
+    urls: List[str],
+    *,
+    workers: Optional[int] = None,
+    batch_size: int = 1000,
+    on_result: Optional[Callable[[str, Any], None]] = None,
+    start_method: str = "spawn",
+    bearer_token: str | None = None,
+    poll_interval: Optional[float] = None,
+    poll_timeout:  int = 180,
+    fallback_to_browser_api: bool = False,
+    flexible_timeout: bool = False,
+    max_polls_per_sec: float = 10.0,
+    coalesce: bool = False,
+) -> Dict[str, Union[ScrapeResult, Dict[str, ScrapeResult], None]]:
+    """
+    `scrape_urls` spread over *workers* processes (default: CPU count).
+
+    Very large lists make the single loop of `scrape_urls_async` CPU-bound
+    (JSON decoding, result building).  Here the URLs are sharded by scraper
+    class, every worker runs `scrape_urls_async` on its own event loop and
+    pooled session in batches of *batch_size*, and results stream back over a
+    queue as each batch finishes – *on_result(url, result)* sees them as they
+    arrive.  ``max_polls_per_sec`` applies **per worker**.
+
+    With the default ``spawn`` start method, call this from under
+    ``if __name__ == "__main__":``.
+    """
+    options = dict(
+        bearer_token=bearer_token,
+        poll_interval=poll_interval,
+        poll_timeout=poll_timeout,
+        fallback_to_browser_api=fallback_to_browser_api,
+        flexible_timeout=flexible_timeout,
+        max_polls_per_sec=max_polls_per_sec,
+        coalesce=coalesce,
+    )
+    workers = max(1, workers or os.cpu_count() or 1)
+    shards  = _shard_urls(urls, workers)
+
+    results: Dict[str, Any] = {}
+    if len(shards) <= 1:                                 # nothing to parallelise
+        results = asyncio.run(scrape_urls_async(list(dict.fromkeys(urls)), **options))
+        if on_result is not None:
+            for u, r in results.items():
+                on_result(u, r)
+        return {u: results.get(u) for u in urls}
+
+    ctx   = mp.get_context(start_method)
+    out   = ctx.Queue()
+    procs = [
+        ctx.Process(target=_shard_worker, args=(shard, options, batch_size, out),
+                    name=f"bd-shard-{i}")
+        for i, shard in enumerate(shards)
+    ]
+    for p in procs:
+        p.start()
+
+    running = len(procs)
+    try:
+        while running:
+            try:
+                kind, body = out.get(timeout=1.0)
+            except _queue.Empty:
+                if not any(p.is_alive() for p in procs):  # a worker died hard
+                    logger.error("shard worker(s) exited without reporting back")
+                    break
+                continue
+            if kind == "results":
+                for u, r in body:
+                    results[u] = r
+                    if on_result is not None:
+                        on_result(u, r)
+            elif kind == "error":
+                logger.error("shard worker failed:\n%s", body)
+            else:
+                running -= 1
+    finally:
+        for p in procs:
+            p.join(timeout=5)
+            if p.is_alive():
+                p.terminate()
+
+    return {u: results.get(u) for u in urls}
+
+
 
 # ─────────────────────────────────────────────────────────────── Crawler API helpers
 def crawl_single_url(
@@ -365,7 +545,7 @@ def crawl_single_url(
     Crawl a single URL using the Crawler API.
     Returns a CrawlResult with the page content.
     """
-    token = bearer_token or os.getenv("BRIGHTDATA_TOKEN")
+    token = bearer_token or getenv("BRIGHTDATA_TOKEN")
     if not token:
         raise RuntimeError("Provide bearer_token or set BRIGHTDATA_TOKEN")
     
@@ -387,7 +567,7 @@ def crawl_website(
     Crawl an entire website domain using the Crawler API.
     Returns a CrawlResult with all discovered pages.
     """
-    token = bearer_token or os.getenv("BRIGHTDATA_TOKEN")
+    token = bearer_token or getenv("BRIGHTDATA_TOKEN")
     if not token:
         raise RuntimeError("Provide bearer_token or set BRIGHTDATA_TOKEN")
     
@@ -413,7 +593,7 @@ async def crawl_single_url_async(
     """
     Asynchronously crawl a single URL using the Crawler API.
     """
-    token = bearer_token or os.getenv("BRIGHTDATA_TOKEN")
+    token = bearer_token or getenv("BRIGHTDATA_TOKEN")
     if not token:
         raise RuntimeError("Provide bearer_token or set BRIGHTDATA_TOKEN")
     
@@ -435,7 +615,7 @@ async def crawl_website_async(
     """
     Asynchronously crawl an entire website domain using the Crawler API.
     """
-    token = bearer_token or os.getenv("BRIGHTDATA_TOKEN")
+    token = bearer_token or getenv("BRIGHTDATA_TOKEN")
     if not token:
         raise RuntimeError("Provide bearer_token or set BRIGHTDATA_TOKEN")
     
@@ -7,9 +7,16 @@ Provides browser automation capabilities through BrightData's infrastructure.
 from .browser_api import BrowserAPI
 from .browser_pool import BrowserPool
 from .browser_config import BrowserConfig
+from .interception import InterceptionProfile, TransferMeter, PROFILES
+from .readiness import ReadinessEngine, ReadinessRule
 
 __all__ = [
     'BrowserAPI',
     'BrowserPool', 
-    'BrowserConfig'
+    'BrowserConfig',
+    'InterceptionProfile',
+    'TransferMeter',
+    'PROFILES',
+    'ReadinessEngine',
+    'ReadinessRule',
 ]
\ No newline at end of file
@@ -0,0 +1,239 @@
+# brightdata/browserapi/autotune.py
+"""
+brightdata.browserapi.autotune
+==============================
+Finds the safe Browser-API concurrency at runtime instead of by manual
+sweeps (`browser_api_variants/check_max_concurrency_ceiling.py`,
+`stress_test_browser_api.py`).
+
+`AIMDController` – additive increase / multiplicative decrease, like TCP:
+
+► every *window* fetches the window is judged
+    - error rate above *max_error_rate*              → limit × *decrease*
+    - navigation p95 above *latency_factor* × best   → limit × *decrease*
+    - CDP handshake above *handshake_factor* × best  → limit × *decrease*
+    - otherwise, if the limit was actually the bottleneck
+      (callers found every permit taken)             → limit + *increase*
+► a burst of errors inside a window cuts the limit at once
+► "best" latencies drift up 5 % per window, so a slower site mix does not
+  pin the limit low forever
+
+`ResizableLimiter` is the semaphore whose permit count the controller moves
+(the `semaphore` strategy); the `pool` strategy resizes its `BrowserPool`.
+
+    api = BrowserAPI(strategy="pool", pool_size=4, autotune=True)
+    …
+    api.tuner.stats()   # limit, increases, decreases, p95, error_rate …
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections import deque
+from typing import Deque, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+
+def _percentile(values, q: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+
+class ResizableLimiter:
+    """FIFO async semaphore whose limit can change while permits are out."""
+
+    def __init__(self, limit: int):
+        self._limit = max(1, limit)
+        self.in_flight = 0
+        self._waiters: Deque[asyncio.Future] = deque()
+
+    @property
+    def limit(self) -> int:
+        return self._limit
+
+    def set_limit(self, limit: int) -> None:
+        """Grow → waiters are let in now; shrink → takes effect as permits return."""
+        self._limit = max(1, limit)
+        self._wake()
+
+    def saturated(self) -> bool:
+        return self.in_flight >= self._limit or bool(self._waiters)
+
+    async def acquire(self) -> None:
+        if self.in_flight < self._limit and not self._waiters:
+            self.in_flight += 1
+            return
+        fut = asyncio.get_running_loop().create_future()
+        self._waiters.append(fut)
+        try:
+            await fut
+        except asyncio.CancelledError:
+            if fut.done() and not fut.cancelled():
+                self.release()              # permit was handed over – pass it on
+            else:
+                self._waiters.remove(fut)
+            raise
+
+    def release(self) -> None:
+        self.in_flight -= 1
+        self._wake()
+
+    def _wake(self) -> None:
+        while self._waiters and self.in_flight < self._limit:
+            fut = self._waiters.popleft()
+            if not fut.done():
+                self.in_flight += 1
+                fut.set_result(None)
+
+    async def __aenter__(self) -> "ResizableLimiter":
+        await self.acquire()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> bool:
+        self.release()
+        return False
+
+
+class AIMDController:
+    """
+    Concurrency limit driven by observed latency, handshake time and errors.
+
+    Feed it with `record()` after every fetch (and `record_handshake()`
+    after every CDP connect); `record` returns the new limit when it
+    changed, else None – applying it is up to the caller.
+    """
+
+    def __init__(
+        self,
+        *,
+        initial: int = 4,
+        min_limit: int = 1,
+        max_limit: int = 64,
+        increase: int = 1,
+        decrease: float = 0.5,
+        window: int = 20,
+        max_error_rate: float = 0.10,
+        latency_factor: float = 2.0,
+        handshake_factor: float = 3.0,
+    ) -> None:
+        if not 0 < decrease < 1:
+            raise ValueError("decrease must be between 0 and 1")
+        self.min_limit = max(1, min_limit)
+        self.max_limit = max(self.min_limit, max_limit)
+        self.limit = min(self.max_limit, max(self.min_limit, initial))
+        self.increase = increase
+        self.decrease = decrease
+        self.window = window
+        self.max_error_rate = max_error_rate
+        self.latency_factor = latency_factor
+        self.handshake_factor = handshake_factor
+
+        self.best_p95: Optional[float] = None
+        self.best_handshake: Optional[float] = None
+        self._latencies: Deque[float] = deque()
+        self._handshakes: Deque[float] = deque(maxlen=window)
+        self._samples = 0
+        self._errors = 0
+        self._saturated = 0
+        # counters / last verdict
+        self.increases = 0
+        self.decreases = 0
+        self.last_p95: Optional[float] = None
+        self.last_error_rate = 0.0
+        self.last_reason = ""
+
+    # ------------------------------------------------------------------
+    # feedback
+    # ------------------------------------------------------------------
+    def record_handshake(self, seconds: float) -> None:
+        self._handshakes.append(seconds)
+
+    def record(self, latency: Optional[float], ok: bool, *, saturated: bool = False) -> Optional[int]:
+        """One finished fetch: navigation *latency* (s), success, and whether
+        the caller had found every permit taken."""
+        self._samples += 1
+        if ok and latency is not None:
+            self._latencies.append(latency)
+        if not ok:
+            self._errors += 1
+            # a burst of errors does not wait for the window to fill
+            if self._errors > max(1, int(self.window * self.max_error_rate)):
+                return self._cut("error burst")
+        if saturated:
+            self._saturated += 1
+        if self._samples < self.window:
+            return None
+        return self._judge()
+
+    # ------------------------------------------------------------------
+    # decisions
+    # ------------------------------------------------------------------
+    def _judge(self) -> Optional[int]:
+        error_rate = self._errors / self._samples
+        p95 = _percentile(self._latencies, 0.95) if self._latencies else None
+        handshake = _percentile(self._handshakes, 0.5) if self._handshakes else None
+        self.last_p95, self.last_error_rate = p95, error_rate
+
+        verdict = None
+        if error_rate > self.max_error_rate:
+            verdict = f"error rate {error_rate:.0%}"
+        elif p95 is not None and self.best_p95 and p95 > self.latency_factor * self.best_p95:
+            verdict = f"p95 {p95:.2f}s vs best {self.best_p95:.2f}s"
+        elif handshake is not None and self.best_handshake \
+                and handshake > self.handshake_factor * self.best_handshake:
+            verdict = f"handshake {handshake:.2f}s vs best {self.best_handshake:.2f}s"
+
+        # baselines: best seen, drifting up 5 % per window
+        if p95 is not None:
+            self.best_p95 = p95 if self.best_p95 is None else min(p95, self.best_p95 * 1.05)
+        if handshake is not None:
+            self.best_handshake = (
+                handshake if self.best_handshake is None
+                else min(handshake, self.best_handshake * 1.05)
+            )
+
+        if verdict:
+            return self._cut(verdict)
+        if self._saturated * 2 >= self._samples:
+            return self._grow()
+        self._reset()
+        return None
+
+    def _cut(self, reason: str) -> Optional[int]:
+        new = max(self.min_limit, int(self.limit * self.decrease))
+        return self._apply(new, reason)
+
+    def _grow(self) -> Optional[int]:
+        new = min(self.max_limit, self.limit + self.increase)
+        return self._apply(new, "saturated")
+
+    def _apply(self, new: int, reason: str) -> Optional[int]:
+        self._reset()
+        self.last_reason = reason
+        if new == self.limit:
+            return None
+        if new > self.limit:
+            self.increases += 1
+        else:
+            self.decreases += 1
+        logger.debug("autotune: concurrency %d → %d (%s)", self.limit, new, reason)
+        self.limit = new
+        return new
+
+    def _reset(self) -> None:
+        self._latencies.clear()
+        self._samples = self._errors = self._saturated = 0
+
+    def stats(self) -> Dict[str, object]:
+        return {
+            "limit":          self.limit,
+            "increases":      self.increases,
+            "decreases":      self.decreases,
+            "p95":            self.last_p95,
+            "best_p95":       self.best_p95,
+            "best_handshake": self.best_handshake,
+            "error_rate":     self.last_error_rate,
+            "last_reason":    self.last_reason,
+        }
@@ -8,24 +8,53 @@ brightdata/browser_api.py
 A high-level façade over BrowserapiEngine with three concurrency strategies:
   • noop      → spin up & tear down a session per URL
   • semaphore → same, but limit # concurrent sessions
-  • pool      → keep a pool of long-lived sessions and reuse them
+  • pool      → check long-lived sessions out of a `BrowserPool` (one
+                caller per browser at a time, recycled after N pages)
 
 All engine-level options (resource blocking, hydration‐selector waits) are
 exposed here and automatically forwarded down to BrowserapiEngine.fetch().
+
+`context_affinity=True` (pool strategy only) keeps one browser context per
+root domain on every pooled browser and reuses its tab, so a same-site batch
+keeps cookies, HTTP cache and connections instead of starting cold per URL.
+
+`profile` picks a named interception profile ("default", "no-media",
+"no-third-party", "html-only", "none" – see `interception.PROFILES`), applied
+the same way in every strategy.  Each result reports the bytes actually
+transferred, and the cost is computed from them.
+
+`readiness=True` (or a configured `ReadinessEngine`) captures the HTML as
+soon as the page is usable per domain rule – see `readiness.py`.
+
+`autotune=True` (semaphore / pool strategies) lets an AIMD controller move
+the concurrency limit at runtime from navigation latency, CDP handshake time
+and error rate – see `autotune.py`; `pool_size` / `max_concurrent` are then
+the starting point.
+
+`prewarm=N` (noop / semaphore) keeps N connected sessions ready and opens
+more ahead of the queue of pending fetches (`warmer.SessionWarmer`); the
+pool strategy gets the same queue-depth hint through `BrowserPool.expect`.
+All sessions of an event loop share one Playwright driver (`driver.py`).
+
+Warmed sessions and pooled browsers hold the driver of the loop that opened
+them, so the warmer and an owned pool are kept per event loop as well.  The
+blocking `fetch()` runs on a private loop and closes that loop's warmer /
+pool before it returns; call `close()` when done with the async API.
 """
 
 import asyncio
 import logging
 import time
 from datetime import datetime
-from typing import Literal, Optional, List, Tuple
-
-# suppress filelock/tldextract noise
-logging.getLogger("filelock").setLevel(logging.WARNING)
-logging.getLogger("tldextract").setLevel(logging.WARNING)
+from typing import Dict, Literal, Optional, List, Tuple, Union
 
-import tldextract
+from ..utils.domains import root_domain
 from .browserapi_engine import BrowserapiEngine
+from .browser_pool import BrowserPool
+from .interception import InterceptionProfile, TransferMeter, resolve_profile
+from .readiness import ReadinessEngine
+from .autotune import AIMDController, ResizableLimiter
+from .warmer import SessionWarmer
 from ..models import ScrapeResult
 
 logger = logging.getLogger(__name__)
@@ -41,39 +70,73 @@ class BrowserAPI:
         strategy: Literal["noop", "semaphore", "pool"] = "noop",
         pool_size: int = 5,
         max_concurrent: Optional[int] = None,
+        pool: Optional[BrowserPool] = None,
         # engine-level defaults:
         block_patterns: Optional[List[str]] = None,
         enable_wait_for_selector: bool = False,
         wait_for_selector_timeout: int = 15_000,
+        context_affinity: bool = False,
+        profile: Union[InterceptionProfile, str, None] = None,
+        readiness: Union[ReadinessEngine, bool, None] = None,
+        autotune: Union[AIMDController, bool] = False,
+        prewarm: int = 0,
     ):
         self.strategy = strategy
         self.pool_size = pool_size
         self._max_concurrent = max_concurrent or pool_size
 
+        # concurrency auto-tuning (semaphore / pool only)
+        if autotune and strategy not in ("semaphore", "pool"):
+            raise ValueError("autotune needs the 'semaphore' or 'pool' strategy")
+        if autotune is True:
+            start = self._max_concurrent if strategy == "semaphore" else (pool.size if pool else pool_size)
+            autotune = AIMDController(initial=start)
+        self.tuner: Optional[AIMDController] = autotune or None
+
         if strategy == "semaphore":
-            self._sem = asyncio.Semaphore(self._max_concurrent)
+            self._sem = (
+                ResizableLimiter(self.tuner.limit) if self.tuner
+                else asyncio.Semaphore(self._max_concurrent)
+            )
+
+        # for pool strategy – a pool passed in belongs to the caller (and to
+        # the loop it is first used on); our own pools are one per loop
+        self._pool: Optional[BrowserPool] = pool
+        self._pool_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._owns_pool = pool is None
+        self._pools: Dict[asyncio.AbstractEventLoop, BrowserPool] = {}
+        if pool is not None and self.tuner:
+            pool.on_connect = self.tuner.record_handshake
 
-        # for pool strategy
-        self._sessions: List[BrowserapiEngine] = []
-        self._rr_idx = 0
+        # connected-ahead sessions for the per-URL strategies, one warmer per loop
+        self._prewarm = prewarm if strategy != "pool" else 0
+        self._warmers: Dict[asyncio.AbstractEventLoop, SessionWarmer] = {}
+        self._active = 0                 # fetch_async calls in progress (queue depth)
 
         # engine defaults
         self._block_patterns = block_patterns
         self._enable_wait_for_selector = enable_wait_for_selector
         self._wait_for_selector_timeout = wait_for_selector_timeout
+        self._context_affinity = context_affinity
+        self._profile = resolve_profile(profile, block_patterns)   # fail fast on a bad name
+        self.readiness: Optional[ReadinessEngine] = (
+            ReadinessEngine() if readiness is True else (readiness or None)
+        )
 
         # usage tracking
         self.total_bytes = 0
         self.total_cost = 0.0
 
     def _extract_root(self, url: str) -> Optional[str]:
-        e = tldextract.extract(url)
-        return e.domain or None
+        return root_domain(url)
 
     def calculate_cost(self, raw_html: str) -> float:
         byte_count = len(raw_html.encode("utf-8"))
         return byte_count / self.GIB * self.COST_PER_GIB
 
+    def bytes_cost(self, byte_count: int) -> float:
+        return byte_count / self.GIB * self.COST_PER_GIB
+
     async def _fetch_isolated(
         self,
         url: str,
@@ -82,28 +145,36 @@ class BrowserAPI:
         timeout: int,
         headless: bool,
         window_size: Tuple[int, int],
+        meter: Optional[TransferMeter] = None,
     ) -> Tuple[str, float]:
-        return await BrowserapiEngine.fetch(
-            url=url,
-            wait_until=wait_until,
-            timeout=timeout,
-            headless=headless,
-            window_size=window_size,
-            block_patterns=self._block_patterns,
-            enable_wait_for_selector=self._enable_wait_for_selector,
-            wait_for_selector_timeout=self._wait_for_selector_timeout,
-        )
-
-    async def _ensure_pool(self) -> None:
-        while len(self._sessions) < self.pool_size:
-            try:
-                sess = await BrowserapiEngine.create()     # may raise
-            except ConnectionError as e:
-                logger.error("Browser-API pool(might be due to cdp connection failed): %s", e)
-                break                     # leave the session list as-is (maybe empty)
+        # BrowserapiEngine.fetch, with the CDP handshake timed for the tuner
+        # (or skipped altogether when the warmer had a session ready)
+        warmer = self._loop_warmer()
+        if warmer is not None:
+            session = await warmer.take()
+        else:
+            t0 = time.monotonic()
+            session = await BrowserapiEngine.create()
+            if self.tuner:
+                self.tuner.record_handshake(time.monotonic() - t0)
+        try:
+            return await session.fetch_page(
+                url,
+                wait_until=wait_until,
+                timeout=timeout,
+                headless=headless,
+                window_size=window_size,
+                enable_wait_for_selector=self._enable_wait_for_selector,
+                wait_for_selector_timeout=self._wait_for_selector_timeout,
+                profile=self._profile,
+                meter=meter,
+                readiness=self.readiness,
+            )
+        finally:
+            if warmer is not None:
+                warmer.discard(session)             # closed off the fetch path
             else:
-                self._sessions.append(sess)
-
+                await session.close()
 
     async def _fetch_from_pool(
         self,
@@ -113,18 +184,24 @@ class BrowserAPI:
         timeout: int,
         headless: bool,
         window_size: Tuple[int, int],
+        meter: Optional[TransferMeter] = None,
     ) -> Tuple[str, float]:
-        await self._ensure_pool()
-        sess = self._sessions[self._rr_idx % len(self._sessions)]
-        self._rr_idx += 1
-
-        page = await sess.new_page(headless=headless, window_size=window_size)
-        t0 = time.time()
-        await page.goto(url, timeout=timeout, wait_until=wait_until)
-        elapsed = time.time() - t0
-        html = await page.content()
-        await page.context.close()
-        return html, elapsed
+        pool = self._loop_pool(create=True)
+        affinity = self._extract_root(url) if self._context_affinity else None
+        async with pool.checkout(affinity=affinity) as browser:   # exclusive use
+            return await browser.fetch_page(
+                url,
+                wait_until=wait_until,
+                timeout=timeout,
+                headless=headless,
+                window_size=window_size,
+                enable_wait_for_selector=self._enable_wait_for_selector,
+                wait_for_selector_timeout=self._wait_for_selector_timeout,
+                reuse_context=self._context_affinity,
+                profile=self._profile,
+                meter=meter,
+                readiness=self.readiness,
+            )
 
     async def _do_strategy_fetch(
         self,
@@ -134,6 +211,7 @@ class BrowserAPI:
         timeout: int,
         headless: bool,
         window_size: Tuple[int, int],
+        meter: Optional[TransferMeter] = None,
     ) -> Tuple[str, float]:
         if self.strategy == "noop":
             return await self._fetch_isolated(
@@ -142,6 +220,7 @@ class BrowserAPI:
                 timeout=timeout,
                 headless=headless,
                 window_size=window_size,
+                meter=meter,
             )
         elif self.strategy == "semaphore":
             async with self._sem:
@@ -151,6 +230,7 @@ class BrowserAPI:
                     timeout=timeout,
                     headless=headless,
                     window_size=window_size,
+                    meter=meter,
                 )
         elif self.strategy == "pool":
             return await self._fetch_from_pool(
@@ -159,6 +239,7 @@ class BrowserAPI:
                 timeout=timeout,
                 headless=headless,
                 window_size=window_size,
+                meter=meter,
             )
         else:
             raise ValueError(f"Unknown strategy {self.strategy!r}")
@@ -174,6 +255,10 @@ class BrowserAPI:
     ) -> ScrapeResult:
         
         request_sent_at = datetime.utcnow()
+        meter = TransferMeter()
+        saturated = self._saturated() if self.tuner else False
+        self._active += 1
+        self._hint_demand()
         try:
             html, elapsed = await self._do_strategy_fetch(
                 url=url,
@@ -181,13 +266,18 @@ class BrowserAPI:
                 timeout=timeout,
                 headless=headless,
                 window_size=window_size,
+                meter=meter,
             )
 
             data_received_at = datetime.utcnow()
 
-            cost = self.calculate_cost(html)
-            self.total_bytes += len(html.encode("utf-8"))
+            # wire bytes when CDP reported them, else the HTML as a floor
+            transferred = meter.bytes if meter.bytes is not None else len(html.encode("utf-8"))
+            cost = self.bytes_cost(transferred)
+            self.total_bytes += transferred
             self.total_cost += cost
+            if self.tuner:
+                await self._apply_limit(self.tuner.record(elapsed, True, saturated=saturated))
             
             return ScrapeResult(
                 success=True,
@@ -202,9 +292,13 @@ class BrowserAPI:
                 event_loop_id=id(asyncio.get_running_loop()),
                 browser_warmed_at=None,
                 html_char_size= len(html),
+                bytes_transferred=transferred,
+                requests_blocked=meter.blocked,
             )
         except Exception as e:
             logger.error("fetch_async failed for %s: %s", url, e)
+            if self.tuner:
+                await self._apply_limit(self.tuner.record(None, False, saturated=saturated))
             return ScrapeResult(
                 success=False,
                 url=url,
@@ -217,6 +311,9 @@ class BrowserAPI:
                 data_received_at=None,
                 event_loop_id=id(asyncio.get_running_loop()),
             )
+        finally:
+            self._active -= 1
+            self._hint_demand()
 
     def fetch(
         self,
@@ -227,27 +324,122 @@ class BrowserAPI:
         headless: bool = True,
         window_size: Tuple[int, int] = (1920, 1080),
     ) -> ScrapeResult:
-        return asyncio.run(
-            self.fetch_async(
-                url=url,
-                wait_until=wait_until,
-                timeout=timeout,
-                headless=headless,
-                window_size=window_size,
+        """
+        Blocking `fetch_async` on a private event loop.  The loop's warmed
+        sessions / pooled browsers cannot outlive it, so they are closed
+        before returning – a caller-supplied pool is bound to its own loop
+        and cannot be used here.
+        """
+        if not self._owns_pool:
+            raise RuntimeError(
+                "a BrowserPool passed to BrowserAPI is bound to its event loop – "
+                "use fetch_async() on that loop"
             )
-        )
-
-    async def close(self) -> None:
-        if self.strategy == "pool" and self._sessions:
-            await asyncio.gather(*(sess.close() for sess in self._sessions))
-            self._sessions.clear()
 
-    def __del__(self):
-        if self.strategy == "pool" and self._sessions:
+        async def _once() -> ScrapeResult:
             try:
-                asyncio.run(self.close())
-            except Exception:
-                pass
+                return await self.fetch_async(
+                    url=url,
+                    wait_until=wait_until,
+                    timeout=timeout,
+                    headless=headless,
+                    window_size=window_size,
+                )
+            finally:
+                await self._close_loop(asyncio.get_running_loop())
+
+        return asyncio.run(_once())
+
+    # ------------------------------------------------------------------
+    # loop-bound state (warmer / pool) – keyed like driver.get_driver()
+    # ------------------------------------------------------------------
+    def _loop_warmer(self) -> Optional[SessionWarmer]:
+        if not self._prewarm:
+            return None
+        loop = asyncio.get_running_loop()
+        warmer = self._warmers.get(loop)
+        if warmer is None:
+            warmer = self._warmers[loop] = SessionWarmer(
+                target=self._prewarm,
+                max_ready=max(self._prewarm, 2 * self._max_concurrent),   # one in use, one connecting
+                on_connect=self.tuner.record_handshake if self.tuner else None,
+            )
+        return warmer
+
+    def _loop_pool(self, *, create: bool = False) -> Optional[BrowserPool]:
+        loop = asyncio.get_running_loop()
+        if not self._owns_pool:
+            if self._pool_loop is None:
+                self._pool_loop = loop
+            elif self._pool_loop is not loop:
+                raise RuntimeError("the BrowserPool passed to BrowserAPI belongs to another event loop")
+            return self._pool
+        pool = self._pools.get(loop)
+        if pool is None and create:
+            pool = self._pools[loop] = BrowserPool(
+                size=self.tuner.limit if self.tuner else self.pool_size
+            )
+            if self.tuner:
+                pool.on_connect = self.tuner.record_handshake
+        return pool
+
+    async def _close_loop(self, loop: asyncio.AbstractEventLoop) -> None:
+        """Close the warmer and owned pool of *loop* (must be the running loop)."""
+        warmer = self._warmers.pop(loop, None)
+        if warmer is not None:
+            await warmer.close()
+        pool = self._pools.pop(loop, None)
+        if pool is not None:
+            await pool.close()
+
+    # ------------------------------------------------------------------
+    # auto-tuning
+    # ------------------------------------------------------------------
+    def _saturated(self) -> bool:
+        """True if this fetch will have to wait for a permit / browser."""
+        if self.strategy == "semaphore":
+            return self._sem.saturated()
+        pool = self._loop_pool()
+        if pool is None:
+            return False
+        stats = pool.stats()
+        return stats["waiting"] > 0 or (stats["idle"] == 0 and stats["live"] >= pool.size)
+
+    def _hint_demand(self) -> None:
+        """Pass the number of fetches in progress on as a connect-ahead hint."""
+        warmer = self._loop_warmer()
+        if warmer is not None:
+            warmer.expect(self._active)
+        elif self.strategy == "pool":
+            pool = self._loop_pool()
+            if pool is not None:
+                pool.expect(self._active)
+
+    async def _apply_limit(self, limit: Optional[int]) -> None:
+        if limit is None:
+            return
+        if self.strategy == "semaphore":
+            self._sem.set_limit(limit)
+        else:
+            pool = self._loop_pool()
+            if pool is not None:
+                await pool.resize(limit)
+
+    async def close(self) -> None:
+        """
+        Close the warmer and owned pool of the running loop; those of other
+        loops still running are closed on their own loop.  A caller-supplied
+        pool is left to the caller.
+        """
+        loop = asyncio.get_running_loop()
+        for other in set(self._warmers) | set(self._pools):
+            if other is loop:
+                await self._close_loop(loop)
+            elif not other.is_closed() and other.is_running():
+                asyncio.run_coroutine_threadsafe(self._close_loop(other), other)
+            else:                                   # loop gone – nothing left to await
+                self._warmers.pop(other, None)
+                self._pools.pop(other, None)
 
 
 # ─── Demo / smoke-test ──────────────────────────────────────────
@@ -8,14 +8,7 @@ from datetime import datetime
 from typing import Literal, Optional, List, Tuple
 
 
-import logging
-
-# suppress filelock chatter
-logging.getLogger("filelock").setLevel(logging.WARNING)
-# optionally mute tldextract’s own logs too
-logging.getLogger("tldextract").setLevel(logging.WARNING)
-
-import tldextract
+from brightdata.utils.domains import root_domain
 from isolated_playwright_session import IsolatedPlaywrightSession
 
 logger = logging.getLogger(__name__)
@@ -74,8 +67,7 @@ class NewBrowserAPI:
         self.total_cost  = 0.0
 
     def _extract_root(self, url: str) -> Optional[str]:
-        e = tldextract.extract(url)
-        return e.domain or None
+        return root_domain(url)
 
     def calculate_cost(self, raw_html: str) -> float:
         byte_count = len(raw_html.encode("utf-8"))
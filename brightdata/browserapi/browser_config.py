@@ -1,14 +1,14 @@
 # browser_config.py  (optional helper module)
 
 from __future__ import annotations
-import os
+from brightdata.utils.env import getenv
 from dataclasses import dataclass, field
 from typing import Tuple, Optional
 
 
 def _env(name: str, default: str | int | bool):
     """Helper – fetch env-var, fall back to default and proper-cast."""
-    raw = os.getenv(name)
+    raw = getenv(name)
     if raw is None:
         return default
     if isinstance(default, bool):
@@ -21,11 +21,11 @@ def _env(name: str, default: str | int | bool):
 @dataclass(slots=True)
 class BrowserConfig:
     # ─── Bright-Data credentials ──────────────────────────────────────
-    username: str = field(default_factory=lambda: os.getenv("BRIGHTDATA_BROWSERAPI_USERNAME", ""))
-    password: str = field(default_factory=lambda: os.getenv("BRIGHTDATA_BROWSERAPI_PASSWORD", ""))
+    username: str = field(default_factory=lambda: getenv("BRIGHTDATA_BROWSERAPI_USERNAME", ""))
+    password: str = field(default_factory=lambda: getenv("BRIGHTDATA_BROWSERAPI_PASSWORD", ""))
     
-    host: str = _env("BROWSERAPI_HOST", "brd.superproxy.io")
-    port: int = _env("BROWSERAPI_PORT", 9222)
+    host: str = field(default_factory=lambda: _env("BROWSERAPI_HOST", "brd.superproxy.io"))
+    port: int = field(default_factory=lambda: _env("BROWSERAPI_PORT", 9222))
 
     # ─── Playwright / navigation knobs ────────────────────────────────
     headless: bool = _env("BROWSERAPI_HEADLESS", True)
@@ -1,74 +1,389 @@
 # brightdata/browser_pool.py
 # -------------------------
-# A lightweight async pool that re-uses a *small* set of BrowserAPI
-# (Playwright-based) connections instead of opening a new Chrome
-# session for every URL.  Meant for fallback jobs inside
-# brightdata.auto.scrape_urls_async.
+# A pool of live Browser-API (CDP) sessions with exclusive checkout.
+#
+# Every session is one remote Chrome behind one CDP websocket; the
+# handshake is paid once per browser lifetime instead of once per URL.
+#
+#     async with BrowserPool(size=4, spares=1) as pool:
+#         async with pool.checkout() as browser:         # exclusive
+#             html, took = await browser.fetch_page(url)
+#         res = await pool.fetch_async(url)              # → ScrapeResult
+#
+# ► checkout is exclusive: one caller per browser at a time
+# ► callers beyond *size* wait in a bounded queue (*max_waiters*) for at
+#   most *acquire_timeout* seconds
+# ► a browser whose CDP link dropped (`Browser.is_connected()`) is thrown
+#   away at checkout / checkin and replaced
+# ► after *max_pages_per_browser* pages a browser is recycled
+# ► *spares* idle, already-connected browsers are kept warm
+# ► ``expect(n)`` – n checkouts are running or queued: idle browsers are
+#   connected speculatively for the part of them not yet holding one
+# ► ``checkout(affinity=root_domain)`` prefers an idle browser that already
+#   holds a warm context for that site (see `BrowserAPI(context_affinity=True)`)
 
 from __future__ import annotations
+
 import asyncio
-from typing import List
+import logging
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Awaitable, Callable, Deque, Dict, Optional, Set, Tuple
+
+from .browser_config import BrowserConfig
+from .browserapi_engine import BrowserapiEngine
+
+logger = logging.getLogger(__name__)
+
+
+class PooledBrowser:
+    """One checked-out browser; hand it back with `BrowserPool.release`."""
 
-from .browser_api import BrowserAPI
+    __slots__ = ("session", "pages", "created_at", "last_used", "_reported")
+
+    def __init__(self, session: BrowserapiEngine):
+        self.session    = session
+        self.pages      = 0
+        self._reported  = 0                # pages already added to the pool total
+        self.created_at = time.monotonic()
+        self.last_used  = self.created_at
+
+    def is_connected(self) -> bool:
+        return self.session.is_connected()
+
+    async def new_page(self, **kw: Any):
+        self.pages += 1
+        return await self.session.new_page(**kw)
+
+    async def fetch_page(self, url: str, **kw: Any) -> Tuple[str, float]:
+        """`BrowserapiEngine.fetch_page` on this browser (counted for recycling)."""
+        self.pages += 1
+        return await self.session.fetch_page(url, **kw)
 
 
 class BrowserPool:
     """
-    Async, round-robin pool.
+    Async checkout / checkin pool of Browser-API sessions.
 
     Parameters
     ----------
     size : int, default 8
-        Maximum number of concurrent BrowserAPI objects (and therefore
-        remote Chrome instances on Bright Data) that will ever exist.
+        Maximum number of live browsers (remote Chrome instances on Bright
+        Data) that will ever exist at once.
+    spares : int, default 1
+        Idle, already-connected browsers kept ready for the next checkout.
+    max_pages_per_browser : int, optional
+        Recycle a browser after this many pages
+        (default `BrowserConfig.max_pages_per_browser`).
+    acquire_timeout : float, default 120
+        Seconds a checkout may wait for a free browser.
+    max_waiters : int, optional
+        Bound of the wait queue; further checkouts fail fast with
+        RuntimeError (default: unbounded).
     browser_kwargs : dict, optional
-        Extra keyword arguments forwarded to `BrowserAPI(**kwargs)`.
-        Example: ``BrowserPool(size=6, browser_kwargs=dict(load_state="networkidle"))``
+        Keyword arguments forwarded to `BrowserAPI(**kwargs)` by
+        `fetch_async` (block patterns, hydration wait …).
+    session_factory : async callable, optional
+        Creates one session (default `BrowserapiEngine.create`).
     """
 
-    def __init__(self, *, size: int = 8, browser_kwargs: dict | None = None) -> None:
+    def __init__(
+        self,
+        *,
+        size: int = 8,
+        spares: int = 1,
+        max_pages_per_browser: Optional[int] = None,
+        acquire_timeout: float = 120.0,
+        max_waiters: Optional[int] = None,
+        browser_kwargs: dict | None = None,
+        session_factory: Optional[Callable[[], Awaitable[BrowserapiEngine]]] = None,
+    ) -> None:
         if size < 1:
             raise ValueError("size must be ≥ 1")
         self._size = size
+        self.spares = min(max(0, spares), size)
+        self.max_pages_per_browser = max_pages_per_browser or BrowserConfig().max_pages_per_browser
+        self.acquire_timeout = acquire_timeout
+        self.max_waiters = max_waiters
         self._browser_kwargs = browser_kwargs or {}
+        self._factory = session_factory or BrowserapiEngine.create
+
+        self._idle: Deque[PooledBrowser] = deque()
+        self._live: Set[PooledBrowser] = set()
+        self._creating = 0
+        self._waiting = 0
+        self._demand = 0                      # expect(n) hint
+        self._cond: Optional[asyncio.Condition] = None
+        self._background: Set[asyncio.Task] = set()
+        self._closed = False
+        self._api = None                      # BrowserAPI bound to this pool
+        self.on_connect: Optional[Callable[[float], None]] = None   # handshake seconds
+        # counters
+        self.created  = 0
+        self.recycled = 0
+        self.broken   = 0
+        self.pages    = 0
+
+    @property
+    def size(self) -> int:
+        return self._size
+
+    async def resize(self, size: int) -> None:
+        """
+        Change the browser cap at runtime: growing lets waiters create
+        browsers now, shrinking closes idle ones and retires busy ones as
+        they are checked back in.
+        """
+        if size < 1:
+            raise ValueError("size must be ≥ 1")
+        cond = self._condition()
+        async with cond:
+            self._size = size
+            while self._idle and len(self._live) > size:
+                self._retire(self._idle.popleft())
+            self._refill()
+            cond.notify_all()
+
+    # ------------------------------------------------------------------
+    # checkout / checkin
+    # ------------------------------------------------------------------
+    async def acquire(
+        self,
+        *,
+        timeout: Optional[float] = None,
+        affinity: Optional[str] = None,
+    ) -> PooledBrowser:
+        """
+        Check out a browser for exclusive use; **must** be followed by
+        `release` (prefer `checkout()`).  With *affinity* (a root domain)
+        an idle browser already holding a context for it is taken first.
+        """
+        if self._closed:
+            raise RuntimeError("BrowserPool is closed")
+        cond = self._condition()
+        timeout = self.acquire_timeout if timeout is None else timeout
+        deadline = time.monotonic() + timeout
+
+        async with cond:
+            while True:
+                if self._closed:                        # closed while we waited
+                    raise RuntimeError("BrowserPool is closed")
+                if affinity is not None:
+                    for browser in self._idle:
+                        if browser.session.holds_context(affinity) and browser.is_connected():
+                            self._idle.remove(browser)
+                            browser.last_used = time.monotonic()
+                            self._refill()
+                            return browser
+                while self._idle:
+                    browser = self._idle.popleft()
+                    if browser.is_connected():
+                        browser.last_used = time.monotonic()
+                        self._refill()
+                        return browser
+                    self._retire(browser, broken=True)
+
+                if len(self._live) + self._creating < self._size:
+                    self._creating += 1
+                    break                                   # create below, unlocked
 
-        self._apis: List[BrowserAPI] = []
-        self._lock = asyncio.Lock()        # protects _apis list
-        self._idx = 0                      # for round-robin selection
+                if self.max_waiters is not None and self._waiting >= self.max_waiters:
+                    raise RuntimeError(
+                        f"BrowserPool wait queue is full ({self.max_waiters} waiting)"
+                    )
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise asyncio.TimeoutError(f"no free browser within {timeout:g}s")
+                self._waiting += 1
+                try:
+                    await asyncio.wait_for(cond.wait(), remaining)
+                except asyncio.TimeoutError:
+                    raise asyncio.TimeoutError(f"no free browser within {timeout:g}s") from None
+                finally:
+                    self._waiting -= 1
+
+        browser = await self._connect()
+        browser.last_used = time.monotonic()
+        return browser
+
+    async def release(self, browser: PooledBrowser, *, broken: bool = False) -> None:
+        """Check *browser* back in – recycled if spent, dropped if disconnected."""
+        cond = self._condition()
+        async with cond:
+            self.pages += browser.pages - browser._reported
+            browser._reported = browser.pages
+            if self._closed:
+                self._retire(browser)
+            elif broken or not browser.is_connected():
+                self._retire(browser, broken=True)
+            elif browser.pages >= self.max_pages_per_browser:
+                self.recycled += 1
+                self._retire(browser)
+            elif len(self._live) > self._size:          # pool was shrunk
+                self._retire(browser)
+            else:
+                self._idle.append(browser)
+            self._refill()
+            cond.notify()
+
+    @asynccontextmanager
+    async def checkout(
+        self,
+        *,
+        timeout: Optional[float] = None,
+        affinity: Optional[str] = None,
+    ) -> AsyncIterator[PooledBrowser]:
+        """``async with pool.checkout() as browser:`` – exclusive for the block."""
+        browser = await self.acquire(timeout=timeout, affinity=affinity)
+        try:
+            yield browser
+        finally:
+            await self.release(browser)
 
     # ------------------------------------------------------------------
-    # internal helper – lazily create BrowserAPI objects until _size
+    # convenience: fetch one URL through a pooled browser
     # ------------------------------------------------------------------
-    async def _ensure_pool(self) -> None:
-        async with self._lock:
-            while len(self._apis) < self._size:
-                self._apis.append(BrowserAPI(**self._browser_kwargs))
+    async def fetch_async(self, url: str, **kw: Any):
+        """`BrowserAPI.fetch_async` served from this pool → `ScrapeResult`."""
+        if self._api is None:
+            from .browser_api import BrowserAPI
+            self._api = BrowserAPI(strategy="pool", pool=self, **self._browser_kwargs)
+        return await self._api.fetch_async(url, **kw)
 
     # ------------------------------------------------------------------
-    # public: get a BrowserAPI handle (re-uses existing ones)
+    # warm spares
     # ------------------------------------------------------------------
-    async def acquire(self) -> BrowserAPI:
-        await self._ensure_pool()
-        api = self._apis[self._idx % self._size]
-        self._idx += 1
-        return api
+    def expect(self, n: int) -> None:
+        """*n* checkouts are running or queued – connect ahead for the rest."""
+        self._demand = max(0, n)
+        if self._cond is not None and not self._closed:
+            self._refill()
+
+    def _wanted_idle(self) -> int:
+        busy = len(self._live) - len(self._idle)
+        return max(self.spares, self._demand - busy)
+
+    async def warm(self, n: Optional[int] = None) -> int:
+        """Connect up to *n* (default: spares / expected demand) idle browsers now; returns how many."""
+        want = self._wanted_idle() if n is None else n
+        cond = self._condition()
+        async with cond:
+            if self._closed:                            # e.g. a refill queued before close()
+                return 0
+            room = min(want - len(self._idle) - self._creating,
+                       self._size - len(self._live) - self._creating)
+            room = max(0, room)
+            self._creating += room
+        results = await asyncio.gather(*(self._connect() for _ in range(room)), return_exceptions=True)
+        ok = 0
+        async with cond:
+            for r in results:
+                if isinstance(r, PooledBrowser):
+                    if self._closed:
+                        self._retire(r)
+                        continue
+                    self._idle.append(r)
+                    ok += 1
+                else:
+                    logger.warning("BrowserPool: warm-up connect failed: %s", r)
+            cond.notify(ok)
+        return ok
+
+    def _refill(self) -> None:
+        """Top the idle spares up in the background (called with the lock held)."""
+        if self._closed or len(self._idle) + self._creating >= self._wanted_idle():
+            return
+        if len(self._live) + self._creating >= self._size:
+            return
+        task = asyncio.ensure_future(self.warm())
+        self._background.add(task)
+        task.add_done_callback(self._background.discard)
+
+    # ------------------------------------------------------------------
+    # internals
+    # ------------------------------------------------------------------
+    def _condition(self) -> asyncio.Condition:
+        if self._cond is None:
+            self._cond = asyncio.Condition()
+        return self._cond
+
+    async def _connect(self) -> PooledBrowser:
+        """Open one CDP session; the caller already counted it in `_creating`."""
+        cond = self._condition()
+        t0 = time.monotonic()
+        try:
+            session = await self._factory()
+        except BaseException:
+            async with cond:
+                self._creating -= 1
+                cond.notify()
+            raise
+        if self.on_connect is not None:
+            self.on_connect(time.monotonic() - t0)
+        browser = PooledBrowser(session)
+        async with cond:
+            self._creating -= 1
+            self._live.add(browser)
+            self.created += 1
+        return browser
+
+    def _retire(self, browser: PooledBrowser, *, broken: bool = False) -> None:
+        """Forget *browser* and close it in the background (lock held)."""
+        self._live.discard(browser)
+        if broken:
+            self.broken += 1
+        task = asyncio.ensure_future(self._close_quietly(browser))
+        self._background.add(task)
+        task.add_done_callback(self._background.discard)
+
+    @staticmethod
+    async def _close_quietly(browser: PooledBrowser) -> None:
+        try:
+            await browser.session.close()
+        except Exception as e:                  # already gone server-side
+            logger.debug("BrowserPool: close failed: %s", e)
+
+    # ------------------------------------------------------------------
+    # reporting
+    # ------------------------------------------------------------------
+    def stats(self) -> Dict[str, int]:
+        return {
+            "size":     self._size,
+            "live":     len(self._live),
+            "idle":     len(self._idle),
+            "busy":     len(self._live) - len(self._idle),
+            "waiting":  self._waiting,
+            "created":  self.created,
+            "recycled": self.recycled,
+            "broken":   self.broken,
+            "pages":    self.pages,
+        }
 
     # ------------------------------------------------------------------
     # clean-up: close every Playwright connection gracefully
     # ------------------------------------------------------------------
     async def close(self) -> None:
-        if not self._apis:
-            return
-        await asyncio.gather(*(api.close() for api in self._apis))
-        self._apis.clear()
+        self._closed = True
+        cond = self._condition()
+        async with cond:
+            idle = list(self._idle)
+            self._idle.clear()
+            for browser in idle:
+                self._retire(browser)
+            cond.notify_all()
+        # checked-out browsers are closed when they are released; a warm-up
+        # finishing meanwhile retires its browsers in new tasks – wait for those too
+        while self._background:
+            await asyncio.gather(*list(self._background), return_exceptions=True)
 
     # ------------------------------------------------------------------
     # async context-manager convenience
     # ------------------------------------------------------------------
     async def __aenter__(self) -> "BrowserPool":
+        await self.warm()
         return self
 
     async def __aexit__(self, exc_type, exc, tb) -> bool:
         await self.close()
         return False          # propagate any exception
-
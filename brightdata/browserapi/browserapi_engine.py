@@ -11,21 +11,29 @@ A per-instance PlaywrightSession: each .create() makes a fresh CDP connection,
 and .close() tears it down.  No global singleton.
 """
 
-import os
 import asyncio
 import logging
+import random
 import time
+from collections import OrderedDict
 from datetime import datetime
-from dotenv import load_dotenv
 from playwright.async_api import async_playwright, Browser, Page
-from typing import Optional, Tuple, List
-from playwright.async_api import async_playwright, Browser, Page, TimeoutError as PWTimeoutError
+from typing import Optional, Tuple, List, Union
+
+from brightdata.utils.domains import root_domain, split_host
+from brightdata.utils.env import getenv
+from brightdata.browserapi.interception import (
+    Interceptor, InterceptionProfile, TransferMeter, resolve_profile,
+)
+from brightdata.browserapi.readiness import ReadinessEngine
+from brightdata.browserapi.driver import get_driver
+from playwright.async_api import async_playwright, Browser, BrowserContext, Page, TimeoutError as PWTimeoutError
 
-load_dotenv()
 logger = logging.getLogger(__name__)
 
 
 # BrowserAPI_IsolatedPlaywrightSession
+# (kept for callers; the engine itself now blocks via PROFILES["default"])
 DEFAULT_BLOCK_PATTERNS: List[str] = [
     "**/*.{png,jpg,jpeg,gif,webp,svg,woff,woff2,ttf,otf,css,mp4,webm}"
 ]
@@ -41,6 +49,22 @@ DEFAULT_HYDRATION_SELECTORS: List[str] = [
     "body > *:not(script)",
 ]
 
+# context-affinity mode: at most this many warm contexts per browser
+DEFAULT_MAX_AFFINE_CONTEXTS: int = 8
+
+
+class _AffineContext:
+    """One kept-alive context (cookies, cache, connections) for a root domain."""
+
+    __slots__ = ("domain", "context", "interceptor", "tab", "busy")
+
+    def __init__(self, domain: str, context: BrowserContext, interceptor: Interceptor):
+        self.domain  = domain
+        self.context = context
+        self.interceptor = interceptor
+        self.tab: Optional[Page] = None     # parked on about:blank, ready to reuse
+        self.busy    = 0                    # navigations currently using it
+
 
 class BrowserapiEngine:
     """
@@ -53,14 +77,19 @@ class BrowserapiEngine:
     def __init__(self, pw_ctx, browser: Browser):
         self._pw_ctx = pw_ctx
         self._browser = browser
+        # context affinity: (root domain, blocking, viewport) → warm context, LRU order
+        self._affine: "OrderedDict[tuple, _AffineContext]" = OrderedDict()
+        # key → resolved once the context a fetch is opening for it exists
+        self._opening: "dict[tuple, asyncio.Future]" = {}
+        self.max_affine_contexts = DEFAULT_MAX_AFFINE_CONTEXTS
 
     @classmethod
     async def create(
         cls,
         username: str | None = None,
         password: str | None = None,
-        host: str = os.getenv("BROWSERAPI_HOST", "brd.superproxy.io"),
-        port: int = int(os.getenv("BROWSERAPI_PORT", 9222)),
+        host: str | None = None,
+        port: int | None = None,
         retry: int = 1                         
     
     ) -> "IsolatedPlaywrightSession":
@@ -70,12 +99,15 @@ class BrowserapiEngine:
 
         DEFAULT_CONNECT_TIMEOUT_MS = 30_000      
 
-        username = username or os.getenv("BRIGHTDATA_BROWSERAPI_USERNAME")
-        password = password or os.getenv("BRIGHTDATA_BROWSERAPI_PASSWORD")
+        host     = host or getenv("BROWSERAPI_HOST", "brd.superproxy.io")
+        port     = port or int(getenv("BROWSERAPI_PORT", "9222"))
+        username = username or getenv("BRIGHTDATA_BROWSERAPI_USERNAME")
+        password = password or getenv("BRIGHTDATA_BROWSERAPI_PASSWORD")
         if not (username and password):
             raise RuntimeError("Missing Browser-API credentials")
 
-        pw_ctx = await async_playwright().start()
+        # one Playwright driver per loop, shared by every session (driver.py)
+        pw_ctx = await get_driver().lease()
         ws_url = f"wss://{username}:{password}@{host}:{port}/"
 
 
@@ -86,9 +118,13 @@ class BrowserapiEngine:
                     ws_url
                 )
                 break                                # success
-            except PWTimeoutError as err:
+            except BaseException as err:
+                if not isinstance(err, PWTimeoutError):
+                    await pw_ctx.stop()
+                    raise
                 attempt += 1                         # count this failure first
                 if attempt > retry:                  # retries exhausted
+                    await pw_ctx.stop()
                     raise ConnectionError(
                         f"CDP handshake timed out after "
                         f"{DEFAULT_CONNECT_TIMEOUT_MS/1000:.0f}s "
@@ -103,7 +139,8 @@ class BrowserapiEngine:
                     "CDP handshake retry %d/%d after timeout (%s)",
                     attempt, retry, err
                 )
-                await asyncio.sleep(5.0)             # small back-off
+                # full-jitter back-off instead of a fixed 5 s
+                await asyncio.sleep(random.uniform(0, min(5.0, 0.5 * 2 ** attempt)))
 
         return cls(pw_ctx, browser)
 
@@ -128,7 +165,8 @@ class BrowserapiEngine:
 
     async def close(self) -> None:
         """
-        Tear down both the browser and the playwright driver.
+        Tear down the browser and give back the driver lease (the shared
+        driver stops with its last session).
         """
         if self._browser and self._browser.is_connected():
             await self._browser.close()
@@ -136,6 +174,181 @@ class BrowserapiEngine:
             await self._pw_ctx.stop()
         self._browser = None
         self._pw_ctx = None
+        self._affine.clear()                # contexts died with the browser
+
+    def is_connected(self) -> bool:
+        """True while the CDP connection to the remote browser is alive."""
+        return self._browser is not None and self._browser.is_connected()
+
+    def holds_context(self, domain: Optional[str]) -> bool:
+        """True if a warm affinity context for root *domain* is kept open."""
+        return any(a.domain == domain for a in self._affine.values())
+
+    # ------------------------------------------------------------------
+    # context affinity
+    # ------------------------------------------------------------------
+    async def _affine_page(
+        self,
+        url: str,
+        profile: InterceptionProfile,
+        window_size: Tuple[int, int],
+    ) -> Tuple[_AffineContext, Page]:
+        """
+        Tab for *url* in the warm context of its root domain – the parked
+        tab when free, else a new tab in the same context.  The interception
+        route lives on the context, so it is installed once.  Concurrent
+        fetches for a key wait for the one already opening its context.
+        """
+        domain = root_domain(url) or split_host(url)[0]
+        key = (domain, profile, tuple(window_size))
+        entry = self._affine.get(key)
+        while entry is None and key in self._opening:
+            await asyncio.shield(self._opening[key])
+            entry = self._affine.get(key)       # None if the opener failed
+        if entry is None:
+            opening = self._opening[key] = asyncio.get_running_loop().create_future()
+            try:
+                width, height = window_size
+                ctx = await self._browser.new_context(
+                    viewport={"width": width, "height": height},
+                    accept_downloads=False,
+                )
+                interceptor = Interceptor(profile, domain)
+                await interceptor.install(ctx)
+                entry = self._affine[key] = _AffineContext(domain, ctx, interceptor)
+                entry.busy += 1         # ours before anything can evict it
+            finally:
+                del self._opening[key]
+                opening.set_result(None)
+            await self._evict_affine(keep=key)
+        else:
+            self._affine.move_to_end(key)
+            entry.busy += 1
+        page, entry.tab = entry.tab, None
+        if page is None or page.is_closed():
+            try:
+                page = await entry.context.new_page()
+            except BaseException:
+                entry.busy -= 1
+                raise
+        return entry, page
+
+    async def _park(self, entry: _AffineContext, page: Page, ok: bool) -> None:
+        """Reset *page* to ``about:blank`` and keep it, or close it."""
+        entry.busy -= 1
+        if ok and entry.tab is None and not page.is_closed():
+            try:
+                await page.goto("about:blank")
+                entry.tab = page
+                return
+            except Exception as e:
+                logger.debug("about:blank reset failed, dropping tab: %s", e)
+        try:
+            await page.close()
+        except Exception:
+            pass
+
+    async def _evict_affine(self, keep: Optional[tuple] = None) -> None:
+        """
+        Close least-recently-used idle contexts above `max_affine_contexts`;
+        *keep* (the key being served) is never chosen.
+        """
+        excess = len(self._affine) - self.max_affine_contexts
+        idle = [k for k, a in self._affine.items() if a.busy == 0 and k != keep]
+        for key in idle[:max(0, excess)]:
+            entry = self._affine.pop(key)
+            try:
+                await entry.context.close()
+            except Exception as e:
+                logger.debug("closing affinity context for %s failed: %s", entry.domain, e)
+
+    async def fetch_page(
+        self,
+        url: str,
+        *,
+        wait_until: str = "domcontentloaded",
+        timeout: int = 75_000,
+        headless: bool = True,
+        window_size: Tuple[int, int] = (1920, 1080),
+        block_patterns: Optional[List[str]] = None,
+        enable_wait_for_selector: bool = False,
+        wait_for_selector_timeout: int = 15_000,   # ms
+        reuse_context: bool = False,
+        profile: Union[InterceptionProfile, str, None] = None,
+        meter: Optional[TransferMeter] = None,
+        readiness: Optional[ReadinessEngine] = None,
+    ) -> Tuple[str, float]:
+        """
+        Load *url* in a fresh incognito context of **this** browser and
+        return ``(html, elapsed)``; the context is always closed, the
+        browser stays connected for the next page.
+
+        With ``reuse_context=True`` (context affinity) the page is loaded in
+        a context kept open per root domain instead: cookies, HTTP cache and
+        connections survive between pages of the same site, and the tab is
+        reset to ``about:blank`` and reused for the next navigation.  At most
+        `max_affine_contexts` such contexts are kept (least recently used
+        are closed first).
+
+        Blocking follows *profile* (an `InterceptionProfile` or a name from
+        `PROFILES`); without one, *block_patterns* – or the ``"default"``
+        profile – apply.  Pass a `TransferMeter` as *meter* to get the bytes
+        transferred and the requests blocked for this page.
+
+        With a `ReadinessEngine` as *readiness* the HTML is captured as soon
+        as the domain's readiness rule holds (selector, text, DOM settle,
+        network quiet), replacing the fixed hydration-selector wait.
+        """
+        profile = resolve_profile(profile, block_patterns)
+        entry = None
+        if reuse_context:
+            entry, page = await self._affine_page(url, profile, window_size)
+            interceptor = entry.interceptor
+        else:
+            page = await self.new_page(headless=headless, window_size=window_size)
+            interceptor = None
+        ok = False
+        cdp = None
+        try:
+            # one route handler per context (affinity contexts already carry it)
+            if interceptor is None:
+                interceptor = Interceptor(profile, root_domain(url))
+                await interceptor.install(page.context)
+            if meter is not None:
+                interceptor.meter = meter
+                cdp = await meter.attach(page)
+
+            # navigate & measure
+            t0 = time.time()
+            await page.goto(url, timeout=timeout, wait_until=wait_until)
+
+            # 2) per-domain readiness, else the optional hydration‐selector wait
+            if readiness is not None:
+                await readiness.wait(page, url)
+            elif enable_wait_for_selector:
+                sel = ":is(" + ",".join(DEFAULT_HYDRATION_SELECTORS) + ")"
+                try:
+                    await page.wait_for_selector(sel, timeout=wait_for_selector_timeout)
+                except PWTimeoutError:
+                    logger.debug(
+                        "⚠ none of %r appeared within %dms on %s",
+                        DEFAULT_HYDRATION_SELECTORS, wait_for_selector_timeout, url
+                    )
+
+            elapsed = time.time() - t0
+
+            # capture HTML
+            html = await page.content()
+            ok = True
+            return html, elapsed
+        finally:
+            if meter is not None:
+                interceptor.meter = None
+                await meter.detach(cdp)
+            if entry is not None:
+                await self._park(entry, page, ok)
+            else:
+                await page.context.close()
 
     @classmethod
     async def fetch(
@@ -150,6 +363,9 @@ class BrowserapiEngine:
         block_patterns: Optional[List[str]] = None,
         enable_wait_for_selector: bool = False,
         wait_for_selector_timeout: int = 15_000,   # ms
+        profile: Union[InterceptionProfile, str, None] = None,
+        meter: Optional[TransferMeter] = None,
+        readiness: Optional[ReadinessEngine] = None,
     ) -> Tuple[str, float]:
         """
         Convenience helper: spin up a session, optionally block resources,
@@ -163,6 +379,9 @@ class BrowserapiEngine:
         headless : whether to run headless (always true on the remote side)
         window_size : viewport size
         block_patterns : list of glob patterns to abort (e.g. images/fonts)
+        profile : interception profile (name or object), wins over block_patterns
+        meter : optional TransferMeter filled with bytes / blocked counts
+        readiness : optional ReadinessEngine deciding when the page is usable
 
         Returns
         -------
@@ -173,39 +392,19 @@ class BrowserapiEngine:
         """
         session = await cls.create()
         try:
-            page = await session.new_page(headless=headless, window_size=window_size)
-
-            # set up resource blocking
-            patterns = block_patterns if block_patterns is not None else DEFAULT_BLOCK_PATTERNS
-            if patterns:
-                async def _block(route):
-                    await route.abort()
-                for pat in patterns:
-                    await page.route(pat, _block)
-
-            # navigate & measure
-            t0 = time.time()
-            await page.goto(url, timeout=timeout, wait_until=wait_until)
-
-            # 2) optional hydration‐selector wait
-            if enable_wait_for_selector:
-                sel = ":is(" + ",".join(DEFAULT_HYDRATION_SELECTORS) + ")"
-                try:
-                    await page.wait_for_selector(sel, timeout=wait_for_selector_timeout)
-                except PWTimeoutError:
-                    logger.debug(
-                        "⚠ none of %r appeared within %dms on %s",
-                        DEFAULT_HYDRATION_SELECTORS, wait_for_selector_timeout, url
-                    )
-
-
-            elapsed = time.time() - t0
-
-            # capture HTML
-            html = await page.content()
-            await page.context.close()
-            return html, elapsed
-
+            return await session.fetch_page(
+                url,
+                wait_until=wait_until,
+                timeout=timeout,
+                headless=headless,
+                window_size=window_size,
+                block_patterns=block_patterns,
+                enable_wait_for_selector=enable_wait_for_selector,
+                wait_for_selector_timeout=wait_for_selector_timeout,
+                profile=profile,
+                meter=meter,
+                readiness=readiness,
+            )
         finally:
             await session.close()
 
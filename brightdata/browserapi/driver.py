@@ -0,0 +1,107 @@
+# brightdata/browserapi/driver.py
+"""
+brightdata.browserapi.driver
+============================
+One Playwright driver per event loop, shared by every CDP session.
+
+``async_playwright().start()`` spawns a Node driver subprocess – about a
+second of cold start – and `BrowserapiEngine.create()` used to do that for
+**every** session next to the CDP handshake itself.  The driver only talks
+to the remote browsers, it does not care how many there are, so all
+sessions of a loop lease the same one:
+
+    lease = await get_driver().lease()      # starts the driver on first use
+    browser = await lease.chromium.connect_over_cdp(ws_url)
+    …
+    await lease.stop()                      # last lease out stops the driver
+
+A lease quacks like the object ``async_playwright().start()`` returns
+(``.chromium``, ``.stop()``), so the engine keeps holding it as
+``_pw_ctx``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Dict, Optional
+
+from playwright.async_api import Playwright, async_playwright
+
+
+class DriverLease:
+    """One session's share of the loop's Playwright driver."""
+
+    __slots__ = ("_driver", "_released")
+
+    def __init__(self, driver: "SharedDriver"):
+        self._driver = driver
+        self._released = False
+
+    @property
+    def chromium(self):
+        return self._driver.playwright.chromium
+
+    async def stop(self) -> None:
+        """Give the lease back (idempotent)."""
+        if not self._released:
+            self._released = True
+            await self._driver.release()
+
+
+class SharedDriver:
+    """Reference-counted Playwright driver of one event loop."""
+
+    def __init__(self, loop: asyncio.AbstractEventLoop) -> None:
+        self.loop = loop
+        self.playwright: Optional[Playwright] = None
+        self.users = 0
+        self.starts = 0                       # driver processes started so far
+        self._lock: Optional[asyncio.Lock] = None
+
+    def _guard(self) -> asyncio.Lock:
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        return self._lock
+
+    async def lease(self) -> DriverLease:
+        async with self._guard():
+            _DRIVERS.setdefault(self.loop, self)    # re-registers after a stop
+            try:
+                if self.playwright is None:
+                    self.playwright = await async_playwright().start()
+                    self.starts += 1
+            except BaseException:
+                self._forget()
+                raise
+            self.users += 1
+        return DriverLease(self)
+
+    async def release(self) -> None:
+        async with self._guard():
+            self.users -= 1
+            if self.users > 0:
+                return
+            self._forget()
+            if self.playwright is None:
+                return
+            playwright, self.playwright = self.playwright, None
+            await playwright.stop()
+
+    def _forget(self) -> None:
+        if self.users == 0 and _DRIVERS.get(self.loop) is self:
+            del _DRIVERS[self.loop]
+
+
+# a plain dict: the driver's lock and Playwright objects reference the loop,
+# so weak keys would never die – a driver removes itself once its last lease
+# is returned (or its start failed)
+_DRIVERS: Dict[asyncio.AbstractEventLoop, SharedDriver] = {}
+
+
+def get_driver() -> SharedDriver:
+    """The shared driver of the running loop."""
+    loop = asyncio.get_running_loop()
+    driver = _DRIVERS.get(loop)
+    if driver is None:
+        driver = _DRIVERS[loop] = SharedDriver(loop)
+    return driver
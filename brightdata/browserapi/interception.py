@@ -0,0 +1,249 @@
+# brightdata/browserapi/interception.py
+"""
+brightdata.browserapi.interception
+==================================
+Named request-interception profiles for the Browser API.
+
+Blocking used to mean one ``page.route`` per glob, installed per page.  A
+profile is applied with **one** route handler per browser context that
+decides in a single pass, from data Playwright already hands over:
+
+► resource type  (``image``, ``font``, ``media``, ``stylesheet`` …)
+► URL globs      (compiled into one regex)
+► third-party    (root domain of the request ≠ root domain of the page)
+► deny-list      (root domains that are always blocked – ads / analytics)
+
+The main-frame navigation itself is never blocked.  Every routed request
+makes a round trip through Python, so a profile made of URL globs alone
+routes just those globs; only resource-type / domain rules need ``**/*``.
+
+    BrowserAPI(strategy="pool", profile="html-only")
+    BrowserAPI(profile=PROFILES["no-media"].replace(deny_domains={"hotjar"}))
+
+`TransferMeter` counts the bytes that actually crossed the wire for one
+fetch (CDP ``Network.loadingFinished``), which is what Browser API bills.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import logging
+import re
+from dataclasses import dataclass
+from typing import FrozenSet, Iterable, Optional, Pattern, Tuple, Union
+
+from ..utils.domains import root_domain
+
+logger = logging.getLogger(__name__)
+
+
+# root domains of the usual ads / analytics / tag-manager hosts
+TRACKER_DOMAINS: FrozenSet[str] = frozenset({
+    "doubleclick", "googlesyndication", "googletagmanager", "googletagservices",
+    "google-analytics", "googleadservices", "adservice", "hotjar", "segment",
+    "mixpanel", "amplitude", "newrelic", "nr-data", "criteo", "taboola",
+    "outbrain", "scorecardresearch", "quantserve", "adnxs", "rubiconproject",
+    "pubmatic", "moatads", "optimizely", "clarity", "fullstory",
+})
+
+_MEDIA_TYPES = frozenset({"image", "media", "font"})
+
+
+def _glob_to_regex(glob: str) -> str:
+    """Playwright URL glob → regex (``**`` any, ``*`` no ``/``, ``{a,b}`` either)."""
+    out, i, group = [], 0, False
+    while i < len(glob):
+        c = glob[i]
+        if c == "*":
+            if glob.startswith("**", i):
+                out.append(".*")
+                i += 1
+            else:
+                out.append("[^/]*")
+        elif c == "{":
+            group = True
+            out.append("(?:")
+        elif c == "}" and group:
+            group = False
+            out.append(")")
+        elif c == "," and group:
+            out.append("|")
+        else:
+            out.append(re.escape(c))
+        i += 1
+    return "".join(out)
+
+
+@dataclass(frozen=True)
+class InterceptionProfile:
+    """What to abort before it reaches the network (hashable, reusable)."""
+
+    name: str = "custom"
+    block_resource_types: FrozenSet[str] = frozenset()
+    allow_resource_types: Optional[FrozenSet[str]] = None   # block everything else
+    block_patterns: Tuple[str, ...] = ()
+    block_third_party: bool = False
+    deny_domains: FrozenSet[str] = frozenset()
+    _url_rx: Optional[Pattern[str]] = dataclasses.field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        for attr in ("block_resource_types", "deny_domains"):
+            object.__setattr__(self, attr, frozenset(getattr(self, attr)))
+        if self.allow_resource_types is not None:
+            object.__setattr__(self, "allow_resource_types", frozenset(self.allow_resource_types))
+        object.__setattr__(self, "block_patterns", tuple(self.block_patterns))
+        if self.block_patterns:
+            rx = "|".join(f"(?:{_glob_to_regex(g)})" for g in self.block_patterns)
+            object.__setattr__(self, "_url_rx", re.compile(f"^(?:{rx})$"))
+
+    @property
+    def intercepts(self) -> bool:
+        """False for a profile that blocks nothing – no route is installed."""
+        return bool(
+            self.block_resource_types or self.allow_resource_types is not None
+            or self.block_patterns or self.block_third_party or self.deny_domains
+        )
+
+    @property
+    def route_globs(self) -> Tuple[str, ...]:
+        """URL globs the handler must see – ``**/*`` only if more than globs decide."""
+        if (
+            self.block_resource_types or self.allow_resource_types is not None
+            or self.block_third_party or self.deny_domains
+        ):
+            return ("**/*",)
+        return self.block_patterns
+
+    def replace(self, **changes) -> "InterceptionProfile":
+        return dataclasses.replace(self, **changes)
+
+    def blocks(self, resource_type: str, url: str, first_party: Optional[str]) -> bool:
+        """True if a request of *resource_type* to *url* should be aborted."""
+        if resource_type in self.block_resource_types:
+            return True
+        if self.allow_resource_types is not None and resource_type not in self.allow_resource_types:
+            return True
+        if self._url_rx is not None and self._url_rx.match(url):
+            return True
+        if self.block_third_party or self.deny_domains:
+            domain = root_domain(url)
+            if domain in self.deny_domains:
+                return True
+            if self.block_third_party and domain != first_party:
+                return True
+        return False
+
+
+PROFILES = {
+    # nothing blocked
+    "none":           InterceptionProfile("none"),
+    # the historical DEFAULT_BLOCK_PATTERNS: images, fonts, media, CSS
+    "default":        InterceptionProfile(
+        "default",
+        block_resource_types=_MEDIA_TYPES | {"stylesheet"},
+        block_patterns=("**/*.{png,jpg,jpeg,gif,webp,svg,woff,woff2,ttf,otf,css,mp4,webm}",),
+    ),
+    # images / fonts / media and known trackers; CSS and scripts still load
+    "no-media":       InterceptionProfile(
+        "no-media", block_resource_types=_MEDIA_TYPES, deny_domains=TRACKER_DOMAINS,
+    ),
+    # only other sites' requests (CDNs on another domain included) + media
+    "no-third-party": InterceptionProfile(
+        "no-third-party", block_resource_types=_MEDIA_TYPES, block_third_party=True,
+    ),
+    # the server-rendered document and nothing else – no scripts, no XHR
+    "html-only":      InterceptionProfile("html-only", allow_resource_types=frozenset({"document"})),
+}
+
+
+def resolve_profile(
+    profile: Union[InterceptionProfile, str, None] = None,
+    block_patterns: Optional[Iterable[str]] = None,
+) -> InterceptionProfile:
+    """
+    *profile* by name or as is; legacy *block_patterns* become a glob-only
+    profile; neither → ``PROFILES["default"]``.
+    """
+    if isinstance(profile, InterceptionProfile):
+        return profile
+    if profile is not None:
+        try:
+            return PROFILES[profile]
+        except KeyError:
+            raise ValueError(
+                f"unknown interception profile {profile!r}; choose from {sorted(PROFILES)}"
+            ) from None
+    if block_patterns is not None:
+        return InterceptionProfile("custom", block_patterns=tuple(block_patterns))
+    return PROFILES["default"]
+
+
+class TransferMeter:
+    """Bytes received and requests blocked during one fetch."""
+
+    __slots__ = ("bytes", "responses", "blocked")
+
+    def __init__(self) -> None:
+        self.bytes: Optional[int] = None        # None → not measurable (no CDP)
+        self.responses = 0
+        self.blocked = 0
+
+    def _on_loading_finished(self, event: dict) -> None:
+        self.bytes = (self.bytes or 0) + int(event.get("encodedDataLength") or 0)
+        self.responses += 1
+
+    async def attach(self, page) -> Optional[object]:
+        """Start counting *page*'s network traffic; returns the CDP session."""
+        try:
+            cdp = await page.context.new_cdp_session(page)
+            cdp.on("Network.loadingFinished", self._on_loading_finished)
+            self.bytes = 0
+            await cdp.send("Network.enable")
+            return cdp
+        except Exception as e:                  # non-Chromium / no CDP access
+            self.bytes = None
+            logger.debug("TransferMeter: CDP unavailable: %s", e)
+            return None
+
+    @staticmethod
+    async def detach(cdp) -> None:
+        if cdp is None:
+            return
+        try:
+            await cdp.detach()
+        except Exception:
+            pass
+
+
+def _is_main_navigation(request) -> bool:
+    try:
+        return request.is_navigation_request() and request.frame.parent_frame is None
+    except Exception:                           # service-worker requests have no frame
+        return False
+
+
+class Interceptor:
+    """The single route handler a context gets for one profile."""
+
+    __slots__ = ("profile", "first_party", "meter")
+
+    def __init__(self, profile: InterceptionProfile, first_party: Optional[str]):
+        self.profile = profile
+        self.first_party = first_party
+        self.meter: Optional[TransferMeter] = None   # swapped per fetch
+
+    async def install(self, context) -> None:
+        for glob in self.profile.route_globs:
+            await context.route(glob, self)
+
+    async def __call__(self, route) -> None:
+        request = route.request
+        if self.profile.blocks(request.resource_type, request.url, self.first_party) \
+                and not _is_main_navigation(request):
+            if self.meter is not None:
+                self.meter.blocked += 1
+            await route.abort()
+        else:
+            await route.fallback()
@@ -0,0 +1,240 @@
+# brightdata/browserapi/readiness.py
+"""
+brightdata.browserapi.readiness
+===============================
+"Is the page usable yet?" per domain, instead of a fixed ``wait_until``
+plus one global selector list with a 15 s timeout.
+
+A `ReadinessRule` says what *ready* means for a site:
+
+► selectors        – any of them present (first match wins)
+► min_text_chars   – the body carries real text, not an empty SPA shell
+► dom_settle_ms    – no DOM mutation for this long
+► network_quiet_ms – no resource finished loading for this long
+► max_wait_ms      – give up and take the HTML as it is
+
+The whole check runs **inside the page** as one ``page.evaluate`` (a
+MutationObserver + PerformanceObserver polled every 50 ms), so waiting
+costs one CDP round-trip, and the HTML is captured the moment the rule
+holds.
+
+`ReadinessEngine` picks the rule for a URL's root domain and learns from
+past fetches: the selector that actually matched replaces the list (the
+catch-all `FALLBACK_SELECTOR` never does – it matches any page), and
+``max_wait_ms`` shrinks towards twice the slowest recent ready time.  A
+timeout throws the learned timing away again.  Learned rules can be saved
+to / loaded from a JSON file.
+
+    ready = ReadinessEngine({"zara": ReadinessRule(selectors=("div.product-detail",))})
+    BrowserAPI(strategy="pool", readiness=ready)
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+from collections import deque
+from dataclasses import asdict, dataclass, replace
+from pathlib import Path
+from typing import Deque, Dict, NamedTuple, Optional, Tuple, Union
+
+from ..utils.domains import root_domain, split_host
+
+logger = logging.getLogger(__name__)
+
+
+# matches as soon as <body> has any element – a last resort, not a signal
+FALLBACK_SELECTOR = "body > *:not(script)"
+
+
+@dataclass(frozen=True)
+class ReadinessRule:
+    """When a page of one site counts as ready."""
+
+    selectors: Tuple[str, ...] = (
+        "#main",
+        "div#__next",
+        "div[data-reactroot]",
+        FALLBACK_SELECTOR,
+    )
+    min_text_chars: int = 200
+    dom_settle_ms: int = 400
+    network_quiet_ms: int = 500
+    max_wait_ms: int = 15_000
+
+
+DEFAULT_RULE = ReadinessRule()
+
+
+class Readiness(NamedTuple):
+    ready: bool                 # False → max_wait_ms hit
+    waited_ms: float
+    matched: Optional[str]      # selector that matched, if any
+    text_chars: int
+
+
+# one evaluate: resolves as soon as the rule holds, or at maxMs
+_WAIT_JS = """
+async ({selectors, minText, settleMs, quietMs, maxMs}) => {
+  const t0 = performance.now();
+  let lastMut = t0, lastNet = t0;
+  const mo = new MutationObserver(() => { lastMut = performance.now(); });
+  mo.observe(document, {subtree: true, childList: true, characterData: true});
+  let po = null;
+  try {
+    po = new PerformanceObserver(list => {
+      for (const e of list.getEntries()) lastNet = Math.max(lastNet, e.responseEnd || performance.now());
+    });
+    po.observe({type: "resource"});
+  } catch (e) {}
+  return await new Promise(resolve => {
+    const tick = () => {
+      const now = performance.now();
+      let matched = null;
+      for (const s of selectors) {
+        try { if (document.querySelector(s)) { matched = s; break; } } catch (e) {}
+      }
+      const text = document.body ? document.body.textContent.length : 0;
+      const ready = (!selectors.length || matched !== null) && text >= minText
+        && now - lastMut >= settleMs && now - lastNet >= quietMs;
+      if (ready || now - t0 >= maxMs) {
+        mo.disconnect(); if (po) po.disconnect();
+        resolve({ready, matched, waited: now - t0, text});
+      } else {
+        setTimeout(tick, 50);
+      }
+    };
+    tick();
+  });
+}
+"""
+
+
+class _Learned:
+    __slots__ = ("matched", "waits")
+
+    def __init__(self, matched: Optional[str] = None, waits=()):
+        self.matched = matched
+        self.waits: Deque[float] = deque(waits, maxlen=20)
+
+
+class ReadinessEngine:
+    """
+    Per-domain readiness rules, optionally learned from past fetches.
+
+    Parameters
+    ----------
+    rules : dict, optional
+        ``{root_domain: ReadinessRule}`` – explicit rules win over learning
+        for the fields they set, learning only narrows them.
+    default : ReadinessRule
+        Rule for every other domain.
+    learn : bool, default True
+        Adapt selectors / max wait from observed fetches.
+    min_samples : int, default 3
+        Ready fetches needed before ``max_wait_ms`` is narrowed.
+    path : str | Path, optional
+        JSON file with learned state – loaded now, written by `save()`.
+    """
+
+    def __init__(
+        self,
+        rules: Optional[Dict[str, ReadinessRule]] = None,
+        *,
+        default: ReadinessRule = DEFAULT_RULE,
+        learn: bool = True,
+        min_samples: int = 3,
+        path: Union[str, Path, None] = None,
+    ) -> None:
+        self.rules: Dict[str, ReadinessRule] = dict(rules or {})
+        self.default = default
+        self.learn = learn
+        self.min_samples = min_samples
+        self.path = Path(path) if path else None
+        self._learned: Dict[str, _Learned] = {}
+        if self.path and self.path.exists():
+            self.load(self.path)
+
+    # ------------------------------------------------------------------
+    # rules
+    # ------------------------------------------------------------------
+    @staticmethod
+    def _domain(url: str) -> str:
+        return root_domain(url) or split_host(url)[0]
+
+    def rule_for(self, url: str) -> ReadinessRule:
+        """Configured rule for *url*'s domain, narrowed by what was learned."""
+        domain = self._domain(url)
+        rule = self.rules.get(domain, self.default)
+        learned = self._learned.get(domain) if self.learn else None
+        if learned is None:
+            return rule
+        changes = {}
+        if learned.matched and learned.matched in rule.selectors:
+            changes["selectors"] = (learned.matched,)
+        if len(learned.waits) >= self.min_samples:
+            cap = int(2 * max(learned.waits))
+            changes["max_wait_ms"] = max(1_000, min(rule.max_wait_ms, cap))
+        return replace(rule, **changes) if changes else rule
+
+    def observe(self, url: str, result: Readiness) -> None:
+        """Feed one outcome back into the domain's learned state."""
+        if not self.learn:
+            return
+        domain = self._domain(url)
+        learned = self._learned.setdefault(domain, _Learned())
+        if result.ready:
+            if result.matched and result.matched != FALLBACK_SELECTOR:
+                learned.matched = result.matched
+            learned.waits.append(result.waited_ms)
+        else:                               # timed out – stop trusting the tight cap
+            learned.matched = None
+            learned.waits.clear()
+
+    # ------------------------------------------------------------------
+    # waiting
+    # ------------------------------------------------------------------
+    async def wait(self, page, url: str) -> Readiness:
+        """Block until *page* is ready per its domain rule (or max wait)."""
+        rule = self.rule_for(url)
+        try:
+            raw = await page.evaluate(_WAIT_JS, {
+                "selectors": list(rule.selectors),
+                "minText":   rule.min_text_chars,
+                "settleMs":  rule.dom_settle_ms,
+                "quietMs":   rule.network_quiet_ms,
+                "maxMs":     rule.max_wait_ms,
+            })
+        except Exception as e:              # client-side redirect destroyed the context
+            logger.debug("readiness check interrupted on %s: %s", url, e)
+            return Readiness(False, 0.0, None, 0)
+        result = Readiness(bool(raw["ready"]), float(raw["waited"]), raw.get("matched"), int(raw["text"]))
+        if not result.ready:
+            logger.debug("not ready after %dms on %s (%s)", rule.max_wait_ms, url, result)
+        self.observe(url, result)
+        return result
+
+    # ------------------------------------------------------------------
+    # persistence
+    # ------------------------------------------------------------------
+    def to_dict(self) -> dict:
+        return {
+            "rules":   {d: asdict(r) for d, r in self.rules.items()},
+            "learned": {d: {"matched": l.matched, "waits": list(l.waits)}
+                        for d, l in self._learned.items()},
+        }
+
+    def load(self, path: Union[str, Path]) -> None:
+        data = json.loads(Path(path).read_text(encoding="utf-8"))
+        for domain, fields in data.get("rules", {}).items():
+            fields["selectors"] = tuple(fields.get("selectors", ()))
+            self.rules.setdefault(domain, ReadinessRule(**fields))
+        for domain, state in data.get("learned", {}).items():
+            self._learned[domain] = _Learned(state.get("matched"), state.get("waits", ()))
+
+    def save(self, path: Union[str, Path, None] = None) -> Path:
+        target = Path(path) if path else self.path
+        if target is None:
+            raise ValueError("no path given and the engine was created without one")
+        target.write_text(json.dumps(self.to_dict(), indent=2), encoding="utf-8")
+        return target
@@ -0,0 +1,185 @@
+# brightdata/browserapi/warmer.py
+"""
+brightdata.browserapi.warmer
+============================
+Connected-ahead sessions for the one-browser-per-URL strategies.
+
+`noop` / `semaphore` open a fresh remote browser for every URL, so each
+fetch used to start with the CDP handshake.  A `SessionWarmer` opens
+sessions *before* they are asked for and hands them out already
+connected; a used session is closed in the background, off the fetch path.
+
+How many are opened ahead follows demand: `expect(n)` says *n* fetches are
+in progress or queued, and the warmer keeps ``n − in use`` sessions ready
+(at least *target*, at most *max_ready*).
+
+    warmer = SessionWarmer(target=2, max_ready=8)
+    warmer.expect(len(urls))
+    session = await warmer.take()          # usually no handshake here
+    …
+    warmer.discard(session)
+
+Its sessions lease the Playwright driver of the loop they were opened on
+(`driver.py`), so a warmer serves one event loop only – `BrowserAPI` keeps
+one per loop, the way `get_driver()` does.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections import deque
+from typing import Awaitable, Callable, Deque, Dict, Optional, Set
+
+from .browserapi_engine import BrowserapiEngine
+
+logger = logging.getLogger(__name__)
+
+
+class SessionWarmer:
+    """Keeps connected, never-used Browser-API sessions ready."""
+
+    def __init__(
+        self,
+        *,
+        target: int = 1,
+        max_ready: Optional[int] = None,
+        session_factory: Optional[Callable[[], Awaitable[BrowserapiEngine]]] = None,
+        on_connect: Optional[Callable[[float], None]] = None,
+    ) -> None:
+        self.target = max(0, target)
+        self.max_ready = max(self.target, max_ready if max_ready is not None else self.target)
+        self._factory = session_factory or BrowserapiEngine.create
+        self.on_connect = on_connect            # handshake seconds (autotune)
+
+        self._ready: Deque[BrowserapiEngine] = deque()
+        self._takers: Deque[asyncio.Future] = deque()   # take() waiting on an opening session
+        self._opening = 0
+        self._in_use = 0
+        self._demand = 0
+        self._tasks: Set[asyncio.Task] = set()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None   # bound on first use
+        self._closed = False
+        # counters
+        self.hits = 0            # take() served from the ready queue
+        self.misses = 0          # take() had to connect inline
+
+    def expect(self, n: int) -> None:
+        """*n* fetches are running or queued right now – open ahead for them."""
+        self._demand = max(0, n)
+        self._bind_loop()
+        self._top_up()
+
+    async def take(self) -> BrowserapiEngine:
+        """A connected session for one fetch; pass it to `discard` afterwards."""
+        if self._closed:
+            raise RuntimeError("SessionWarmer is closed")
+        self._bind_loop()
+        self._in_use += 1
+        try:
+            while self._ready:
+                session = self._ready.popleft()
+                if session.is_connected():
+                    self.hits += 1
+                    return session
+                self._close_later(session)
+            if self._opening > len(self._takers):      # one is on its way – wait for it
+                fut = asyncio.get_running_loop().create_future()
+                self._takers.append(fut)
+                session = await fut
+                if session is not None:
+                    self.hits += 1
+                    return session
+            self.misses += 1
+            return await self._connect()
+        except BaseException:
+            self._in_use -= 1
+            raise
+        finally:
+            self._top_up()
+
+    def discard(self, session: BrowserapiEngine) -> None:
+        """Done with *session*: close it in the background."""
+        self._in_use -= 1
+        self._close_later(session)
+        self._top_up()
+
+    # ------------------------------------------------------------------
+    # internals
+    # ------------------------------------------------------------------
+    def _bind_loop(self) -> None:
+        loop = asyncio.get_running_loop()
+        if self._loop is None:
+            self._loop = loop
+        elif self._loop is not loop:
+            raise RuntimeError("SessionWarmer is bound to another event loop")
+
+    def _wanted(self) -> int:
+        return min(self.max_ready, max(self.target, self._demand - self._in_use))
+
+    def _top_up(self) -> None:
+        if self._closed:
+            return
+        for _ in range(self._wanted() - len(self._ready) - self._opening):
+            self._opening += 1
+            self._spawn(self._open_one())
+
+    async def _open_one(self) -> None:
+        try:
+            session = await self._connect()
+        except Exception as e:
+            logger.warning("SessionWarmer: speculative connect failed: %s", e)
+            session = None
+        finally:
+            self._opening -= 1
+        while self._takers:
+            fut = self._takers.popleft()
+            if not fut.done():
+                fut.set_result(session)         # None → that taker connects itself
+                return
+        if session is None:
+            return
+        if self._closed:
+            await session.close()
+        else:
+            self._ready.append(session)
+
+    async def _connect(self) -> BrowserapiEngine:
+        t0 = time.monotonic()
+        session = await self._factory()
+        if self.on_connect is not None:
+            self.on_connect(time.monotonic() - t0)
+        return session
+
+    def _close_later(self, session: BrowserapiEngine) -> None:
+        self._spawn(self._close_quietly(session))
+
+    @staticmethod
+    async def _close_quietly(session: BrowserapiEngine) -> None:
+        try:
+            await session.close()
+        except Exception as e:
+            logger.debug("SessionWarmer: close failed: %s", e)
+
+    def _spawn(self, coro) -> None:
+        task = asyncio.ensure_future(coro)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "ready":   len(self._ready),
+            "opening": self._opening,
+            "in_use":  self._in_use,
+            "demand":  self._demand,
+            "hits":    self.hits,
+            "misses":  self.misses,
+        }
+
+    async def close(self) -> None:
+        self._closed = True
+        while self._ready:
+            self._close_later(self._ready.popleft())
+        if self._tasks:
+            await asyncio.gather(*list(self._tasks), return_exceptions=True)
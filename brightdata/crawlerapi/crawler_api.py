@@ -6,21 +6,18 @@ BrightData Crawler API implementation for collecting and discovering web content
 Supports both single URL collection and full domain discovery with filtering.
 """
 
-import os
 import time
 import logging
 import asyncio
 from datetime import datetime
-from typing import List, Dict, Any, Optional, Union
+from typing import List, Dict, Any, AsyncIterator, Iterator, Optional, Union
 
 import requests
 import aiohttp
-from dotenv import load_dotenv
 
 from brightdata.models import CrawlResult
-
-# Load environment variables
-load_dotenv()
+from brightdata.utils.env import getenv
+from brightdata.utils.streaming import iter_ndjson, aiter_ndjson
 
 logger = logging.getLogger(__name__)
 
@@ -47,7 +44,7 @@ class CrawlerAPI:
         Args:
             bearer_token: BrightData API token. If not provided, uses BRIGHTDATA_TOKEN env var.
         """
-        self.bearer_token = bearer_token or os.getenv('BRIGHTDATA_TOKEN')
+        self.bearer_token = bearer_token or getenv('BRIGHTDATA_TOKEN')
         if not self.bearer_token:
             raise ValueError("BRIGHTDATA_TOKEN not found. Set it in .env or pass as parameter")
         
@@ -291,6 +288,31 @@ class CrawlerAPI:
                 "snapshot_id": snapshot_id
             }
     
+    def iter_snapshot_data(
+        self,
+        snapshot_id: str,
+        chunk_size: int = 64 * 1024,
+        building_retry: float = 2.0,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Stream a completed snapshot as JSON-lines and yield one page at a time.
+
+        Unlike `get_snapshot_data`, the body is never buffered as a whole, so
+        discover results with `page_html` for thousands of pages keep memory
+        flat.  A 202 "building" answer is retried every *building_retry* s;
+        other HTTP errors raise ``requests.HTTPError``.
+        """
+        endpoint = f"{self.BASE_URL}/snapshot/{snapshot_id}"
+        params = {"format": "jsonl"}
+
+        while True:
+            with requests.get(endpoint, headers=self.headers, params=params, stream=True) as response:
+                response.raise_for_status()
+                if response.status_code != 202:
+                    yield from iter_ndjson(response.iter_content(chunk_size))
+                    return
+            time.sleep(building_retry)
+
     def poll_until_ready(
         self,
         crawl_result: CrawlResult,
@@ -515,6 +537,31 @@ class CrawlerAPI:
                         crawl_params=crawl_params
                     )
     
+    async def iter_snapshot_data_async(
+        self,
+        snapshot_id: str,
+        chunk_size: int = 64 * 1024,
+        building_retry: float = 2.0,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Async version of iter_snapshot_data.
+
+            async for page in crawler.iter_snapshot_data_async(result.snapshot_id):
+                store(page["url"], page["markdown"])
+        """
+        endpoint = f"{self.BASE_URL}/snapshot/{snapshot_id}"
+        params = {"format": "jsonl"}
+
+        async with aiohttp.ClientSession() as session:
+            while True:
+                async with session.get(endpoint, headers=self.headers, params=params) as response:
+                    response.raise_for_status()
+                    if response.status != 202:
+                        async for page in aiter_ndjson(response.content, chunk_size):
+                            yield page
+                        return
+                await asyncio.sleep(building_retry)
+
     async def poll_until_ready_async(
         self,
         crawl_result: CrawlResult,
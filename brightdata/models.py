@@ -28,6 +28,9 @@ class ScrapeResult:
     html_char_size: int | None = None
     row_count: Optional[int] = None
     field_count: Optional[int] = None
+    cache_hit: bool = False                # served from a ResultCache, no API call
+    bytes_transferred: Optional[int] = None   # Browser API: bytes over the wire (billed)
+    requests_blocked: Optional[int] = None    # Browser API: requests aborted by the profile
 
 
 
@@ -0,0 +1,44 @@
+# here is build_manifest.py
+
+#!/usr/bin/env python
+"""
+Regenerate brightdata/webscraper_api/scrapers/_manifest.py – the static
+``domain → (module, class)`` index the registry routes with, so a lookup
+imports only the one scraper module it needs.
+
+Run it after adding a scraper or changing a @register() domain:
+
+    python -m brightdata.other.build_manifest          # write the file
+    python -m brightdata.other.build_manifest --check  # exit 1 if stale
+"""
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+from pprint import pformat
+
+from brightdata.webscraper_api.registry import build_manifest
+from brightdata.webscraper_api.scrapers import _manifest
+
+OUT_FILE = Path(_manifest.__file__)
+
+HEADER = '''\
+# brightdata/webscraper_api/scrapers/_manifest.py
+# GENERATED by `python -m brightdata.other.build_manifest` – do not edit.
+"""Domain (second-level) → (scraper module, class name) of every bundled scraper."""
+
+'''
+
+
+def render() -> str:
+    return HEADER + "MANIFEST = " + pformat(build_manifest(), width=100) + "\n"
+
+
+if __name__ == "__main__":
+    text = render()
+    if "--check" in sys.argv:
+        stale = OUT_FILE.read_text() != text
+        print(f"{OUT_FILE} is {'STALE' if stale else 'up to date'}")
+        sys.exit(1 if stale else 0)
+    OUT_FILE.write_text(text)
+    print(f"Wrote {OUT_FILE}")
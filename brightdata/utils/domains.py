@@ -0,0 +1,79 @@
+# brightdata/utils/domains.py
+"""
+brightdata.utils.domains
+========================
+Offline, memoised public-suffix handling.
+
+A default ``tldextract.extract`` call may try to download the Public Suffix
+List on first use and takes a file lock on its disk cache – which is why the
+Browser-API module used to mute ``filelock`` logs.  Every root-domain lookup
+in the package goes through here instead:
+
+► one module-wide ``TLDExtract`` built from the PSL snapshot that ships
+  **inside** the tldextract wheel – no network, no cache dir, no lock;
+  imported and parsed once, on first use
+► ``(sub)domain`` results memoised per *host* (LRU), so a lookup after the
+  first for a host is a dict hit
+
+    root_domain("https://www.amazon.co.uk/dp/B0…")   # → "amazon"
+    split_host("https://user@Shop.Example.com:8443/a?b")
+    # → ("shop.example.com", "/a?b")
+"""
+
+from __future__ import annotations
+
+import re
+import threading
+from functools import lru_cache
+from typing import TYPE_CHECKING, Optional, Tuple
+
+if TYPE_CHECKING:
+    import tldextract
+
+_EXTRACTOR: Optional["tldextract.TLDExtract"] = None
+_LOCK = threading.Lock()
+
+# scheme://netloc | //netloc | bare netloc, then path?query (fragment dropped);
+# ~5x cheaper than urllib's urlsplit and enough for routing / root domains
+_URL_RX = re.compile(r"^(?:[A-Za-z][A-Za-z0-9+.\-]*://|//)?([^/?#]*)([^#]*)")
+
+
+def _extractor() -> "tldextract.TLDExtract":
+    global _EXTRACTOR
+    if _EXTRACTOR is None:
+        with _LOCK:
+            if _EXTRACTOR is None:
+                import tldextract               # ~45 ms – only when first needed
+                _EXTRACTOR = tldextract.TLDExtract(
+                    cache_dir=None,             # no disk cache → no file lock
+                    suffix_list_urls=(),        # never fetch – bundled snapshot only
+                    fallback_to_snapshot=True,
+                )
+    return _EXTRACTOR
+
+
+def split_host(url: str) -> Tuple[str, str]:
+    """``(lower-cased host, path?query)`` of *url*."""
+    netloc, target = _URL_RX.match(url).groups()
+    host = netloc.rpartition("@")[2]
+    if host.startswith("["):            # IPv6 literal
+        host = host.partition("]")[0] + "]"
+    else:
+        host = host.partition(":")[0]
+    return host.lower(), target
+
+
+@lru_cache(maxsize=65_536)
+def extract_host(host: str) -> "tldextract.tldextract.ExtractResult":
+    """``ExtractResult(subdomain, domain, suffix, …)`` of a bare *host*."""
+    return _extractor().extract_str(host)
+
+
+def extract(url: str) -> "tldextract.tldextract.ExtractResult":
+    """Offline drop-in for ``tldextract.extract(url)``."""
+    return extract_host(split_host(url)[0])
+
+
+def root_domain(url: str) -> Optional[str]:
+    """Second-level domain of *url* (``"amazon"`` for amazon.co.uk) or None."""
+    return extract_host(split_host(url)[0]).domain or None
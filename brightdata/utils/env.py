@@ -0,0 +1,30 @@
+# brightdata/utils/env.py
+"""
+brightdata.utils.env
+====================
+``.env`` loading on first need instead of at import time.
+
+Modules used to call ``load_dotenv()`` at import, so ``import brightdata``
+read the file system (and every later import did it again).  Code that
+reads a setting goes through `getenv` instead – the ``.env`` file is loaded
+once, the first time any setting is asked for.
+"""
+
+from __future__ import annotations
+
+import os
+from functools import lru_cache
+from typing import Optional
+
+
+@lru_cache(maxsize=1)
+def load_env() -> None:
+    """Load ``.env`` into ``os.environ`` (once; existing variables win)."""
+    from dotenv import load_dotenv
+    load_dotenv()
+
+
+def getenv(name: str, default: Optional[str] = None) -> Optional[str]:
+    """``os.getenv`` after making sure ``.env`` has been loaded."""
+    load_env()
+    return os.getenv(name, default)
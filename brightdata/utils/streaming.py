@@ -0,0 +1,122 @@
+# brightdata/utils/streaming.py
+"""
+Incremental NDJSON (``format=jsonl``) decoding.
+
+`resp.json()` buffers the whole snapshot body and then builds the complete
+Python list – peak memory ends up around 3× the payload.  `NDJSONDecoder`
+is fed the body chunk by chunk and hands back each record as soon as its
+line is complete, so only *one* record (plus one partial line) is alive at
+any time.
+
+    async for record in aiter_ndjson(resp.content):       # aiohttp
+        handle(record)
+
+    for record in iter_ndjson(resp.iter_content(65536)):  # requests
+        handle(record)
+"""
+
+from __future__ import annotations
+
+import json
+from typing import Any, AsyncIterator, Iterable, Iterator, List
+
+
+class NDJSONDecoder:
+    """Feed bytes, get parsed JSON records back – one per non-empty line."""
+
+    __slots__ = ("_buf", "records")
+
+    def __init__(self) -> None:
+        self._buf = bytearray()
+        self.records = 0                      # how many records emitted so far
+
+    def feed(self, chunk: bytes) -> List[Any]:
+        """Consume *chunk*; return every record whose line is now complete."""
+        self._buf += chunk
+        end = self._buf.rfind(b"\n")
+        if end < 0:
+            return []
+        complete = bytes(self._buf[:end])
+        del self._buf[: end + 1]
+        return self._decode_lines(complete.split(b"\n"))
+
+    def close(self) -> List[Any]:
+        """Flush a trailing line that had no final newline."""
+        rest, self._buf = bytes(self._buf), bytearray()
+        return self._decode_lines([rest])
+
+    def _decode_lines(self, lines: Iterable[bytes]) -> List[Any]:
+        out = []
+        for line in lines:
+            line = line.strip()
+            if line:
+                out.append(json.loads(line))
+        self.records += len(out)
+        return out
+
+
+def iter_ndjson(chunks: Iterable[bytes]) -> Iterator[Any]:
+    """Synchronous convenience wrapper around `NDJSONDecoder`."""
+    dec = NDJSONDecoder()
+    for chunk in chunks:
+        yield from dec.feed(chunk)
+    yield from dec.close()
+
+
+async def aiter_ndjson(stream, chunk_size: int = 64 * 1024) -> AsyncIterator[Any]:
+    """Async variant for an ``aiohttp.StreamReader`` (``resp.content``)."""
+    dec = NDJSONDecoder()
+    async for chunk in stream.iter_chunked(chunk_size):
+        for record in dec.feed(chunk):
+            yield record
+    for record in dec.close():
+        yield record
+
+
+class NDJSONRowCounter:
+    """
+    Count NDJSON rows without materialising them.
+
+    Only the *first* record is parsed (for the field count and to spot the
+    "building" placeholder); every other line is merely counted.
+    """
+
+    __slots__ = ("rows", "first", "_head", "_pending_line")
+
+    def __init__(self) -> None:
+        self.rows = 0
+        self.first: Any = None
+        self._head = bytearray()              # bytes of the first line only
+        self._pending_line = False            # current line has content?
+
+    @property
+    def field_count(self) -> int:
+        return len(self.first) if isinstance(self.first, dict) else 0
+
+    def feed(self, chunk: bytes) -> None:
+        start = 0
+        while True:
+            nl = chunk.find(b"\n", start)
+            piece = chunk[start:] if nl < 0 else chunk[start:nl]
+            if self.first is None and self.rows == 0:
+                self._head += piece
+            if piece.strip():
+                self._pending_line = True
+            if nl < 0:
+                return
+            self._end_line()
+            start = nl + 1
+
+    def close(self) -> None:
+        self._end_line()
+
+    def _end_line(self) -> None:
+        if not self._pending_line:
+            if self.rows == 0:
+                self._head.clear()            # blank leading line
+            return
+        self._pending_line = False
+        self.rows += 1
+        if self.rows == 1:
+            self.first = json.loads(bytes(self._head))
+            self._head = bytearray()
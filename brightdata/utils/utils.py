@@ -4,12 +4,13 @@ from __future__ import annotations
 import asyncio
 from datetime import datetime
 from typing import Any
-import tldextract
 
 from brightdata.models import ScrapeResult
 
 
-import re, urllib.parse, tldextract
+import re, urllib.parse
+
+from brightdata.utils.domains import root_domain
 
 _BD_URL_RE = re.compile(r"[?&]url=([^&]+)")
 
@@ -23,8 +24,7 @@ def _real_domain_from_bd_url(api_url: str) -> str | None:
         return None
 
     dec = urllib.parse.unquote(m.group(1))
-    ext = tldextract.extract(dec)
-    return ext.domain or None
+    return root_domain(dec)
 
 
 def _make_result_browserapi(                       # ← distinct name
@@ -43,8 +43,6 @@ def _make_result_browserapi(                       # ← distinct name
     that Bright-Data scrapers use, but lives in utils so we avoid code
     duplication and name clashes.
     """
-    ext = tldextract.extract(url)
-    
     return ScrapeResult(
         success=success,
         url=url,
@@ -54,7 +52,7 @@ def _make_result_browserapi(                       # ← distinct name
         snapshot_id=None,
         cost=None,
         fallback_used=True,
-        root_domain=ext.domain or None,
+        root_domain=root_domain(url),
         request_sent_at=request_sent_at,
         browser_warmed_at=browser_warmed_at,
         data_received_at=data_received_at,
@@ -1,11 +1,13 @@
 # web_unlocker.py
 
 # to run   python -m brightdata.web_unlocker
-import os
 import requests
-from dotenv import load_dotenv
 import pathlib
-import tldextract
+from collections import Counter, deque
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict, Iterable, Optional, Set, Tuple
+from brightdata.utils.domains import root_domain, split_host
+from brightdata.utils.env import getenv
 
 import asyncio
 import aiohttp
@@ -14,20 +16,177 @@ import logging
 from brightdata.models import ScrapeResult
 
 class WebUnlocker:
+    """
+    Web Unlocker client.
+
+    By default every async call opens (and closes) its own
+    ``aiohttp.ClientSession`` and every sync call a bare ``requests.post``.
+    With ``pooled=True`` – or inside ``async with unlocker:`` /
+    ``pooling()`` – the unlocker owns one session per event loop on a
+    keep-alive ``TCPConnector`` (and one ``requests.Session`` for the sync
+    calls), so every request reuses warm TCP+TLS connections to the API.
+
+        async with WebUnlocker() as unlocker:
+            async for url, res in unlocker.get_sources_async(urls, concurrency=32):
+                ...
+    """
 
     COST_PER_THOUSAND = 1.50  # USD per 1000 requests
     COST_PER_REQUEST = COST_PER_THOUSAND / 1000.0
 
-    def __init__(self, BRIGHTDATA_WEBUNLOCKER_BEARER=None, ZONE_STRING=None):
-        load_dotenv()
-        self.bearer = BRIGHTDATA_WEBUNLOCKER_BEARER or os.getenv('BRIGHTDATA_WEBUNLOCKER_BEARER')
-        self.zone   = ZONE_STRING                    or os.getenv('BRIGHTDATA_WEBUNLOCKER_APP_ZONE_STRING')
+    def __init__(
+        self,
+        BRIGHTDATA_WEBUNLOCKER_BEARER=None,
+        ZONE_STRING=None,
+        *,
+        timeout: int = 30,
+        pooled: bool = False,
+        limit: int = 100,
+        keepalive_timeout: float = 30.0,
+        ttl_dns_cache: Optional[int] = 300,
+    ):
+        self.bearer = BRIGHTDATA_WEBUNLOCKER_BEARER or getenv('BRIGHTDATA_WEBUNLOCKER_BEARER')
+        self.zone   = ZONE_STRING                    or getenv('BRIGHTDATA_WEBUNLOCKER_APP_ZONE_STRING')
         self.format = "raw"
         if not (self.bearer and self.zone):
             raise ValueError("Set BRIGHTDATA_WEBUNLOCKER_BEARER and ZONE_STRING")
         
         self._endpoint = "https://api.brightdata.com/request"
 
+        # client timeout for every request (was a hard-coded 30 s)
+        self.timeout = timeout
+        self._timeout = aiohttp.ClientTimeout(total=timeout)
+
+        # pooled-session knobs (ignored unless pooled)
+        self.pooled = pooled
+        self._pooling: Dict[asyncio.AbstractEventLoop, int] = {}   # open `pooling()` blocks per loop
+        self._connector_kw: Dict[str, Any] = {
+            "limit":             limit,
+            "limit_per_host":    limit,    # every request goes to the one API host
+            "keepalive_timeout": keepalive_timeout,
+            "ttl_dns_cache":     ttl_dns_cache,
+            "use_dns_cache":     ttl_dns_cache is not None,
+        }
+        # one session per event loop (loop-affinity safety); closed with
+        # its loop at the latest (see _reap_on_exit)
+        self._sessions: Dict[asyncio.AbstractEventLoop, aiohttp.ClientSession] = {}
+        self._reapers: Set[asyncio.Task] = set()
+        self._http: Optional[requests.Session] = None   # pooled sync session
+
+    # ───────────────────────────── session handling ─────────────────────────────
+    def _headers(self) -> Dict[str, str]:
+        return {
+            "Content-Type": "application/json",
+            "Authorization": f"Bearer {self.bearer}"
+        }
+
+    def _new_session(self, **kw: Any) -> aiohttp.ClientSession:
+        return aiohttp.ClientSession(timeout=self._timeout, trust_env=True, **kw)
+
+    def _shared_session(self) -> aiohttp.ClientSession:
+        """Return (creating on demand) the pooled session of the running loop."""
+        loop = asyncio.get_running_loop()
+        sess = self._sessions.get(loop)
+        if sess is None or sess.closed:
+            connector = aiohttp.TCPConnector(**self._connector_kw)
+            sess = self._new_session(connector=connector)
+            self._sessions[loop] = sess
+            self._reap_on_exit(loop, sess)
+        return sess
+
+    def _reap_on_exit(self, loop: asyncio.AbstractEventLoop, sess: aiohttp.ClientSession) -> None:
+        """Close *sess* when *loop* shuts down (``asyncio.run`` cancels this task)."""
+        async def _reaper() -> None:
+            try:
+                await loop.create_future()          # parked until cancelled
+            finally:
+                if self._sessions.get(loop) is sess:
+                    del self._sessions[loop]
+                if not sess.closed:
+                    await sess.close()
+
+        task = loop.create_task(_reaper(), name="webunlocker-session-reaper")
+        self._reapers.add(task)
+        task.add_done_callback(self._reapers.discard)
+
+    def _use_pool(self) -> bool:
+        return self.pooled or self._pooling.get(asyncio.get_running_loop(), 0) > 0
+
+    @asynccontextmanager
+    async def _session(self) -> AsyncIterator[aiohttp.ClientSession]:
+        """The loop's pooled session when pooled, otherwise a throw-away one."""
+        if self._use_pool():
+            yield self._shared_session()
+            return
+        async with self._new_session() as sess:
+            yield sess
+
+    def _post(self, payload: Dict[str, Any]) -> requests.Response:
+        if not self.pooled:
+            return requests.post(self._endpoint, headers=self._headers(), json=payload,
+                                 timeout=self.timeout)
+        if self._http is None:
+            self._http = requests.Session()
+            adapter = requests.adapters.HTTPAdapter(pool_maxsize=self._connector_kw["limit"])
+            self._http.mount("https://", adapter)
+        return self._http.post(self._endpoint, headers=self._headers(), json=payload,
+                               timeout=self.timeout)
+
+    async def _close_loop_session(self, loop: asyncio.AbstractEventLoop) -> None:
+        sess = self._sessions.pop(loop, None)
+        if sess is not None and not sess.closed:
+            await sess.close()
+
+    async def close(self) -> None:
+        """
+        Close the pooled session of the running loop (and the sync one).
+        Sessions of other loops that are still running are closed on their
+        own loop; those of finished loops were closed by their reaper.
+        """
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            loop = None
+        for sess_loop, sess in list(self._sessions.items()):
+            if sess_loop is loop:
+                await self._close_loop_session(loop)
+            elif not sess_loop.is_closed() and sess_loop.is_running():
+                asyncio.run_coroutine_threadsafe(self._close_loop_session(sess_loop), sess_loop)
+            else:
+                self._sessions.pop(sess_loop, None)
+        if self._http is not None:
+            self._http.close()
+            self._http = None
+
+    @asynccontextmanager
+    async def pooling(self) -> AsyncIterator["WebUnlocker"]:
+        """
+        Use the pooled session of the running loop for the duration of the
+        block only – other loops sharing this unlocker are unaffected.  An
+        unlocker already pooled by its owner is left untouched; nested /
+        overlapping blocks share the session and the last one out closes it.
+        """
+        if self.pooled:
+            yield self
+            return
+        loop = asyncio.get_running_loop()
+        self._pooling[loop] = self._pooling.get(loop, 0) + 1
+        try:
+            yield self
+        finally:
+            self._pooling[loop] -= 1
+            if not self._pooling[loop]:
+                del self._pooling[loop]
+                await self._close_loop_session(loop)
+
+    async def __aenter__(self) -> "WebUnlocker":
+        self.pooled = True
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> bool:
+        await self.close()
+        return False
+
     def _make_result(
         self,
         *,
@@ -38,7 +197,6 @@ class WebUnlocker:
         error: str | None = None
     ) -> ScrapeResult:
         from datetime import datetime
-        ext = tldextract.extract(url)
         return ScrapeResult(
             success=success,
             url=url,
@@ -48,7 +206,7 @@ class WebUnlocker:
             snapshot_id=None,
             cost=self.COST_PER_REQUEST if success else 0.0,
             fallback_used=True,  # Web Unlocker is used as a fallback
-            root_domain=ext.domain or None,
+            root_domain=root_domain(url),
             request_sent_at=datetime.utcnow() if success else None,
             data_received_at=datetime.utcnow() if success else None,
             html_char_size=len(data) if data else None
@@ -58,14 +216,10 @@ class WebUnlocker:
         """
         Returns ScrapeResult with .data holding the unlocked HTML.
         """
-        headers = {
-            "Content-Type": "application/json",
-            "Authorization": f"Bearer {self.bearer}"
-        }
         payload = {"zone": self.zone, "url": target_weblink, "format": self.format}
 
         try:
-            resp = requests.post(self._endpoint, headers=headers, json=payload)
+            resp = self._post(payload)
             resp.raise_for_status()
             return self._make_result(
                 url=target_weblink,
@@ -140,15 +294,11 @@ class WebUnlocker:
         """
         Async unlock + HTML fetch via aiohttp.
         """
-        headers = {
-            "Content-Type": "application/json",
-            "Authorization": f"Bearer {self.bearer}"
-        }
         payload = {"zone": self.zone, "url": target_weblink, "format": "raw"}
 
         try:
-            async with aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=30)) as sess:
-                async with sess.post(self._endpoint, headers=headers, json=payload) as resp:
+            async with self._session() as sess:
+                async with sess.post(self._endpoint, headers=self._headers(), json=payload) as resp:
                     text = await resp.text()
                     if resp.status >= 400:
                         raise aiohttp.ClientResponseError(
@@ -186,6 +336,95 @@ class WebUnlocker:
             res.status = "error"
         return res
 
+    async def get_sources_async(
+        self,
+        urls: Iterable[str],
+        *,
+        concurrency: int = 16,
+        per_host: Optional[int] = None,
+    ) -> AsyncIterator[Tuple[str, ScrapeResult]]:
+        """
+        Unlock many URLs over one pooled session, yielding ``(url, result)``
+        as each finishes (completion order).
+
+        ► at most *concurrency* requests in flight
+        ► target hosts are served round-robin, so one big site cannot starve
+          the others; *per_host* additionally caps in-flight requests per host
+        ► breaking out early cancels the outstanding requests – wrap in
+          ``contextlib.aclosing`` to have that happen immediately
+
+            async for url, res in unlocker.get_sources_async(urls, concurrency=32, per_host=4):
+                ...
+        """
+        if concurrency < 1:
+            raise ValueError("concurrency must be ≥ 1")
+        queues: Dict[str, deque] = {}
+        for url in urls:
+            queues.setdefault(split_host(url)[0], deque()).append(url)
+        ring = deque(queues)                    # hosts with work left, round-robin
+        in_host: Counter = Counter()
+        running: Dict[asyncio.Task, Tuple[str, str]] = {}
+
+        def _next() -> Optional[Tuple[str, str]]:
+            for _ in range(len(ring)):
+                host = ring.popleft()
+                if per_host is not None and in_host[host] >= per_host:
+                    ring.append(host)
+                    continue
+                url = queues[host].popleft()
+                if queues[host]:
+                    ring.append(host)
+                return host, url
+            return None
+
+        async with self.pooling():
+            try:
+                while ring or running:
+                    while len(running) < concurrency and ring:
+                        picked = _next()
+                        if picked is None:      # every host with work is at its cap
+                            break
+                        host, url = picked
+                        in_host[host] += 1
+                        running[asyncio.ensure_future(self.get_source_async(url))] = (host, url)
+                    done, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+                    for task in done:
+                        host, url = running.pop(task)
+                        in_host[host] -= 1
+                        yield url, task.result()
+            finally:
+                for task in running:
+                    task.cancel()
+                if running:
+                    await asyncio.gather(*running, return_exceptions=True)
+
+    def get_sources(
+        self,
+        urls: Iterable[str],
+        *,
+        concurrency: int = 16,
+        per_host: Optional[int] = None,
+    ) -> Dict[str, ScrapeResult]:
+        """
+        Blocking `get_sources_async`: ``{url: ScrapeResult}`` in input order.
+        Runs on a private loop whose session is closed before returning.
+        """
+        urls = list(urls)
+
+        async def _collect() -> Dict[str, ScrapeResult]:
+            got = {}
+            try:
+                async for url, res in self.get_sources_async(
+                    urls, concurrency=concurrency, per_host=per_host
+                ):
+                    got[url] = res
+            finally:
+                await self._close_loop_session(asyncio.get_running_loop())
+            return got
+
+        got = asyncio.run(_collect())
+        return {u: got[u] for u in urls}
+
     def test_unlocker(self) -> ScrapeResult:
         """
         Tests retrieving example.com. Returns ScrapeResult.
@@ -1,12 +1,55 @@
 """
 BrightData Web Scraper API module
+
+Names are imported on first access, so ``from brightdata.webscraper_api
+import register`` does not load the engine, the caches or the scheduler.
 """
 
-from .base_specialized_scraper import BrightdataBaseSpecializedScraper
-from .registry import register, get_scraper_for
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+_LAZY = {
+    'BrightdataBaseSpecializedScraper': '.base_specialized_scraper',
+    'register':                         '.registry',
+    'get_scraper_for':                  '.registry',
+    'get_router':                       '.registry',
+    'UrlRouter':                        '.router',
+    'Route':                            '.router',
+    'SnapshotScheduler':                '.scheduler',
+    'TriggerCoalescer':                 '.coalescer',
+    'MemoryResultCache':                '.cache',
+    'SQLiteResultCache':                '.cache',
+    'RateGovernor':                     '.governor',
+    'EndpointLimit':                    '.governor',
+    'RetryPolicy':                      '.retry',
+    'JobJournal':                       '.journal',
+}
+
+__all__ = list(_LAZY)
+
+
+def __getattr__(name: str) -> Any:
+    module = _LAZY.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
+
 
-__all__ = [
-    'BrightdataBaseSpecializedScraper',
-    'register',
-    'get_scraper_for',
-]
\ No newline at end of file
+if TYPE_CHECKING:
+    from .base_specialized_scraper import BrightdataBaseSpecializedScraper
+    from .registry import register, get_scraper_for, get_router
+    from .router import UrlRouter, Route
+    from .scheduler import SnapshotScheduler
+    from .coalescer import TriggerCoalescer
+    from .cache import MemoryResultCache, SQLiteResultCache
+    from .governor import RateGovernor, EndpointLimit
+    from .retry import RetryPolicy
+    from .journal import JobJournal
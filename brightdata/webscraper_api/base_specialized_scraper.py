@@ -1,7 +1,7 @@
 # brightdata/base_specialized_scraper.py  – patched
 
 from __future__ import annotations
-import asyncio, logging, requests
+import asyncio, logging
 from typing import Any, Dict, List, Optional, Union
 from typing import Dict, List, Any, Optional, Tuple, Pattern
 from collections import defaultdict
@@ -21,9 +21,16 @@ class BrightdataBaseSpecializedScraper:
     status_base_url  = "https://api.brightdata.com/datasets/v3/progress"
     result_base_url  = "https://api.brightdata.com/datasets/v3/snapshot"
 
-    def __init__(self, dataset_id: str, bearer_token: Optional[str] = None):
+    def __init__(
+        self,
+        dataset_id: str,
+        bearer_token: Optional[str] = None,
+        *,
+        coalescer=None,                           # TriggerCoalescer (async only)
+    ):
         self.dataset_id = dataset_id
         self._engine    = get_engine(bearer_token)
+        self._coalescer = coalescer
 
     # ─────────────────────────── trigger (sync) ────────────────────────────
     def trigger(
@@ -54,7 +61,8 @@ class BrightdataBaseSpecializedScraper:
         extra_params: Optional[Dict[str, Any]] = None,
     ) -> Optional[str]:
         ds = dataset_id or self.dataset_id
-        return await self._engine.trigger(
+        sender = self._coalescer or self._engine
+        return await sender.trigger(
             payload,
             dataset_id=ds,
             include_errors=include_errors,
@@ -113,6 +121,7 @@ class BrightdataBaseSpecializedScraper:
         return await self._trigger_async([{"url": u} for u in urls])
 
     def test_connection(self) -> tuple[bool, Optional[str]]:
+        import requests
         try:
             r = requests.head(self.trigger_url,
                               params={"dataset_id": self.dataset_id},
@@ -173,7 +182,7 @@ class BrightdataBaseSpecializedScraper:
             self,
             snapshot_id: str,
             *,
-            poll_interval: int = 10,
+            poll_interval: Optional[float] = None,
             timeout: int = 600,
         ) -> ScrapeResult:
         """Blocking helper that delegates entirely to engine.poll_until_ready."""
@@ -189,7 +198,7 @@ class BrightdataBaseSpecializedScraper:
         self,
         snapshot_id: str,
         *,
-        poll_interval: int = 10,
+        poll_interval: Optional[float] = None,
         timeout: int = 600,
     ) -> ScrapeResult:
         
@@ -0,0 +1,299 @@
+# brightdata/webscraper_api/cache.py
+"""
+brightdata.webscraper_api.cache
+===============================
+Result cache in front of `BrightdataEngine.trigger` / `fetch_result`.
+
+Re-scraping the same product page or profile a few times a day costs
+``COST_PER_RECORD`` every time.  With a cache attached
+
+    engine = get_engine(cache=SQLiteResultCache(ttls={"gd_l7q7dkf244hwjntr0": 6 * 3600}))
+
+the engine looks every trigger up by
+
+    key = dataset_id + sha256(canonical payload, include_errors, extra_params)
+
+and on a hit returns a *synthetic* snapshot-id (``cache_<hash>``).  That id
+is "ready" immediately – `get_status`, `poll_until_ready`, the
+`SnapshotScheduler` and `fetch_result` all answer it without a single HTTP
+call, and the returned `ScrapeResult` has ``cache_hit=True`` and ``cost=0``.
+Successful real fetches are written back with the dataset's TTL.
+
+Backends
+--------
+`MemoryResultCache`  bounded in-process LRU
+`SQLiteResultCache`  one file on disk, shared across processes / restarts
+                     (results stored as JSON – nothing is unpickled)
+"""
+
+from __future__ import annotations
+
+import abc
+import dataclasses
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+import urllib.parse
+from collections import OrderedDict
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Mapping, Optional, Tuple, Union
+
+from brightdata.models import ScrapeResult
+from brightdata.utils.env import getenv
+
+CACHE_SID_PREFIX = "cache_"
+
+
+# ──────────────────────────────────────────────────────────────────────────
+# key derivation
+# ──────────────────────────────────────────────────────────────────────────
+def _normalise_url(url: str) -> str:
+    """Lower-case scheme/host, drop the fragment and a trailing slash."""
+    parts = urllib.parse.urlsplit(url.strip())
+    path  = parts.path.rstrip("/") or "/"
+    return urllib.parse.urlunsplit(
+        (parts.scheme.lower(), parts.netloc.lower(), path, parts.query, "")
+    )
+
+
+def _normalise_record(record: Mapping[str, Any]) -> Dict[str, Any]:
+    out = {}
+    for k, v in record.items():
+        if isinstance(v, str):
+            v = v.strip()
+            if k == "url":
+                v = _normalise_url(v)
+        out[k] = v
+    return out
+
+
+def cache_key(
+    dataset_id: str,
+    payload: List[Dict[str, Any]],
+    *,
+    include_errors: bool = True,
+    extra_params: Optional[Dict[str, Any]] = None,
+) -> str:
+    """
+    ``"<dataset_id>:<sha256>"`` of the canonicalised trigger.
+
+    Record order does not matter; whitespace around values and URL casing /
+    fragments are ignored.
+    """
+    records = sorted(
+        json.dumps(_normalise_record(r), sort_keys=True, separators=(",", ":"))
+        for r in payload
+    )
+    blob = json.dumps(
+        [records, bool(include_errors), extra_params or {}],
+        sort_keys=True,
+        separators=(",", ":"),
+    )
+    return f"{dataset_id}:{hashlib.sha256(blob.encode()).hexdigest()}"
+
+
+def cache_sid(key: str) -> str:
+    """
+    Synthetic snapshot-id under which a cache hit is served.  Hashed from
+    the whole key, dataset id included – the same payload sent to two
+    datasets gets two sids.
+    """
+    return CACHE_SID_PREFIX + hashlib.sha256(key.encode()).hexdigest()[:32]
+
+
+# ──────────────────────────────────────────────────────────────────────────
+# backends
+# ──────────────────────────────────────────────────────────────────────────
+class ResultCache(abc.ABC):
+    """
+    Base class – subclasses implement `_load`, `_store` and `clear`.
+
+    Parameters
+    ----------
+    default_ttl : seconds a result stays valid (None → forever)
+    ttls        : per-dataset_id overrides of *default_ttl*
+    """
+
+    def __init__(
+        self,
+        *,
+        default_ttl: Optional[float] = 24 * 3600,
+        ttls: Optional[Mapping[str, Optional[float]]] = None,
+    ):
+        self.default_ttl = default_ttl
+        self.ttls: Dict[str, Optional[float]] = dict(ttls or {})
+        self.hits   = 0
+        self.misses = 0
+
+    def ttl_for(self, dataset_id: Optional[str]) -> Optional[float]:
+        return self.ttls.get(dataset_id, self.default_ttl) if dataset_id else self.default_ttl
+
+    def get(self, key: str) -> Optional[ScrapeResult]:
+        """Cached result for *key*, or None when missing / expired."""
+        hit = self._load(key, time.time())
+        if hit is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return hit
+
+    def set(self, key: str, result: ScrapeResult, *, dataset_id: Optional[str] = None) -> None:
+        """Store a successful *result*; failures are never cached."""
+        if not result.success or result.status != "ready":
+            return
+        ttl = self.ttl_for(dataset_id or key.split(":", 1)[0])
+        if ttl is not None and ttl <= 0:
+            return
+        expires_at = time.time() + ttl if ttl is not None else None
+        self._store(key, dataclasses.replace(result, cache_hit=False), expires_at)
+
+    # ── backend hooks ──
+    @abc.abstractmethod
+    def _load(self, key: str, now: float) -> Optional[ScrapeResult]:
+        """Unexpired result stored under *key*, or None."""
+
+    @abc.abstractmethod
+    def _store(self, key: str, result: ScrapeResult, expires_at: Optional[float]) -> None:
+        """Keep *result* under *key* until *expires_at* (None → forever)."""
+
+    @abc.abstractmethod
+    def clear(self) -> None:
+        """Drop every entry."""
+
+
+class MemoryResultCache(ResultCache):
+    """In-process LRU holding at most *max_entries* results."""
+
+    def __init__(self, max_entries: int = 1024, **kw: Any):
+        super().__init__(**kw)
+        self.max_entries = max_entries
+        self._data: "OrderedDict[str, Tuple[Optional[float], ScrapeResult]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def _load(self, key: str, now: float) -> Optional[ScrapeResult]:
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return None
+            expires_at, result = entry
+            if expires_at is not None and expires_at <= now:
+                del self._data[key]
+                return None
+            self._data.move_to_end(key)
+            return result
+
+    def _store(self, key: str, result: ScrapeResult, expires_at: Optional[float]) -> None:
+        with self._lock:
+            self._data[key] = (expires_at, result)
+            self._data.move_to_end(key)
+            while len(self._data) > self.max_entries:
+                self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+
+class SQLiteResultCache(ResultCache):
+    """
+    Results stored as JSON in one SQLite file (default
+    ``~/.cache/brightdata/results.sqlite``, or ``$BRIGHTDATA_CACHE``).
+    Rows that do not decode (e.g. written by an older, pickling version)
+    count as misses and are deleted.
+    """
+
+    def __init__(self, path: Union[str, Path, None] = None, **kw: Any):
+        super().__init__(**kw)
+        path = path or getenv("BRIGHTDATA_CACHE") or "~/.cache/brightdata/results.sqlite"
+        self.path = Path(path).expanduser()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        with self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS results ("
+                " key TEXT PRIMARY KEY,"
+                " dataset_id TEXT,"
+                " expires_at REAL,"
+                " stored_at REAL NOT NULL,"
+                " result BLOB NOT NULL)"
+            )
+
+    def _load(self, key: str, now: float) -> Optional[ScrapeResult]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT expires_at, result FROM results WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            expires_at, blob = row
+            result = None
+            if expires_at is None or expires_at > now:
+                try:
+                    result = _result_from_json(blob)
+                except (ValueError, TypeError):
+                    pass
+            if result is None:
+                with self._conn:
+                    self._conn.execute("DELETE FROM results WHERE key = ?", (key,))
+        return result
+
+    def _store(self, key: str, result: ScrapeResult, expires_at: Optional[float]) -> None:
+        blob = _result_to_json(result)
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO results VALUES (?, ?, ?, ?, ?)",
+                (key, key.split(":", 1)[0], expires_at, time.time(), blob),
+            )
+
+    def purge_expired(self) -> int:
+        """Delete expired rows; returns how many were removed."""
+        with self._lock, self._conn:
+            cur = self._conn.execute(
+                "DELETE FROM results WHERE expires_at IS NOT NULL AND expires_at <= ?",
+                (time.time(),),
+            )
+            return cur.rowcount
+
+    def clear(self) -> None:
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM results")
+
+    def close(self) -> None:
+        self._conn.close()
+
+
+# ──────────────────────────────────────────────────────────────────────────
+# JSON (de)serialisation of ScrapeResult
+# ──────────────────────────────────────────────────────────────────────────
+_DATETIME_TAG = "__datetime__"
+
+
+def _encode_datetime(obj: Any) -> Any:
+    if isinstance(obj, datetime):
+        return {_DATETIME_TAG: obj.isoformat()}
+    raise TypeError(f"{type(obj).__name__} is not JSON serialisable")
+
+
+def _decode_datetime(obj: Dict[str, Any]) -> Any:
+    if len(obj) == 1 and _DATETIME_TAG in obj:
+        return datetime.fromisoformat(obj[_DATETIME_TAG])
+    return obj
+
+
+def _result_to_json(result: ScrapeResult) -> str:
+    fields = {f.name: getattr(result, f.name) for f in dataclasses.fields(result)}
+    return json.dumps(fields, ensure_ascii=False, default=_encode_datetime)
+
+
+def _result_from_json(blob: Union[str, bytes]) -> ScrapeResult:
+    fields = json.loads(blob, object_hook=_decode_datetime)
+    known  = {f.name for f in dataclasses.fields(ScrapeResult)}
+    return ScrapeResult(**{k: v for k, v in fields.items() if k in known})
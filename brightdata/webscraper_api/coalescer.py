@@ -0,0 +1,218 @@
+# brightdata/webscraper_api/coalescer.py
+"""
+brightdata.webscraper_api.coalescer
+===================================
+Merge many single-URL triggers into one multi-record POST /trigger.
+
+Every scraper's ``collect_by_url`` triggers **one snapshot per URL** even
+though `/trigger` happily accepts a list payload.  A `TriggerCoalescer`
+sits in front of `BrightdataEngine.trigger` (same signature) and
+
+1. buffers the payload records per (dataset_id, trigger params),
+2. flushes a bucket after *window* seconds or once it holds *max_batch*
+   records – whatever comes first,
+3. hands **the same snapshot_id** back to every caller of that batch.
+
+Because all URLs of a batch share a snapshot, the snapshot's rows have to be
+split back to the URL that asked for them – `split_result_by_input` does that
+by matching each row's ``input.url`` (or ``url``) field.
+
+    coalescer = TriggerCoalescer(get_engine(), window=0.25, max_batch=200)
+    scraper   = AmazonScraper(coalescer=coalescer)
+    sids      = await asyncio.gather(*(scraper.collect_by_url_async(u) for u in urls))
+    # → len(set(sids)) == 1  (one trigger, one snapshot)
+
+Coalescing needs all callers on one event loop, so only the *async*
+trigger path (``_trigger_async``) goes through it.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import dataclasses
+import json
+import logging
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from brightdata.models import ScrapeResult
+
+log = logging.getLogger(__name__)
+
+_Key = Tuple[str, bool, str]            # (dataset_id, include_errors, extra_params json)
+
+
+class _Batch:
+    __slots__ = ("records", "future", "timer")
+
+    def __init__(self, future: asyncio.Future):
+        self.records: List[Dict[str, Any]] = []
+        self.future = future
+        self.timer: Optional[asyncio.TimerHandle] = None
+
+
+class TriggerCoalescer:
+    """
+    Drop-in for ``engine.trigger`` that batches records across callers.
+
+    Parameters
+    ----------
+    engine    : the `BrightdataEngine` that performs the real POST
+    window    : seconds a bucket may wait for more records before flushing
+    max_batch : flush immediately once a bucket holds this many records
+    """
+
+    def __init__(self, engine, *, window: float = 0.25, max_batch: int = 500):
+        if max_batch < 1:
+            raise ValueError("max_batch must be ≥ 1")
+        self._engine   = engine
+        self.window    = window
+        self.max_batch = max_batch
+
+        self._buckets: Dict[_Key, _Batch] = {}
+        self._flushing: set[asyncio.Task] = set()
+
+        # counters (records in vs. POSTs out)
+        self.records_in   = 0
+        self.triggers_out = 0
+
+    # ───────────────────────────── public API ─────────────────────────────
+    async def trigger(
+        self,
+        payload: List[Dict[str, Any]],
+        *,
+        dataset_id: str,
+        include_errors: bool = True,
+        extra_params: Optional[Dict[str, Any]] = None,
+    ) -> Optional[str]:
+        """Buffer *payload* and return the snapshot_id of the batch it joined."""
+        key: _Key = (
+            dataset_id,
+            include_errors,
+            json.dumps(extra_params or {}, sort_keys=True),
+        )
+        batch = self._buckets.get(key)
+        if batch is None:
+            batch = _Batch(asyncio.get_running_loop().create_future())
+            batch.timer = asyncio.get_running_loop().call_later(
+                self.window, self._start_flush, key
+            )
+            self._buckets[key] = batch
+
+        batch.records.extend(payload)
+        self.records_in += len(payload)
+        fut = batch.future
+        if len(batch.records) >= self.max_batch:
+            self._start_flush(key)
+        return await asyncio.shield(fut)
+
+    async def flush(self) -> None:
+        """Send every buffered bucket now and wait for the POSTs to finish."""
+        for key in list(self._buckets):
+            self._start_flush(key)
+        if self._flushing:
+            await asyncio.gather(*self._flushing, return_exceptions=True)
+
+    async def close(self) -> None:
+        await self.flush()
+
+    async def __aenter__(self) -> "TriggerCoalescer":
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> bool:
+        await self.close()
+        return False
+
+    # ───────────────────────────── internals ──────────────────────────────
+    def _start_flush(self, key: _Key) -> None:
+        batch = self._buckets.pop(key, None)
+        if batch is None:
+            return
+        if batch.timer is not None:
+            batch.timer.cancel()
+        task = asyncio.get_running_loop().create_task(self._send(key, batch))
+        self._flushing.add(task)
+        task.add_done_callback(self._flushing.discard)
+
+    async def _send(self, key: _Key, batch: _Batch) -> None:
+        dataset_id, include_errors, extra_json = key
+        try:
+            sid = await self._engine.trigger(
+                batch.records,
+                dataset_id=dataset_id,
+                include_errors=include_errors,
+                extra_params=json.loads(extra_json) or None,
+            )
+        except Exception as exc:
+            if not batch.future.done():
+                batch.future.set_exception(exc)
+            return
+        self.triggers_out += 1
+        log.debug("coalesced %d records → %s (%s)", len(batch.records), sid, dataset_id)
+        if not batch.future.done():
+            batch.future.set_result(sid)
+
+
+# ──────────────────────────────────────────────────────────────────────────
+# splitting a shared snapshot back to its originating URLs
+# ──────────────────────────────────────────────────────────────────────────
+def _row_input_url(row: Any) -> Optional[str]:
+    if not isinstance(row, dict):
+        return None
+    inp = row.get("input")
+    if isinstance(inp, dict) and inp.get("url"):
+        return inp["url"]
+    return row.get("url")
+
+
+def split_result_by_input(
+    result: ScrapeResult,
+    urls: Iterable[str],
+    *,
+    cost_per_record: Optional[float] = None,
+) -> Dict[str, ScrapeResult]:
+    """
+    Split one (coalesced) snapshot result into a ScrapeResult per input URL.
+
+    Rows are matched on ``row["input"]["url"]`` (Bright Data echoes the
+    trigger record there) and fall back to ``row["url"]``.  Each per-URL copy
+    gets its own ``url``, ``data``, ``row_count``, ``field_count`` and ``cost``;
+    all timing / snapshot fields are shared.  An input no row matched is a
+    failure (``error="no matching record"``), not an empty success.
+    """
+    urls = list(urls)
+    if not isinstance(result.data, list):
+        return {u: dataclasses.replace(result, url=u) for u in urls}
+
+    by_url: Dict[str, List[Any]] = {u: [] for u in urls}
+    for row in result.data:
+        u = _row_input_url(row)
+        if u in by_url:
+            by_url[u].append(row)
+
+    if cost_per_record is None and result.cost is not None and result.row_count:
+        cost_per_record = result.cost / result.row_count
+
+    out: Dict[str, ScrapeResult] = {}
+    for u, rows in by_url.items():
+        if result.success and not rows:
+            out[u] = dataclasses.replace(
+                result,
+                url=u,
+                success=False,
+                status="error",
+                error="no matching record",
+                data=None,
+                row_count=0,
+                field_count=0,
+                cost=0.0 if cost_per_record is not None else result.cost,
+            )
+            continue
+        out[u] = dataclasses.replace(
+            result,
+            url=u,
+            data=rows,
+            row_count=len(rows),
+            field_count=len(rows[0]) if rows and isinstance(rows[0], dict) else 0,
+            cost=len(rows) * cost_per_record if cost_per_record is not None else result.cost,
+        )
+    return out
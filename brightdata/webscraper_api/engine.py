@@ -5,52 +5,297 @@ from __future__ import annotations
 brightdata.engine
 =================
 One central, async-only helper that owns every low-level detail of talking to
-Bright Data’s *dataset* API—**without** a long-lived session.
+Bright Data’s *dataset* API.
 
-► Creates a fresh `aiohttp.ClientSession` per call  
+► Creates a fresh `aiohttp.ClientSession` per call (default), **or** owns one
+  pooled, keep-alive session per event-loop when built with ``pooled=True``  
 ► Generates monotonically-increasing trace-IDs  
 ► Triggers jobs (`sync_mode=async` by default)  
-► Polls `/progress/{snapshot_id}`  
-► Downloads `/snapshot/{snapshot_id}`  
+► Polls `/progress/{snapshot_id}` (adaptive interval, see poll_policy)  
+► Downloads `/snapshot/{snapshot_id}` (whole body, streamed as NDJSON, or
+  straight to disk via `download_snapshot_to`)  
+► Rate-limits every endpoint class and backs off on 429 (see governor)  
 ► Records rich timing metadata for every snapshot  
+► Optional result cache (see cache) – repeated triggers cost no API call  
+► Optional job journal (see journal) – restarts resume instead of re-trigger  
 ► Tiny public surface for all specialized scrapers  
 """
 
 import asyncio
+import dataclasses
+import gzip
+import json
 import logging
-import os
 import ssl
 import time
 import urllib.parse
+from contextlib import asynccontextmanager
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from pathlib import Path
+from typing import Any, AsyncIterator, BinaryIO, Dict, List, Optional, Set, Union
 
 import aiohttp
-import tldextract
 
 from brightdata.models import ScrapeResult
 from brightdata.utils import _BD_URL_RE
+from brightdata.utils.domains import root_domain
+from brightdata.utils.env import getenv
+from brightdata.utils.streaming import NDJSONRowCounter, aiter_ndjson
+from brightdata.webscraper_api.cache import ResultCache, cache_key, cache_sid
+from brightdata.webscraper_api.governor import RateGovernor
+from brightdata.webscraper_api.journal import JobJournal
+from brightdata.webscraper_api.meta_store import SnapshotMetaStore
+from brightdata.webscraper_api.poll_policy import AdaptivePollPolicy
+from brightdata.webscraper_api.retry import RetryPolicy
 
 log = logging.getLogger(__name__)
 
 
 class BrightdataEngine:
-    """Process-wide engine—**no** shared session, all sessions are per-call."""
+    """
+    Process-wide engine.
+
+    By default every call opens (and closes) its own session.  With
+    ``pooled=True`` the engine owns one ``aiohttp.ClientSession`` per event
+    loop, backed by a keep-alive ``TCPConnector`` – every trigger / poll /
+    fetch then re-uses warm TCP+TLS connections.
+
+        async with BrightdataEngine(pooled=True) as eng:
+            sid = await eng.trigger(payload, dataset_id=...)
+            res = await eng.poll_until_ready(sid)
+
+    Sessions are bound to the loop that created them; a call coming from a
+    different loop (e.g. ``_run_blocking`` → ``asyncio.run`` in a thread)
+    transparently gets its own session instead of touching a foreign one.
+    """
     
-    # timing & trace metadata (still shared for introspection)
-    _snap_meta: Dict[str, Dict[str, Any]] = {}
+    # timing & trace metadata (still shared for introspection; bounded)
+    _snap_meta: SnapshotMetaStore = SnapshotMetaStore()
     _trace_lock = asyncio.Lock()
     _ctr: int = 0
     
     COST_PER_RECORD = 0.001 
+    BASE_URL = "https://api.brightdata.com/datasets/v3"
 
-    def __init__(self, bearer_token: Optional[str] = None, *, timeout: int = 40):
-        self._token = bearer_token or os.getenv("BRIGHTDATA_TOKEN")
+    def __init__(
+        self,
+        bearer_token: Optional[str] = None,
+        *,
+        timeout: int = 40,
+        pooled: bool = False,
+        limit: int = 100,
+        limit_per_host: int = 32,
+        keepalive_timeout: float = 30.0,
+        ttl_dns_cache: Optional[int] = 300,
+        poll_policy: Optional[AdaptivePollPolicy] = None,
+        cache: Optional[ResultCache] = None,
+        governor: Optional[RateGovernor] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        journal: Optional[JobJournal] = None,
+    ):
+        self._token = bearer_token or getenv("BRIGHTDATA_TOKEN")
         if not self._token:
             raise RuntimeError("Provide BRIGHTDATA_TOKEN env var or pass bearer_token")
         # client timeout for every new session
         self._timeout = aiohttp.ClientTimeout(total=timeout)
 
+        # pooled-session knobs (ignored unless pooled=True)
+        self.pooled = pooled
+        # open `pooling()` blocks per loop – pooling is switched on for that
+        # loop only, never on the (shared) engine as a whole
+        self._pooling: Dict[asyncio.AbstractEventLoop, int] = {}
+        self._connector_kw: Dict[str, Any] = {
+            "limit":             limit,
+            "limit_per_host":    limit_per_host,
+            "keepalive_timeout": keepalive_timeout,
+            "ttl_dns_cache":     ttl_dns_cache,
+            "use_dns_cache":     ttl_dns_cache is not None,
+        }
+        # learns per-dataset ready-times → adaptive poll intervals
+        self.poll_policy = poll_policy or AdaptivePollPolicy()
+        # optional result cache consulted by trigger / filled by fetch_result
+        self.cache = cache
+        # per-endpoint token buckets + in-flight caps, 429 back-off
+        self.governor = governor or RateGovernor()
+        # transient-failure retries (connect / timeout / 5xx) + "building" pacing
+        self.retry_policy = retry_policy or RetryPolicy()
+        # crash-safe record of triggered snapshots (resume after restart)
+        self.journal = journal
+
+        # one session per event loop (loop-affinity safety).  A plain dict:
+        # every session references its loop, so weak keys never die – entries
+        # are removed when the session is closed instead (see _reap_on_exit)
+        self._sessions: Dict[asyncio.AbstractEventLoop, aiohttp.ClientSession] = {}
+        self._reapers: Set[asyncio.Task] = set()
+
+    # ───────────────────────────── session handling ─────────────────────────────
+    def _new_session(self, **kw: Any) -> aiohttp.ClientSession:
+        return aiohttp.ClientSession(timeout=self._timeout, trust_env=True, **kw)
+
+    def _shared_session(self) -> aiohttp.ClientSession:
+        """Return (creating on demand) the pooled session of the running loop."""
+        loop = asyncio.get_running_loop()
+        sess = self._sessions.get(loop)
+        if sess is None or sess.closed:
+            connector = aiohttp.TCPConnector(**self._connector_kw)
+            sess = self._new_session(connector=connector)
+            self._sessions[loop] = sess
+            self._reap_on_exit(loop, sess)
+        return sess
+
+    def _reap_on_exit(self, loop: asyncio.AbstractEventLoop, sess: aiohttp.ClientSession) -> None:
+        """
+        Tie *sess* to the lifetime of *loop*: a parked task closes it when
+        the loop shuts down (``asyncio.run`` cancels every task before it
+        closes the loop) – so the throw-away loops of ``_run_blocking`` no
+        longer leave a session + connector behind each.
+        """
+        async def _reaper() -> None:
+            try:
+                await loop.create_future()          # parked until cancelled
+            finally:
+                if self._sessions.get(loop) is sess:
+                    del self._sessions[loop]
+                if not sess.closed:
+                    await sess.close()
+
+        # the loop only holds tasks weakly – keep the reaper alive ourselves
+        task = loop.create_task(_reaper(), name="brightdata-session-reaper")
+        self._reapers.add(task)
+        task.add_done_callback(self._reapers.discard)
+
+    @asynccontextmanager
+    async def _session(self) -> AsyncIterator[aiohttp.ClientSession]:
+        """
+        Yield the session a single request should use: the loop's pooled
+        session when ``pooled=True``, otherwise a throw-away one.
+        """
+        if self._use_pool():
+            yield self._shared_session()
+            return
+        async with self._new_session() as sess:
+            yield sess
+
+    def _use_pool(self) -> bool:
+        return self.pooled or self._pooling.get(asyncio.get_running_loop(), 0) > 0
+
+    async def _close_loop_session(self, loop: asyncio.AbstractEventLoop) -> None:
+        sess = self._sessions.pop(loop, None)
+        if sess is not None and not sess.closed:
+            await sess.close()
+
+    async def close(self) -> None:
+        """
+        Close the pooled session of the running loop.  Sessions of other
+        loops that are still running are closed on their own loop; sessions
+        of loops that are already gone were closed by their reaper.
+        """
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            loop = None
+        for sess_loop, sess in list(self._sessions.items()):
+            if sess_loop is loop:
+                await self._close_loop_session(loop)
+            elif not sess_loop.is_closed() and sess_loop.is_running():
+                asyncio.run_coroutine_threadsafe(self._close_loop_session(sess_loop), sess_loop)
+            else:
+                self._sessions.pop(sess_loop, None)
+
+    @asynccontextmanager
+    async def pooling(self) -> AsyncIterator["BrightdataEngine"]:
+        """
+        Use the pooled session for the duration of the block only – for
+        batch helpers that run on a caller's loop.  Pooling is switched on
+        for the running loop alone, so other callers of a shared engine on
+        other loops are unaffected.  An engine that is already pooled by its
+        owner is left untouched (the owner closes it); nested / overlapping
+        blocks on one loop share the session and the last one to leave
+        closes it.
+        """
+        if self.pooled:
+            yield self
+            return
+        loop = self._enter_pooling()
+        try:
+            yield self
+        finally:
+            await self._leave_pooling(loop)
+
+    def _enter_pooling(self) -> asyncio.AbstractEventLoop:
+        loop = asyncio.get_running_loop()
+        self._pooling[loop] = self._pooling.get(loop, 0) + 1
+        return loop
+
+    async def _leave_pooling(self, loop: asyncio.AbstractEventLoop) -> None:
+        self._pooling[loop] -= 1
+        if not self._pooling[loop]:
+            del self._pooling[loop]
+            await self._close_loop_session(loop)
+
+    @asynccontextmanager
+    async def _request(
+        self, endpoint: str, method: str, url: str, **kw: Any
+    ) -> AsyncIterator[aiohttp.ClientResponse]:
+        """
+        One governed request: waits for *endpoint*'s rate / in-flight budget,
+        retries 429s after ``Retry-After`` (or back-off), retries transient
+        failures (connect / timeout / 5xx) as ``self.retry_policy`` allows and
+        yields the final response – still open, so callers can stream the body.
+        Non-GET requests are only retried when they provably never left
+        (connection not established) or were refused with a 429.
+        """
+        started   = time.monotonic()
+        attempt   = 0                     # transient failures so far
+        throttles = 0                     # 429s so far
+        while True:
+            delay: Optional[float] = None
+            async with self._session() as sess:
+                async with self.governor.slot(endpoint):
+                    try:
+                        resp = await sess.request(method, url, **kw)
+                    except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                        # a POST that failed after it was sent (timeout,
+                        # server disconnect …) may have created the job
+                        # already – re-sending it could bill a second one
+                        ambiguous = method != "GET" and RetryPolicy.may_have_been_sent(e)
+                        delay = None if ambiguous else self.retry_policy.retry_delay(e, attempt, started)
+                        if delay is None:
+                            raise
+                        log.debug("%s %s failed (%s) – retry in %.2fs", method, url, e, delay)
+                    else:
+                        async with resp:
+                            if resp.status == 429 and throttles < self.governor.max_retries:
+                                # closes the endpoint's gate – the next slot() waits it out
+                                self.governor.throttled(
+                                    endpoint, resp.headers.get("Retry-After"), throttles
+                                )
+                                throttles += 1
+                                continue
+                            # a 5xx to a POST is just as ambiguous: the job
+                            # may exist although the answer says otherwise
+                            if resp.status >= 500 and method == "GET":
+                                delay = self.retry_policy.retry_delay(resp.status, attempt, started)
+                            if delay is None:
+                                yield resp
+                                return
+                            log.debug("%s %s → %d – retry in %.2fs", method, url, resp.status, delay)
+            attempt += 1
+            await asyncio.sleep(delay)
+
+    async def __aenter__(self) -> "BrightdataEngine":
+        # like `pooling()`: the (possibly shared) engine itself stays as it was
+        if not self.pooled:
+            self._enter_pooling()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> bool:
+        if self.pooled:
+            await self.close()
+        else:
+            await self._leave_pooling(asyncio.get_running_loop())
+        return False
+
     async def _next_trace_id(self) -> str:
         async with BrightdataEngine._trace_lock:
             BrightdataEngine._ctr += 1
@@ -81,45 +326,75 @@ class BrightdataEngine:
             **(extra_params or {}),
         }
 
-        sent_at  = datetime.utcnow()
+        sent_at  = time.time()
         trace_id = await self._next_trace_id()
+        first_url     = payload[0].get("url", "") if payload else ""
 
-        url = "https://api.brightdata.com/datasets/v3/trigger"
+        # ------------------- cache hit: no API call at all ---------------
+        key = None
+        if self.cache is not None:
+            key = cache_key(dataset_id, payload,
+                            include_errors=include_errors, extra_params=extra_params)
+            hit = self.cache.get(key)
+            if hit is not None:
+                sid = cache_sid(key)
+                BrightdataEngine._snap_meta.create(
+                    sid,
+                    trace_id                = trace_id,
+                    dataset_id              = dataset_id,
+                    request_sent_at         = sent_at,
+                    snapshot_id_received_at = sent_at,
+                    data_received_at        = sent_at,
+                    root_override           = root_domain(first_url),
+                    cached                  = hit,
+                )
+                return sid
+
+        # ------------- journal: same input still pending from a prior run -------
+        if self.journal is not None:
+            key = key or cache_key(dataset_id, payload,
+                                   include_errors=include_errors, extra_params=extra_params)
+            prior = self.journal.pending_for(key)
+            if prior is not None:
+                self.restore_meta(prior)
+                return prior["sid"]
+
+        url = f"{self.BASE_URL}/trigger"
         headers = {
             "Authorization": f"Bearer {self._token}",
             "Content-Type":  "application/json",
         }
 
-        # ─────────────── one brand-new session per call ────────────────
-        async with aiohttp.ClientSession(
-            timeout=self._timeout,
-            headers=headers,
-            trust_env=True,
-        ) as sess:
-            try:
-                async with sess.post(url, params=params, json=payload) as resp:
-                    resp.raise_for_status()
-                    data = await resp.json()
-
-            # ── special case: SSL root CA missing on the host machine ──
-            except aiohttp.ClientConnectorCertificateError as e:
-                raise RuntimeError(
-                    "SSL certificate verification failed while contacting "
-                    "api.brightdata.com.  On macOS this usually means the Python "
-                    "installation is missing the system root certificates.  "
-                    "Run the ‘Install Certificates.command’ that ships with "
-                    "the official python.org installer, or try:\n"
-                    "    python -m pip install --upgrade certifi"
-                ) from e
-            except ssl.SSLCertVerificationError as e:        # defence-in-depth
-                raise RuntimeError(
-                    f"SSL certificate verification failed: {e}"
-                ) from e
-
-            # ── any other network / HTTP error: legacy behaviour ─────────
-            except Exception as e:
+        # ───────── governed request on the per-call / pooled session ─────────
+        try:
+            async with self._request(
+                "trigger", "POST", url, params=params, json=payload, headers=headers
+            ) as resp:
+                resp.raise_for_status()
+                data = await resp.json()
+
+        # ── special case: SSL root CA missing on the host machine ──
+        except aiohttp.ClientConnectorCertificateError as e:
+            raise RuntimeError(
+                "SSL certificate verification failed while contacting "
+                "api.brightdata.com.  On macOS this usually means the Python "
+                "installation is missing the system root certificates.  "
+                "Run the ‘Install Certificates.command’ that ships with "
+                "the official python.org installer, or try:\n"
+                "    python -m pip install --upgrade certifi"
+            ) from e
+        except ssl.SSLCertVerificationError as e:        # defence-in-depth
+            raise RuntimeError(
+                f"SSL certificate verification failed: {e}"
+            ) from e
+
+        # ── any other network / HTTP error: legacy behaviour ─────────
+        except Exception as e:
+            if isinstance(e, aiohttp.ClientResponseError) and e.status == 429:
+                log.warning("trigger %s still throttled (429) after retries", dataset_id)
+            else:
                 log.debug("trigger %s failed: %s", dataset_id, e)
-                return None
+            return None
 
         # ------------------- happy path: got a snapshot_id ---------------
         sid = data.get("snapshot_id")
@@ -128,102 +403,43 @@ class BrightdataEngine:
             return None
 
         # record timing / trace metadata
-        first_url     = payload[0].get("url", "") if payload else ""
-        root_override = tldextract.extract(first_url).domain or None
-        BrightdataEngine._snap_meta[sid] = {
-            "trace_id":                trace_id,
-            "request_sent_at":         sent_at,
-            "snapshot_id_received_at": datetime.utcnow(),
-            "snapshot_polled_at":      [],
-            "data_received_at":        None,
-            "root_override":           root_override,
-        }
+        root_override = root_domain(first_url)
+        BrightdataEngine._snap_meta.create(
+            sid,
+            trace_id                = trace_id,
+            dataset_id              = dataset_id,
+            request_sent_at         = sent_at,
+            snapshot_id_received_at = time.time(),
+            root_override           = root_override,
+            cache_key               = key,
+        )
+        if self.journal is not None:
+            self.journal.record_trigger(sid, dataset_id=dataset_id, payload=payload, key=key)
         return sid
 
-    # async def trigger(
-    #     self,
-    #     payload: List[dict[str, Any]],
-    #     *,
-    #     dataset_id: str,
-    #     include_errors: bool = True,
-    #     extra_params: Optional[Dict[str, Any]] = None,
-    # ) -> Optional[str]:
-    #     """
-    #     POST to /trigger (always async mode) → returns snapshot_id or None.
-    #     """
-    #     params = {
-    #         "dataset_id":      dataset_id,
-    #         "include_errors":  str(include_errors).lower(),
-    #         "format":          "json",
-    #         "sync_mode":       "async",
-    #         **(extra_params or {}),
-    #     }
-
-    #     sent_at  = datetime.utcnow()
-    #     trace_id = await self._next_trace_id()
-
-    #     url = "https://api.brightdata.com/datasets/v3/trigger"
-    #     headers = {
-    #         "Authorization": f"Bearer {self._token}",
-    #         "Content-Type":  "application/json",
-    #     }
-
-    #     # **new session per call**
-    #     async with aiohttp.ClientSession(
-    #         timeout=self._timeout,
-    #         headers=headers,
-    #         trust_env=True,
-    #     ) as sess:
-    #         try:
-    #             async with sess.post(url, params=params, json=payload) as resp:
-    #                 resp.raise_for_status()
-    #                 data = await resp.json()
-    #         except Exception as e:
-    #             log.debug("trigger %s failed: %s", dataset_id, e)
-    #             return None
-
-    #     sid = data.get("snapshot_id")
-    #     if not sid:
-    #         log.debug("trigger response w/o snapshot_id: %s", data)
-    #         return None
-
-    #     # record metadata
-    #     first_url      = payload[0].get("url", "") if payload else ""
-    #     root_override  = tldextract.extract(first_url).domain or None
-    #     BrightdataEngine._snap_meta[sid] = {
-    #         "trace_id":                 trace_id,
-    #         "request_sent_at":          sent_at,
-    #         "snapshot_id_received_at":  datetime.utcnow(),
-    #         "snapshot_polled_at":       [],
-    #         "data_received_at":         None,
-    #         "root_override":            root_override,
-    #     }
-    #     return sid
-
     async def get_status(self, snapshot_id: str) -> str:
         """
         One GET to /progress/{snapshot_id} → returns status string.
         """
-        url = f"https://api.brightdata.com/datasets/v3/progress/{snapshot_id}"
+        if self._cached_result(snapshot_id) is not None:
+            return "ready"
+        url = f"{self.BASE_URL}/progress/{snapshot_id}"
         headers = {"Authorization": f"Bearer {self._token}"}
 
-        async with aiohttp.ClientSession(
-            timeout=self._timeout,
-            headers=headers,
-            trust_env=True,
-        ) as sess:
-            try:
-                async with sess.get(url) as resp:
-                    resp.raise_for_status()
-                    data = await resp.json()
-                    status = data.get("status", "unknown").lower()
-            except Exception as e:
-                log.debug("status poll %s error: %s", snapshot_id, e)
-                status = "error"
-
-        BrightdataEngine._snap_meta.setdefault(snapshot_id, {}) \
-                                  .setdefault("snapshot_polled_at", []) \
-                                  .append(datetime.utcnow())
+        try:
+            async with self._request("progress", "GET", url, headers=headers) as resp:
+                resp.raise_for_status()
+                data = await resp.json()
+                status = data.get("status", "unknown").lower()
+        except Exception as e:
+            # retries are exhausted; a transient failure says nothing about
+            # the job itself → "unknown" keeps pollers going, 4xx is final
+            log.debug("status poll %s error: %s", snapshot_id, e)
+            status = "unknown" if self.retry_policy.is_transient(e) else "error"
+
+        BrightdataEngine._snap_meta.record_poll(snapshot_id)
+        if status in ("failed", "error"):
+            self._journal_outcome(snapshot_id, False, f"status_{status}")
         return status
     
 
@@ -232,31 +448,44 @@ class BrightdataEngine:
         GET /snapshot/{snapshot_id} and return a ScrapeResult.
 
         If the body still says {"status": "building"}, the request is retried
-        every 2 s until real data arrives (or an HTTP/error response occurs).
+        with growing delays until real data arrives, an HTTP/error response
+        occurs or ``retry_policy.building_timeout`` passes.  Transient
+        failures are retried inside `_request` only (as the policy allows).
+        Cache hits (see `trigger`) are answered without any request.
         """
-        url     = f"https://api.brightdata.com/datasets/v3/snapshot/{snapshot_id}?format=json"
+        cached = self._cached_result(snapshot_id)
+        if cached is not None:
+            BrightdataEngine._snap_meta.mark_delivered(snapshot_id)
+            return cached
+
+        url     = f"{self.BASE_URL}/snapshot/{snapshot_id}?format=json"
         headers = {"Authorization": f"Bearer {self._token}"}
 
+        policy   = self.retry_policy
+        started  = time.monotonic()
+        building = 0
+
         # ------------------------ download loop ------------------------
         while True:
             try:
-                async with aiohttp.ClientSession(
-                    timeout=self._timeout,
-                    headers=headers,
-                    trust_env=True,
-                ) as sess:
-                    async with sess.get(url) as resp:
-                        resp.raise_for_status()
-                        data = await resp.json()
+                async with self._request("snapshot", "GET", url, headers=headers) as resp:
+                    resp.raise_for_status()
+                    data = await resp.json()
 
                 # Bright Data sometimes returns a placeholder:
                 #   {"status":"building","message":"Snapshot is building …"}
                 if isinstance(data, dict) and data.get("status") == "building":
-                    await asyncio.sleep(2)        # short pause, then retry
+                    if time.monotonic() - started >= policy.building_timeout:
+                        ok, status, error, data = False, "error", "building_timeout", None
+                        break
+                    await asyncio.sleep(policy.building_delay(building))
+                    building += 1
                     continue
 
                 ok, status, error = True, "ready", None
-                BrightdataEngine._snap_meta[snapshot_id]["data_received_at"] = datetime.utcnow()
+                meta = BrightdataEngine._snap_meta.ensure(snapshot_id)
+                meta.record_data()
+                self.poll_policy.observe_meta(meta)
             except aiohttp.ClientResponseError as e:
                 ok, status, error, data = False, "error", f"http_{e.status}", None
             except Exception as e:
@@ -294,77 +523,196 @@ class BrightdataEngine:
             row_count     = row_count,
             field_count   = field_count,
         )
+        meta = BrightdataEngine._snap_meta.get(snapshot_id)
+        if ok and self.cache is not None and meta is not None and meta.cache_key:
+            self.cache.set(meta.cache_key, scrape_res, dataset_id=meta.dataset_id)
+        self._journal_outcome(snapshot_id, ok, error)
+        BrightdataEngine._snap_meta.mark_delivered(snapshot_id)
         return scrape_res
     
-    # async def fetch_result(self, snapshot_id: str) -> ScrapeResult:
-    #     """
-    #     One GET to /snapshot/{snapshot_id} → returns a ScrapeResult.
-    #     """
-    #     url = f"https://api.brightdata.com/datasets/v3/snapshot/{snapshot_id}?format=json"
-    #     headers = {"Authorization": f"Bearer {self._token}"}
-
-    #     async with aiohttp.ClientSession(
-    #         timeout=self._timeout,
-    #         headers=headers,
-    #         trust_env=True,
-    #     ) as sess:
-    #         try:
-    #             async with sess.get(url) as resp:
-    #                 resp.raise_for_status()
-    #                 data = await resp.json()
-    #             ok, status, error = True, "ready", None
-    #             BrightdataEngine._snap_meta[snapshot_id]["data_received_at"] = datetime.utcnow()
-    #         except aiohttp.ClientResponseError as e:
-    #             ok, status, error, data = False, "error", f"http_{e.status}", None
-    #         except Exception as e:
-    #             ok, status, error, data = False, "error", "fetch_error", None
-    #             log.debug("fetch_result %s error: %s", snapshot_id, e)
-
-    #     cost: Optional[float] = None
-    #     row_count: Optional[int] = None
-    #     field_count: Optional[int] = None
-        
-        
-    #     if isinstance(data, list):
-    #         row_count = len(data)
-    #         cost      = row_count * self.COST_PER_RECORD
-    #         if data and isinstance(data[0], dict):
-    #                 field_count = len(data[0])
-
-    #     elif isinstance(data, dict):
-    #         row_count = 1
-    #         cost      = 1 * self.COST_PER_RECORD
-    #         field_count = len(data)
-    #     else:
-    #         row_count = 0
-    #         cost      = 0.0
-    #         field_count = 0
-
-    #     scrape_res =self._make_result(
-    #         success=ok,
-    #         status=status,
-    #         snapshot_id=snapshot_id,
-    #         url=url,
-    #         data=data,
-    #         error=error,
-    #         cost=cost,
-    #         row_count=row_count,
-    #         field_count=field_count,
-    #     )
-    #     return scrape_res
-    
+    async def iter_result(
+        self,
+        snapshot_id: str,
+        *,
+        chunk_size: int = 64 * 1024,
+        building_retry: Optional[float] = None,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Stream GET /snapshot/{snapshot_id}?format=jsonl and yield the rows one
+        at a time – memory stays flat no matter how big the snapshot is.
+
+            async for row in engine.iter_result(sid):
+                db.insert(row)
+
+        While Bright Data still answers with the *building* placeholder the
+        request is retried with ``retry_policy.building_delay`` pacing (or
+        every *building_retry* seconds, if given), for at most
+        ``retry_policy.building_timeout`` (then ``asyncio.TimeoutError``).
+        Transient failures are retried inside `_request` (before any row is
+        read); a failure mid-stream propagates, as a retry would repeat rows.
+        HTTP errors propagate as ``aiohttp.ClientResponseError``.
+        """
+        cached = self._cached_result(snapshot_id)
+        if cached is not None:
+            for row in _rows_of(cached.data):
+                yield row
+            BrightdataEngine._snap_meta.mark_delivered(snapshot_id)
+            return
+
+        url     = f"{self.BASE_URL}/snapshot/{snapshot_id}?format=jsonl"
+        headers = {"Authorization": f"Bearer {self._token}"}
+
+        policy   = self.retry_policy
+        started  = time.monotonic()
+        waits    = 0
+        yielded  = False
+        while True:
+            async with self._request("snapshot", "GET", url, headers=headers) as resp:
+                resp.raise_for_status()
+                building = resp.status == 202
+                if not building:
+                    async for row in aiter_ndjson(resp.content, chunk_size):
+                        if not yielded and _is_building_placeholder(row):
+                            building = True
+                            break
+                        yielded = True
+                        yield row
+            if not building:
+                break
+            if time.monotonic() - started >= policy.building_timeout:
+                raise asyncio.TimeoutError(f"snapshot {snapshot_id} still building")
+            await asyncio.sleep(building_retry if building_retry is not None else policy.building_delay(waits))
+            waits += 1
+
+        meta = BrightdataEngine._snap_meta.ensure(snapshot_id)
+        meta.record_data()
+        self.poll_policy.observe_meta(meta)
+        self._journal_outcome(snapshot_id, True, None)
+        BrightdataEngine._snap_meta.mark_delivered(snapshot_id)
+
+    async def download_snapshot_to(
+        self,
+        snapshot_id: str,
+        path: Union[str, Path],
+        *,
+        compression: Optional[str] = None,
+        overwrite: bool = False,
+        chunk_size: int = 256 * 1024,
+        building_retry: Optional[float] = None,
+    ) -> ScrapeResult:
+        """
+        Stream GET /snapshot/{snapshot_id}?format=jsonl straight into *path*.
+
+        The body is written chunk by chunk – nothing is parsed into Python
+        objects except the first row (for ``field_count``); rows are counted
+        on the fly.  The returned ScrapeResult therefore carries
+        ``row_count`` / ``field_count`` / ``cost`` but ``data=None``; the file
+        location is on ``result.saved_to`` (as with ``save_data_to_file``).
 
+        *compression*: None | "gzip" | "zstd" (the latter needs
+        ``pip install zstandard``).  The file is written to ``<path>.part``
+        and renamed on success, so a crash never leaves a truncated archive.
 
+        "Building" answers and transient failures are handled as in
+        `iter_result`; every new request rewrites the file from scratch.
+        """
+        if compression not in (None, "gzip", "zstd"):
+            raise ValueError(f"unknown compression {compression!r} (None | 'gzip' | 'zstd')")
+        path = Path(path)
+        if path.exists() and not overwrite:
+            raise FileExistsError(f"{path} already exists (set overwrite=True to replace)")
+        path.parent.mkdir(parents=True, exist_ok=True)
+        part = path.with_name(path.name + ".part")
+
+        cached = self._cached_result(snapshot_id)
+        if cached is not None:
+            try:
+                with _open_sink(part, compression) as sink:
+                    for row in _rows_of(cached.data):
+                        sink.write(json.dumps(row, ensure_ascii=False).encode() + b"\n")
+                part.replace(path)
+            finally:
+                part.unlink(missing_ok=True)
+            BrightdataEngine._snap_meta.mark_delivered(snapshot_id)
+            res = dataclasses.replace(cached, data=None)
+            res.saved_to = path                      # type: ignore[attr-defined]
+            res.saved_at = datetime.utcnow()         # type: ignore[attr-defined]
+            return res
+
+        url     = f"{self.BASE_URL}/snapshot/{snapshot_id}?format=jsonl"
+        headers = {"Authorization": f"Bearer {self._token}"}
+
+        policy  = self.retry_policy
+        started = time.monotonic()
+        waits   = 0
+        try:
+            while True:
+                counter = NDJSONRowCounter()
+                async with self._request("snapshot", "GET", url, headers=headers) as resp:
+                    resp.raise_for_status()
+                    if resp.status != 202:
+                        with _open_sink(part, compression) as sink:
+                            async for chunk in resp.content.iter_chunked(chunk_size):
+                                sink.write(chunk)
+                                counter.feed(chunk)
+                        counter.close()
+                if resp.status != 202 and not (
+                    counter.rows == 1 and _is_building_placeholder(counter.first)
+                ):
+                    break
+                if time.monotonic() - started >= policy.building_timeout:
+                    raise _StillBuilding(snapshot_id)
+                # still building
+                await asyncio.sleep(building_retry if building_retry is not None else policy.building_delay(waits))
+                waits += 1
+
+            part.replace(path)
+            ok, status, error = True, "ready", None
+            meta = BrightdataEngine._snap_meta.ensure(snapshot_id)
+            meta.record_data()
+            self.poll_policy.observe_meta(meta)
+        except _StillBuilding:
+            ok, status, error = False, "error", "building_timeout"
+        except aiohttp.ClientResponseError as e:
+            ok, status, error = False, "error", f"http_{e.status}"
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            ok, status, error = False, "error", "fetch_error"
+            log.debug("download_snapshot_to %s error: %s", snapshot_id, e)
+        finally:
+            part.unlink(missing_ok=True)
+
+        rows = counter.rows if ok else None
+        res = self._make_result(
+            success     = ok,
+            status      = status,
+            snapshot_id = snapshot_id,
+            url         = url,
+            data        = None,
+            error       = error,
+            cost        = rows * self.COST_PER_RECORD if rows is not None else None,
+            row_count   = rows,
+            field_count = counter.field_count if ok else None,
+        )
+        if ok:
+            res.saved_to = path                      # type: ignore[attr-defined]
+            res.saved_at = datetime.utcnow()         # type: ignore[attr-defined]
+        self._journal_outcome(snapshot_id, ok, error)
+        BrightdataEngine._snap_meta.mark_delivered(snapshot_id)
+        return res
 
     async def poll_until_ready(
         self,
         snapshot_id: str,
         *,
-        poll_interval: int = 10,
+        poll_interval: Optional[float] = None,
         timeout: int = 600,
     ) -> ScrapeResult:
         """
         Async-block until ready or timeout, then return the final ScrapeResult.
+
+        *poll_interval* = None (default) lets ``self.poll_policy`` pick every
+        delay from the dataset's observed ready-times; a number keeps the
+        legacy fixed interval.
         """
         start = time.time()
         while True:
@@ -379,10 +727,56 @@ class BrightdataEngine:
                     success=False,
                     status="timeout",
                     snapshot_id=snapshot_id,
-                    url=f"https://api.brightdata.com/datasets/v3/progress/{snapshot_id}",
+                    url=f"{self.BASE_URL}/progress/{snapshot_id}",
                     error=f"gave up after {timeout}s",
                 )
-            await asyncio.sleep(poll_interval)
+            await asyncio.sleep(self.next_poll_delay(snapshot_id, poll_interval))
+
+    def next_poll_delay(self, snapshot_id: str, poll_interval: Optional[float] = None) -> float:
+        """Fixed *poll_interval* if given, else the adaptive policy's choice."""
+        if self._cached_result(snapshot_id) is not None:
+            return 0.0
+        if poll_interval is not None:
+            return poll_interval
+        return self.poll_policy.next_delay_for(BrightdataEngine._snap_meta.get(snapshot_id) or {})
+
+    def restore_meta(self, record: Dict[str, Any]) -> None:
+        """
+        Re-create the metadata of a snapshot triggered by an earlier process
+        from its journal *record* (keeps adaptive polling and the cache
+        write-back working for resumed jobs).
+        """
+        sid = record["sid"]
+        if sid in BrightdataEngine._snap_meta:
+            return
+        BrightdataEngine._snap_meta.create(
+            sid,
+            dataset_id      = record.get("dataset_id"),
+            request_sent_at = record.get("ts"),
+            cache_key       = record.get("key"),
+        )
+
+    def _journal_outcome(self, snapshot_id: str, ok: bool, error: Optional[str]) -> None:
+        """
+        Close a journaled job once its data is delivered – or once Bright Data
+        refused it for good (4xx, or a "failed" / "error" status probe).
+        Network / building failures keep it pending so the next run resumes
+        it (until the journal's *max_pending_age*).
+        """
+        if self.journal is None:
+            return
+        if ok:
+            self.journal.record_state(snapshot_id, "done")
+        elif error and error.startswith(("http_4", "status_")):
+            self.journal.record_state(snapshot_id, "failed", error=error)
+
+    def _cached_result(self, snapshot_id: str) -> Optional[ScrapeResult]:
+        """The cache hit behind a synthetic snapshot-id, marked as such."""
+        meta = BrightdataEngine._snap_meta.get(snapshot_id)
+        hit  = meta.cached if meta is not None else None
+        if hit is None:
+            return None
+        return dataclasses.replace(hit, cache_hit=True, cost=0.0)
 
     def _make_result(
         self,
@@ -397,8 +791,8 @@ class BrightdataEngine:
         row_count: Optional[int] = None,    # ← new
         field_count: Optional[int] = None, 
     ) -> ScrapeResult:
-        meta = BrightdataEngine._snap_meta.get(snapshot_id, {})
-        root = tldextract.extract(url).domain or None
+        meta = BrightdataEngine._snap_meta.get(snapshot_id) or {}
+        root = root_domain(url)
         
         
         # handle Bright-Data disguise URLs
@@ -406,7 +800,7 @@ class BrightdataEngine:
             root = meta.get("root_override", root)
             if root == "brightdata" and (m := _BD_URL_RE.search(url)):
                 decoded = urllib.parse.unquote(m.group(1))
-                root = tldextract.extract(decoded).domain or root
+                root = root_domain(decoded) or root
 
         try:
             loop_id = id(asyncio.get_running_loop())
@@ -433,12 +827,51 @@ class BrightdataEngine:
         )
 
 
+class _StillBuilding(Exception):
+    """Snapshot body still a placeholder after ``building_timeout``."""
+
+
+def _is_building_placeholder(row: Any) -> bool:
+    """{"status": "building", "message": "Snapshot is building …"}"""
+    return isinstance(row, dict) and row.get("status") == "building" and len(row) <= 2
+
+
+def _rows_of(data: Any) -> List[Any]:
+    """Snapshot body as a list of rows (a single dict counts as one row)."""
+    if isinstance(data, list):
+        return data
+    return [] if data is None else [data]
+
+
+def _open_sink(path: Path, compression: Optional[str]) -> BinaryIO:
+    """Binary writer for *path*, optionally wrapped in gzip / zstd."""
+    if compression is None:
+        return open(path, "wb")
+    if compression == "gzip":
+        return gzip.open(path, "wb")
+    if compression == "zstd":
+        try:
+            import zstandard
+        except ImportError as e:
+            raise RuntimeError(
+                "compression='zstd' needs the optional dependency:  "
+                "python -m pip install zstandard"
+            ) from e
+        return zstandard.ZstdCompressor().stream_writer(open(path, "wb"))
+    raise ValueError(f"unknown compression {compression!r}")
+
+
 # convenience singleton
 _engine: BrightdataEngine | None = None
 
-def get_engine(token: Optional[str] = None) -> BrightdataEngine:
-    """Return a singleton BrightdataEngine (per process)."""
+def get_engine(token: Optional[str] = None, **engine_kw: Any) -> BrightdataEngine:
+    """
+    Return a singleton BrightdataEngine (per process).
+
+    *engine_kw* (e.g. ``pooled=True, limit_per_host=64``) only take effect on
+    the call that creates the singleton.
+    """
     global _engine
     if _engine is None:
-        _engine = BrightdataEngine(bearer_token=token)
+        _engine = BrightdataEngine(bearer_token=token, **engine_kw)
     return _engine
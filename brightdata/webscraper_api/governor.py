@@ -0,0 +1,210 @@
+# brightdata/webscraper_api/governor.py
+"""
+brightdata.webscraper_api.governor
+==================================
+Rate limiting + concurrency control for the Datasets API.
+
+Every request the engine makes belongs to one *endpoint class*
+
+    trigger    POST /trigger
+    progress   GET  /progress/{sid}
+    snapshot   GET  /snapshot/{sid}
+
+and each class has its own budget: a token bucket (*rate* requests/s with
+*burst*) and a cap on requests in flight.  A 429 answer closes the gate of
+that class for ``Retry-After`` seconds (or an exponential back-off when the
+header is missing) – every queued request of that class waits, the failed
+one is retried by the engine.
+
+    gov = RateGovernor(limits={"trigger": EndpointLimit(rate=5, burst=5, max_in_flight=4)})
+    eng = BrightdataEngine(governor=gov)
+    …
+    gov.stats()["trigger"]   # requests, throttled, wait_total, wait_max …
+
+The buckets are plain time arithmetic under a thread lock, so one governor
+can be shared by every event loop / thread the engine is used from; the
+semaphores are created per loop.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import random
+import threading
+import time
+import weakref
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from email.utils import parsedate_to_datetime
+from typing import AsyncIterator, Dict, Mapping, Optional
+
+log = logging.getLogger(__name__)
+
+
+@dataclass
+class EndpointLimit:
+    rate: float = 10.0             # sustained requests per second
+    burst: int = 10                # bucket size
+    max_in_flight: int = 16        # concurrent requests
+
+
+DEFAULT_LIMITS: Dict[str, EndpointLimit] = {
+    "trigger":  EndpointLimit(rate=20.0, burst=50, max_in_flight=32),
+    "progress": EndpointLimit(rate=50.0, burst=50, max_in_flight=64),
+    "snapshot": EndpointLimit(rate=20.0, burst=40, max_in_flight=16),
+}
+
+
+class _Bucket:
+    """Token bucket that hands out *reservations* (seconds to wait)."""
+
+    def __init__(self, limit: EndpointLimit):
+        self.limit   = limit
+        self.tokens  = float(limit.burst)
+        self.updated = time.monotonic()
+        self.blocked_until = 0.0           # set by 429 / Retry-After
+        # counters
+        self.requests   = 0
+        self.throttled  = 0
+        self.wait_total = 0.0
+        self.wait_max   = 0.0
+
+    def reserve(self, now: float) -> float:
+        lim = self.limit
+        self.tokens  = min(lim.burst, self.tokens + (now - self.updated) * lim.rate)
+        self.updated = now
+        self.tokens -= 1.0                  # may go negative → queued
+        wait = -self.tokens / lim.rate if self.tokens < 0 else 0.0
+        return max(wait, self.blocked_until - now)
+
+
+class RateGovernor:
+    """
+    Per-endpoint token bucket + in-flight semaphore.
+
+    Parameters
+    ----------
+    limits       : overrides of `DEFAULT_LIMITS` per endpoint class
+    max_retries  : how often the engine retries a request answered with 429
+    backoff_base : first back-off (s) when a 429 carries no Retry-After
+    backoff_max  : ceiling for any back-off / Retry-After honoured
+    """
+
+    def __init__(
+        self,
+        limits: Optional[Mapping[str, EndpointLimit]] = None,
+        *,
+        max_retries: int = 5,
+        backoff_base: float = 1.0,
+        backoff_max: float = 60.0,
+    ):
+        merged = {**DEFAULT_LIMITS, **(limits or {})}
+        self.max_retries  = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max  = backoff_max
+        self._buckets: Dict[str, _Bucket] = {k: _Bucket(v) for k, v in merged.items()}
+        self._lock = threading.Lock()
+        self._sems: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[str, asyncio.Semaphore]]" = (
+            weakref.WeakKeyDictionary()
+        )
+
+    # ───────────────────────────── acquire ─────────────────────────────
+    @asynccontextmanager
+    async def slot(self, endpoint: str) -> AsyncIterator[float]:
+        """
+        Wait for a token and an in-flight slot of *endpoint*; yields the
+        queue-wait in seconds.
+        """
+        bucket = self._bucket(endpoint)
+        start  = time.monotonic()
+
+        with self._lock:
+            wait = bucket.reserve(start)
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+        sem = self._semaphore(endpoint)
+        async with sem:
+            # a 429 may have closed the gate while we were queued
+            while True:
+                with self._lock:
+                    gate = bucket.blocked_until - time.monotonic()
+                if gate <= 0:
+                    break
+                await asyncio.sleep(gate)
+
+            waited = time.monotonic() - start
+            with self._lock:
+                bucket.requests   += 1
+                bucket.wait_total += waited
+                bucket.wait_max    = max(bucket.wait_max, waited)
+            if waited > 0.05:
+                log.debug("%s request queued %.2fs", endpoint, waited)
+            yield waited
+
+    # ───────────────────────────── 429 handling ────────────────────────
+    def throttled(self, endpoint: str, retry_after: Optional[str], attempt: int) -> float:
+        """
+        Register a 429 on *endpoint*; returns the delay before the retry and
+        blocks the whole endpoint class for that long.
+        """
+        delay = _parse_retry_after(retry_after)
+        if delay is None:
+            delay = self.backoff_base * (2 ** attempt) * (1 + random.random() * 0.25)
+        delay = min(delay, self.backoff_max)
+
+        bucket = self._bucket(endpoint)
+        with self._lock:
+            bucket.throttled += 1
+            bucket.blocked_until = max(bucket.blocked_until, time.monotonic() + delay)
+        log.debug("%s answered 429 – backing off %.2fs (attempt %d)", endpoint, delay, attempt + 1)
+        return delay
+
+    # ───────────────────────────── reporting ───────────────────────────
+    def stats(self) -> Dict[str, Dict[str, float]]:
+        with self._lock:
+            return {
+                name: {
+                    "requests":   b.requests,
+                    "throttled":  b.throttled,
+                    "wait_total": round(b.wait_total, 4),
+                    "wait_avg":   round(b.wait_total / b.requests, 4) if b.requests else 0.0,
+                    "wait_max":   round(b.wait_max, 4),
+                }
+                for name, b in self._buckets.items()
+            }
+
+    # ───────────────────────────── internals ───────────────────────────
+    def _bucket(self, endpoint: str) -> _Bucket:
+        bucket = self._buckets.get(endpoint)
+        if bucket is None:
+            with self._lock:
+                bucket = self._buckets.setdefault(endpoint, _Bucket(EndpointLimit()))
+        return bucket
+
+    def _semaphore(self, endpoint: str) -> asyncio.Semaphore:
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            sems = self._sems.get(loop)
+            if sems is None:
+                sems = self._sems[loop] = {}
+            sem = sems.get(endpoint)
+            if sem is None:
+                sem = sems[endpoint] = asyncio.Semaphore(self._buckets[endpoint].limit.max_in_flight)
+            return sem
+
+
+def _parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """``Retry-After`` as seconds – either delta-seconds or an HTTP date."""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, when.timestamp() - time.time())
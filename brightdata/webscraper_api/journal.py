@@ -0,0 +1,222 @@
+# brightdata/webscraper_api/journal.py
+"""
+brightdata.webscraper_api.journal
+=================================
+Crash-safe, append-only record of every triggered snapshot.
+
+When a worker dies, the snapshot-ids it was polling die with it – the next
+run re-triggers the same inputs and pays for them twice.  With a journal
+attached to the engine
+
+    engine = get_engine(journal=JobJournal("~/.cache/brightdata/jobs.jsonl"))
+
+every successful `/trigger` appends ``{"event": "triggered", sid, dataset_id,
+key, payload}``, and every delivered / failed result appends a final
+``{"event": "done" | "failed"}``.  Nothing else is ever rewritten, so a
+crash can at worst lose the last unsynced lines.
+
+A job that never reaches a final event (timeouts, a snapshot gone past
+Bright Data's retention …) stops counting as pending after
+*max_pending_age* seconds – its input is triggered afresh and `compact`
+drops the record.
+
+After a restart
+
+* `BrightdataEngine.trigger` answers an input that is still pending in the
+  journal with the **existing** snapshot-id instead of POSTing again, and
+* `SnapshotScheduler.resume(journal)` puts every pending snapshot straight
+  back into the poller.
+
+Writes are flushed immediately and ``fsync``-ed in batches (every
+*fsync_every* records or *fsync_interval* seconds, whichever comes first).
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Union
+
+log = logging.getLogger(__name__)
+
+FINAL_EVENTS = {"done", "failed"}
+
+
+class JobJournal:
+    """
+    JSONL journal of snapshot triggers and their final state.
+
+    Parameters
+    ----------
+    path           : journal file (created on demand)
+    fsync_every    : fsync after this many appended records …
+    fsync_interval : … or once this many seconds passed since the last fsync
+    max_pending_age: seconds after which an unfinished job is considered
+                     dead (``None`` = never)
+    """
+
+    def __init__(
+        self,
+        path: Union[str, Path],
+        *,
+        fsync_every: int = 32,
+        fsync_interval: float = 1.0,
+        max_pending_age: Optional[float] = 24 * 3600.0,
+    ):
+        self.path = Path(path).expanduser()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.fsync_every    = fsync_every
+        self.fsync_interval = fsync_interval
+        self.max_pending_age = max_pending_age
+
+        self._lock = threading.Lock()
+        self._pending: Dict[str, Dict[str, Any]] = {}   # sid → triggered record
+        self._by_key:  Dict[str, str] = {}              # input key → sid
+        self._load()
+
+        self._fh = open(self.path, "a", encoding="utf-8")
+        if self._fh.tell() and not _ends_with_newline(self.path):
+            self._fh.write("\n")                     # fence off a torn last line
+        self._unsynced   = 0
+        self._last_fsync = time.monotonic()
+
+    # ───────────────────────────── writing ─────────────────────────────
+    def record_trigger(
+        self,
+        snapshot_id: str,
+        *,
+        dataset_id: str,
+        payload: List[Dict[str, Any]],
+        key: Optional[str] = None,
+    ) -> None:
+        rec = {
+            "event":      "triggered",
+            "ts":         time.time(),
+            "sid":        snapshot_id,
+            "dataset_id": dataset_id,
+            "key":        key,
+            "payload":    payload,
+        }
+        with self._lock:
+            self._append(rec)
+            self._pending[snapshot_id] = rec
+            if key:
+                self._by_key[key] = snapshot_id
+
+    def record_state(self, snapshot_id: str, event: str, **extra: Any) -> None:
+        """Append a state change; ``done`` / ``failed`` close the job."""
+        with self._lock:
+            if snapshot_id not in self._pending:
+                return                                  # not ours / already closed
+            self._append({"event": event, "ts": time.time(), "sid": snapshot_id, **extra})
+            if event in FINAL_EVENTS:
+                self._forget(snapshot_id)
+
+    def flush(self, *, fsync: bool = True) -> None:
+        with self._lock:
+            self._fh.flush()
+            if fsync:
+                os.fsync(self._fh.fileno())
+                self._unsynced   = 0
+                self._last_fsync = time.monotonic()
+
+    def close(self) -> None:
+        if self._fh.closed:
+            return
+        self.flush()
+        self._fh.close()
+
+    def __enter__(self) -> "JobJournal":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    # ───────────────────────────── reading ─────────────────────────────
+    def pending(self) -> Dict[str, Dict[str, Any]]:
+        """``snapshot_id → triggered record`` of every unfinished job."""
+        now = time.time()
+        with self._lock:
+            return {sid: rec for sid, rec in self._pending.items() if self._fresh(rec, now)}
+
+    def pending_for(self, key: str) -> Optional[Dict[str, Any]]:
+        """Triggered record of an unfinished job for input *key*, if any."""
+        with self._lock:
+            sid = self._by_key.get(key)
+            rec = self._pending.get(sid) if sid else None
+            return rec if rec is not None and self._fresh(rec, time.time()) else None
+
+    def compact(self) -> int:
+        """
+        Rewrite the file with only the pending ``triggered`` records (jobs
+        older than *max_pending_age* are dropped); returns how many were kept.
+        """
+        now = time.time()
+        with self._lock:
+            for sid in [s for s, rec in self._pending.items() if not self._fresh(rec, now)]:
+                self._forget(sid)
+            tmp = self.path.with_name(self.path.name + ".tmp")
+            with open(tmp, "w", encoding="utf-8") as out:
+                for rec in self._pending.values():
+                    out.write(json.dumps(rec, ensure_ascii=False) + "\n")
+                out.flush()
+                os.fsync(out.fileno())
+            self._fh.close()
+            os.replace(tmp, self.path)
+            self._fh = open(self.path, "a", encoding="utf-8")
+            self._unsynced = 0
+            return len(self._pending)
+
+    # ───────────────────────────── internals ───────────────────────────
+    def _fresh(self, rec: Dict[str, Any], now: float) -> bool:
+        if self.max_pending_age is None:
+            return True
+        return now - rec.get("ts", now) < self.max_pending_age
+
+    def _forget(self, snapshot_id: str) -> None:
+        rec = self._pending.pop(snapshot_id)
+        if rec.get("key") and self._by_key.get(rec["key"]) == snapshot_id:
+            del self._by_key[rec["key"]]
+
+    def _append(self, rec: Dict[str, Any]) -> None:
+        self._fh.write(json.dumps(rec, ensure_ascii=False) + "\n")
+        self._fh.flush()
+        self._unsynced += 1
+        if (
+            self._unsynced >= self.fsync_every
+            or time.monotonic() - self._last_fsync >= self.fsync_interval
+        ):
+            os.fsync(self._fh.fileno())
+            self._unsynced   = 0
+            self._last_fsync = time.monotonic()
+
+    def _load(self) -> None:
+        if not self.path.exists():
+            return
+        with open(self.path, encoding="utf-8") as fh:
+            for lineno, line in enumerate(fh, 1):
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    rec = json.loads(line)
+                except ValueError:                      # torn last line after a crash
+                    log.warning("journal %s: skipping corrupt line %d", self.path, lineno)
+                    continue
+                sid = rec.get("sid")
+                if rec.get("event") == "triggered":
+                    self._pending[sid] = rec
+                    if rec.get("key"):
+                        self._by_key[rec["key"]] = sid
+                elif rec.get("event") in FINAL_EVENTS and sid in self._pending:
+                    self._forget(sid)
+
+
+def _ends_with_newline(path: Path) -> bool:
+    with open(path, "rb") as fh:
+        fh.seek(-1, os.SEEK_END)
+        return fh.read(1) == b"\n"
@@ -0,0 +1,277 @@
+# brightdata/webscraper_api/meta_store.py
+"""
+brightdata.webscraper_api.meta_store
+====================================
+Bounded home for the per-snapshot timing / trace metadata.
+
+`BrightdataEngine` used to keep one plain dict per snapshot in a class-level
+dict that was never pruned – every trigger and every poll timestamp stayed
+alive for the life of the process.  `SnapshotMetaStore` replaces it:
+
+► one `SnapshotMeta` per snapshot (``__slots__``, timestamps as floats,
+  poll times in an ``array('d')`` → 8 bytes per poll)
+► entries are dropped *delivered_ttl* seconds after their result was
+  delivered (`mark_delivered`)
+► cap of *max_entries* – met by evicting delivered entries (oldest
+  delivery first) and pending ones untouched for *pending_ttl* seconds.
+  A snapshot that is still being polled is never evicted: its adaptive-poll
+  timing and cache write-back state would be lost, and a synthetic
+  ``cache_…`` id would be sent to the API
+► `stats()` → entries / bytes held / evictions for monitoring
+
+`SnapshotMeta` keeps the read-only mapping interface the rest of the code
+(and `AdaptivePollPolicy`) used on the old dicts: ``meta.get("dataset_id")``,
+``meta["request_sent_at"]`` … with the same ``datetime`` values as before.
+"""
+
+from __future__ import annotations
+
+import sys
+import threading
+import time
+from array import array
+from collections import OrderedDict
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+
+def _dt(ts: Optional[float]) -> Optional[datetime]:
+    return datetime.utcfromtimestamp(ts) if ts is not None else None
+
+
+def _deep_size(obj: Any, _seen: Optional[set] = None) -> int:
+    """Rough recursive ``sys.getsizeof`` – containers, dataclasses, slots."""
+    seen = _seen if _seen is not None else set()
+    if id(obj) in seen:
+        return 0
+    seen.add(id(obj))
+    size = sys.getsizeof(obj)
+    if isinstance(obj, (str, bytes, bytearray, int, float, bool, type(None))):
+        return size
+    if isinstance(obj, dict):
+        return size + sum(_deep_size(k, seen) + _deep_size(v, seen) for k, v in obj.items())
+    if isinstance(obj, (list, tuple, set, frozenset)):
+        return size + sum(_deep_size(v, seen) for v in obj)
+    if hasattr(obj, "__dict__"):
+        size += _deep_size(vars(obj), seen)
+    for slot in getattr(type(obj), "__slots__", ()):
+        if hasattr(obj, slot):
+            size += _deep_size(getattr(obj, slot), seen)
+    return size
+
+
+class SnapshotMeta:
+    """Compact metadata record of one snapshot."""
+
+    __slots__ = (
+        "trace_id", "dataset_id", "root_override", "cache_key", "cached",
+        "_sent", "_received", "_data", "_polls", "_delivered", "_touched",
+    )
+
+    _FIELDS = (
+        "trace_id", "dataset_id", "root_override", "cache_key", "cached",
+        "request_sent_at", "snapshot_id_received_at", "snapshot_polled_at",
+        "data_received_at",
+    )
+
+    def __init__(
+        self,
+        *,
+        trace_id: Optional[str] = None,
+        dataset_id: Optional[str] = None,
+        root_override: Optional[str] = None,
+        cache_key: Optional[str] = None,
+        cached: Any = None,
+        request_sent_at: Optional[float] = None,
+        snapshot_id_received_at: Optional[float] = None,
+        data_received_at: Optional[float] = None,
+    ):
+        self.trace_id      = trace_id
+        self.dataset_id    = dataset_id
+        self.root_override = root_override
+        self.cache_key     = cache_key
+        self.cached        = cached
+        self._sent         = request_sent_at
+        self._received     = snapshot_id_received_at
+        self._data         = data_received_at
+        self._polls        = array("d")
+        self._delivered: Optional[float] = None
+        self._touched      = time.time()
+
+    # ── datetime views (what ScrapeResult / AdaptivePollPolicy expect) ──
+    @property
+    def request_sent_at(self) -> Optional[datetime]:
+        return _dt(self._sent)
+
+    @property
+    def snapshot_id_received_at(self) -> Optional[datetime]:
+        return _dt(self._received)
+
+    @property
+    def data_received_at(self) -> Optional[datetime]:
+        return _dt(self._data)
+
+    @property
+    def snapshot_polled_at(self) -> List[datetime]:
+        return [datetime.utcfromtimestamp(t) for t in self._polls]
+
+    # ── mutation ──
+    def record_poll(self, ts: Optional[float] = None) -> None:
+        self._polls.append(ts if ts is not None else time.time())
+
+    def record_data(self, ts: Optional[float] = None) -> None:
+        self._data = ts if ts is not None else time.time()
+
+    # ── read-only mapping interface (legacy dict access) ──
+    def get(self, key: str, default: Any = None) -> Any:
+        if key not in self._FIELDS:
+            return default
+        value = getattr(self, key)
+        return default if value is None else value
+
+    def __getitem__(self, key: str) -> Any:
+        if key not in self._FIELDS:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._FIELDS and getattr(self, key) is not None
+
+    def nbytes(self) -> int:
+        """Approximate memory held by this record, a cached result included."""
+        size = sys.getsizeof(self) + sys.getsizeof(self._polls)
+        for s in (self.trace_id, self.dataset_id, self.root_override, self.cache_key):
+            if s is not None:
+                size += sys.getsizeof(s)
+        if self.cached is not None:
+            size += _deep_size(self.cached)
+        return size
+
+
+class SnapshotMetaStore:
+    """
+    LRU + TTL bounded mapping ``snapshot_id → SnapshotMeta``.
+
+    Parameters
+    ----------
+    max_entries   : cap met by evicting delivered / expired entries only –
+                    pending snapshots may push the store above it
+    delivered_ttl : seconds an entry survives after `mark_delivered`
+    pending_ttl   : seconds an undelivered entry survives without being
+                    touched (created / read / polled) – abandoned jobs
+    """
+
+    def __init__(
+        self,
+        *,
+        max_entries: int = 10_000,
+        delivered_ttl: float = 600.0,
+        pending_ttl: float = 24 * 3600.0,
+    ):
+        self.max_entries   = max_entries
+        self.delivered_ttl = delivered_ttl
+        self.pending_ttl   = pending_ttl
+        self._entries: "OrderedDict[str, SnapshotMeta]" = OrderedDict()
+        self._delivered: "OrderedDict[str, float]" = OrderedDict()   # sid → expiry
+        self._lock = threading.Lock()               # PollWorker polls from a thread
+        self.evicted = 0
+
+    # ───────────────────────────── access ──────────────────────────────
+    def create(self, snapshot_id: str, **fields: Any) -> SnapshotMeta:
+        """Insert (or replace) the record of *snapshot_id*."""
+        meta = SnapshotMeta(**fields)
+        with self._lock:
+            self._delivered.pop(snapshot_id, None)
+            self._entries[snapshot_id] = meta
+            self._entries.move_to_end(snapshot_id)
+            self._evict_locked(time.time())
+        return meta
+
+    def get(self, snapshot_id: str) -> Optional[SnapshotMeta]:
+        with self._lock:
+            meta = self._entries.get(snapshot_id)
+            if meta is not None:
+                meta._touched = time.time()
+                self._entries.move_to_end(snapshot_id)
+            return meta
+
+    def ensure(self, snapshot_id: str) -> SnapshotMeta:
+        """Existing record or an empty one (ids triggered elsewhere)."""
+        meta = self.get(snapshot_id)
+        return meta if meta is not None else self.create(snapshot_id)
+
+    def record_poll(self, snapshot_id: str) -> None:
+        self.ensure(snapshot_id).record_poll()
+
+    def mark_delivered(self, snapshot_id: str) -> None:
+        """Result handed out – keep the record *delivered_ttl* s longer, then drop it."""
+        now = time.time()
+        with self._lock:
+            meta = self._entries.get(snapshot_id)
+            if meta is None:
+                return
+            meta._delivered = now
+            self._delivered.pop(snapshot_id, None)
+            self._delivered[snapshot_id] = now + self.delivered_ttl
+            self._evict_locked(now)
+
+    def discard(self, snapshot_id: str) -> None:
+        with self._lock:
+            self._entries.pop(snapshot_id, None)
+            self._delivered.pop(snapshot_id, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._delivered.clear()
+
+    def __getitem__(self, snapshot_id: str) -> SnapshotMeta:
+        meta = self.get(snapshot_id)
+        if meta is None:
+            raise KeyError(snapshot_id)
+        return meta
+
+    def __contains__(self, snapshot_id: str) -> bool:
+        return snapshot_id in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    # ───────────────────────────── housekeeping ────────────────────────
+    def purge(self) -> int:
+        """Drop expired entries now; returns how many went."""
+        with self._lock:
+            before = self.evicted
+            self._evict_locked(time.time())
+            return self.evicted - before
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "entries":   len(self._entries),
+                "delivered": len(self._delivered),
+                "bytes":     sum(m.nbytes() for m in self._entries.values()),
+                "evicted":   self.evicted,
+            }
+
+    def _evict_locked(self, now: float) -> None:
+        # delivered past their TTL
+        while self._delivered:
+            sid, expires_at = next(iter(self._delivered.items()))
+            if expires_at > now:
+                break
+            self._drop_locked(sid)
+        # pending but untouched for pending_ttl (LRU order = touch order)
+        while self._entries:
+            sid, meta = next(iter(self._entries.items()))
+            if meta._delivered is not None or meta._touched + self.pending_ttl > now:
+                break
+            self._drop_locked(sid)
+        # over the cap → delivered entries go early, oldest delivery first
+        while len(self._entries) > self.max_entries and self._delivered:
+            self._drop_locked(next(iter(self._delivered)))
+
+    def _drop_locked(self, snapshot_id: str) -> None:
+        self._delivered.pop(snapshot_id, None)
+        if self._entries.pop(snapshot_id, None) is not None:
+            self.evicted += 1
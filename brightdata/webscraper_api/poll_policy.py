@@ -0,0 +1,151 @@
+# brightdata/webscraper_api/poll_policy.py
+"""
+brightdata.webscraper_api.poll_policy
+=====================================
+Adaptive `/progress` back-off.
+
+A fixed poll interval is wrong for almost every job: a product page that is
+ready after 6 s waits a full 10 s interval, while a discover job that needs
+20 minutes gets polled a hundred times for nothing.
+
+`AdaptivePollPolicy` learns the typical *ready-time* of every dataset_id from
+the timing the engine already records in ``BrightdataEngine._snap_meta``
+
+    request_sent_at      → POST /trigger
+    snapshot_polled_at   → every GET /progress
+    data_received_at     → GET /snapshot succeeded
+
+and then polls **densely around the expected completion time** and
+**sparsely everywhere else**:
+
+    elapsed ≪ expected  →  sleep (almost) until the expected time
+    elapsed ≈ expected  →  min_interval
+    elapsed ≫ expected  →  geometric back-off up to max_interval
+
+Datasets without history start at *initial_interval* and grow by *growth*
+on every unsuccessful probe.
+"""
+
+from __future__ import annotations
+
+import statistics
+import threading
+from collections import defaultdict, deque
+from datetime import datetime
+from typing import Any, Deque, Dict, Mapping, Optional
+
+
+class AdaptivePollPolicy:
+    """
+    Per-dataset ready-time estimator + poll-delay calculator.
+
+    Parameters
+    ----------
+    min_interval     : never poll the same snapshot more often than this (s)
+    max_interval     : never wait longer than this between two probes (s)
+    initial_interval : first delay for a dataset without history (s)
+    growth           : back-off factor for unknown / overdue snapshots
+    window           : how many recent ready-times to keep per dataset
+    spread           : fraction of the expected time treated as "near" it
+    """
+
+    def __init__(
+        self,
+        *,
+        min_interval: float = 1.0,
+        max_interval: float = 30.0,
+        initial_interval: float = 2.0,
+        growth: float = 1.5,
+        window: int = 20,
+        spread: float = 0.15,
+    ):
+        if min_interval <= 0 or max_interval < min_interval:
+            raise ValueError("need 0 < min_interval <= max_interval")
+        self.min_interval     = min_interval
+        self.max_interval     = max_interval
+        self.initial_interval = initial_interval
+        self.growth           = growth
+        self.spread           = spread
+
+        self._samples: Dict[str, Deque[float]] = defaultdict(lambda: deque(maxlen=window))
+        self._lock = threading.Lock()          # PollWorker polls from a thread
+
+    # ───────────────────────────── learning ─────────────────────────────
+    def observe(self, dataset_id: str, ready_after: float) -> None:
+        """Record that a *dataset_id* snapshot was ready *ready_after* s after trigger."""
+        if ready_after < 0:
+            return
+        with self._lock:
+            self._samples[dataset_id].append(ready_after)
+
+    def observe_meta(self, meta: Mapping[str, Any]) -> Optional[float]:
+        """
+        Derive the ready-time from one ``_snap_meta`` entry and record it.
+
+        The probe that saw *ready* is the last one in ``snapshot_polled_at``;
+        the one before it saw the job still running, so the true completion
+        lies in between – we take the midpoint.  Without any probe we fall back
+        to ``data_received_at`` (an upper bound).
+        """
+        dataset_id = meta.get("dataset_id")
+        sent_at    = meta.get("request_sent_at")
+        if not dataset_id or not isinstance(sent_at, datetime):
+            return None
+
+        polls = meta.get("snapshot_polled_at") or []
+        if polls:
+            hi = (polls[-1] - sent_at).total_seconds()
+            lo = (polls[-2] - sent_at).total_seconds() if len(polls) > 1 else hi
+            ready_after = (lo + hi) / 2
+        elif isinstance(meta.get("data_received_at"), datetime):
+            ready_after = (meta["data_received_at"] - sent_at).total_seconds()
+        else:
+            return None
+
+        self.observe(dataset_id, ready_after)
+        return ready_after
+
+    def expected(self, dataset_id: Optional[str]) -> Optional[float]:
+        """Median observed ready-time for *dataset_id* (None without history)."""
+        if not dataset_id:
+            return None
+        with self._lock:
+            samples = self._samples.get(dataset_id)
+            if not samples:
+                return None
+            return statistics.median(samples)
+
+    # ───────────────────────────── scheduling ───────────────────────────
+    def next_delay(
+        self,
+        dataset_id: Optional[str],
+        elapsed: float,
+        polls: int = 0,
+    ) -> float:
+        """
+        Seconds to wait before probing a snapshot that has been running for
+        *elapsed* seconds and has already been polled *polls* times.
+        """
+        expected = self.expected(dataset_id)
+
+        if expected is None:                              # no history yet
+            delay = self.initial_interval * (self.growth ** max(polls - 1, 0))
+        else:
+            margin = max(self.min_interval, expected * self.spread)
+            remaining = expected - elapsed
+            if remaining > margin:                        # well before: jump ahead
+                delay = remaining - margin
+            elif remaining > -margin:                     # close: poll densely
+                delay = self.min_interval
+            else:                                         # overdue: back off
+                delay = self.min_interval + (-remaining - margin) * (self.growth - 1)
+
+        return min(self.max_interval, max(self.min_interval, delay))
+
+    def next_delay_for(self, meta: Mapping[str, Any], *, now: Optional[datetime] = None) -> float:
+        """`next_delay` computed straight from one ``_snap_meta`` entry."""
+        sent_at = meta.get("request_sent_at")
+        now = now or datetime.utcnow()
+        elapsed = (now - sent_at).total_seconds() if isinstance(sent_at, datetime) else 0.0
+        polls = len(meta.get("snapshot_polled_at") or [])
+        return self.next_delay(meta.get("dataset_id"), elapsed, polls)
@@ -3,11 +3,13 @@ from __future__ import annotations
 import importlib
 import pkgutil
 from functools import lru_cache
-from typing import Dict, Type
-from urllib.parse import urlparse
-import tldextract
+from typing import Dict, Optional, Tuple, Type
+
+from brightdata.webscraper_api.router import UrlRouter
+from brightdata.webscraper_api.scrapers._manifest import MANIFEST
 
 _COLLECT_REGISTRY: Dict[str, Type] = {}
+_ROUTER: Optional[UrlRouter] = None
 
 
 # ------------------------------------------------------------------ #
@@ -16,16 +18,32 @@ _COLLECT_REGISTRY: Dict[str, Type] = {}
 def register(sld: str):
     def _inner(cls: Type) -> Type:
         _COLLECT_REGISTRY[sld.lower()] = cls
+        if _ROUTER is not None:
+            _ROUTER.invalidate()
         return cls
     return _inner
 
 
-def _sld(host: str) -> str:
-    return tldextract.extract(host.lower()).domain
+# ------------------------------------------------------------------ #
+# Lazy index: domain → scraper module, imported on first lookup
+# ------------------------------------------------------------------ #
+class _ScraperIndex:
+    """
+    What the router sees as "the registry": classes registered so far,
+    plus every domain of the bundled `MANIFEST` – whose module is imported
+    only when that domain is first asked for.
+    """
+
+    def get(self, sld: str, default: Optional[Type] = None) -> Optional[Type]:
+        cls = _COLLECT_REGISTRY.get(sld)
+        if cls is None and sld in MANIFEST:
+            importlib.import_module(MANIFEST[sld][0])     # runs its @register
+            cls = _COLLECT_REGISTRY.get(sld)
+        return cls if cls is not None else default
 
 
 # ------------------------------------------------------------------ #
-# One-time auto loader
+# Full scan (manifest builder / callers that want every scraper)
 # ------------------------------------------------------------------ #
 @lru_cache(maxsize=1)          # run exactly once
 def _import_all_scrapers():
@@ -40,6 +58,20 @@ def _import_all_scrapers():
             importlib.import_module(name)
 
 
+def build_manifest() -> Dict[str, Tuple[str, str]]:
+    """
+    ``{domain: (module, class name)}`` of every bundled scraper – the
+    content of ``scrapers/_manifest.py`` (see ``brightdata.other.build_manifest``).
+    """
+    _import_all_scrapers()
+    prefix = "brightdata.webscraper_api.scrapers."
+    return {
+        sld: (cls.__module__, cls.__name__)
+        for sld, cls in sorted(_COLLECT_REGISTRY.items())
+        if cls.__module__.startswith(prefix)
+    }
+
+
 # ------------------------------------------------------------------ #
 # Public helper
 # ------------------------------------------------------------------ #
@@ -48,5 +80,12 @@ def get_scraper_for(url: str):
     Return the **scraper class** whose second-level domain matches *url*,
     or None if nothing registered.
     """
-    _import_all_scrapers()                 # ensure registry is populated
-    return _COLLECT_REGISTRY.get(_sld(url))
+    return get_router().scraper_for(url)
+
+
+def get_router() -> UrlRouter:
+    """The process-wide `UrlRouter` over every registered scraper."""
+    global _ROUTER
+    if _ROUTER is None:
+        _ROUTER = UrlRouter(_ScraperIndex())
+    return _ROUTER
@@ -0,0 +1,143 @@
+# brightdata/webscraper_api/retry.py
+"""
+brightdata.webscraper_api.retry
+===============================
+Error classification + jittered exponential back-off for the engine.
+
+A single network blip used to be fatal: `trigger` returned None (the caller
+re-triggers → a second, billed job), `get_status` reported "error" and
+`poll_until_ready` gave up on a snapshot that was still running.
+`RetryPolicy` decides, per failure, whether another attempt is worth it:
+
+    kind        examples                                   retried by default
+    ─────────   ────────────────────────────────────────   ──────────────────
+    connect     DNS, refused, reset, server disconnected   yes
+    timeout     asyncio.TimeoutError                       yes
+    5xx         500 / 502 / 503 / 504                      yes
+    429         Too Many Requests                          (RateGovernor)
+    4xx         400 / 401 / 403 / 404 – permanent          no
+    ssl         certificate verification failed            no
+    other       anything else                              no
+
+Only GET requests are retried freely.  A POST (``/trigger``) is retried
+only when it provably never reached the server – the connection could not
+be established – or was refused with a 429; after a timeout, a dropped
+connection or a 5xx the job may exist already and a retry could bill it
+twice (`may_have_been_sent`).
+
+Delays follow "full jitter" exponential back-off
+``uniform(0, min(max_delay, base_delay · 2^attempt))`` and every retry
+sequence is bounded by *max_attempts* **and** a total *deadline*.
+
+The same policy also paces the ``{"status": "building"}`` placeholder
+loops of `fetch_result`, `iter_result` and `download_snapshot_to` – growing delays and a hard *building_timeout*
+instead of a fixed 2 s sleep forever.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import random
+import ssl
+import time
+from typing import FrozenSet, Optional, Union
+
+import aiohttp
+
+TRANSIENT: FrozenSet[str] = frozenset({"connect", "timeout", "5xx"})
+
+
+class RetryPolicy:
+    """
+    Parameters
+    ----------
+    max_attempts      : total tries per request (1 = no retry)
+    base_delay        : back-off scale of the first retry (s)
+    max_delay         : ceiling for a single back-off (s)
+    deadline          : give up once retrying would pass this many seconds
+    retry_on          : error kinds worth retrying (see module docstring)
+    building_base     : first wait while the snapshot body is still "building"
+    building_max_delay: ceiling for one "building" wait
+    building_timeout  : total seconds to wait for a "building" snapshot
+    """
+
+    def __init__(
+        self,
+        *,
+        max_attempts: int = 4,
+        base_delay: float = 0.5,
+        max_delay: float = 8.0,
+        deadline: float = 60.0,
+        retry_on: FrozenSet[str] = TRANSIENT,
+        building_base: float = 2.0,
+        building_max_delay: float = 15.0,
+        building_timeout: float = 600.0,
+    ):
+        self.max_attempts       = max(1, max_attempts)
+        self.base_delay         = base_delay
+        self.max_delay          = max_delay
+        self.deadline           = deadline
+        self.retry_on           = frozenset(retry_on)
+        self.building_base      = building_base
+        self.building_max_delay = building_max_delay
+        self.building_timeout   = building_timeout
+
+    # ───────────────────────────── classification ─────────────────────────
+    @staticmethod
+    def classify(error: Union[BaseException, int]) -> str:
+        """Map an exception (or an HTTP status code) to an error kind."""
+        status = error if isinstance(error, int) else getattr(error, "status", None)
+        if isinstance(error, aiohttp.ClientResponseError) or isinstance(error, int):
+            if status == 429:
+                return "429"
+            if status is not None and status >= 500:
+                return "5xx"
+            if status is not None and status >= 400:
+                return "4xx"
+            return "other"
+        if isinstance(error, asyncio.TimeoutError):
+            return "timeout"
+        if isinstance(error, (aiohttp.ClientSSLError, ssl.SSLError)):
+            return "ssl"
+        if isinstance(error, (aiohttp.ClientConnectionError, aiohttp.ClientPayloadError, ConnectionError)):
+            return "connect"
+        return "other"
+
+    def is_transient(self, error: Union[BaseException, int]) -> bool:
+        return self.classify(error) in self.retry_on
+
+    @staticmethod
+    def may_have_been_sent(error: BaseException) -> bool:
+        """False only if the request cannot have reached the server."""
+        return not isinstance(error, aiohttp.ClientConnectorError)
+
+    # ───────────────────────────── back-off ───────────────────────────────
+    def backoff(self, attempt: int) -> float:
+        """Full-jitter delay before retry number *attempt* (0-based)."""
+        return random.uniform(0, min(self.max_delay, self.base_delay * (2 ** attempt)))
+
+    def retry_delay(
+        self,
+        error: Union[BaseException, int],
+        attempt: int,
+        started: float,
+    ) -> Optional[float]:
+        """
+        Seconds to wait before the next attempt, or None to give up.
+
+        *attempt* is the 0-based number of the attempt that just failed,
+        *started* the ``time.monotonic()`` of the first one.
+        """
+        if self.classify(error) not in self.retry_on:
+            return None
+        if attempt + 1 >= self.max_attempts:
+            return None
+        delay = self.backoff(attempt)
+        if time.monotonic() - started + delay > self.deadline:
+            return None
+        return delay
+
+    def building_delay(self, attempt: int) -> float:
+        """Wait before re-asking for a snapshot that is still "building"."""
+        cap = min(self.building_max_delay, self.building_base * (1.5 ** attempt))
+        return cap * random.uniform(0.8, 1.0)
@@ -0,0 +1,145 @@
+# brightdata/webscraper_api/router.py
+"""
+brightdata.webscraper_api.router
+================================
+Compiled URL → (scraper class, endpoint kind) routing.
+
+`get_scraper_for` used to run a public-suffix lookup on every single URL and
+each scraper then scanned its own regexes one by one to find the endpoint.
+`UrlRouter` does both in one pass and pays the expensive part once:
+
+► **host → scraper** is resolved once per distinct host (offline PSL lookup
+  on the first sight, a dict hit afterwards – a million URLs rarely have
+  more than a few thousand hosts)
+► **path → kind** uses one combined regex per scraper, built from the
+  class's ``PATTERNS`` ``{kind: regex}`` – the first kind whose regex
+  ``search``-es the URL's path (+ query) wins, exactly like the old loops
+
+    router = get_router()
+    router.route("https://www.amazon.com/dp/B0CRMZHDG8")
+    # → Route(scraper=AmazonScraper, kind='product')
+    router.route_many(urls)          # bulk, same order as *urls*
+    router.group(urls)               # {AmazonScraper: {'product': [...]}, ...}
+
+Scrapers without ``PATTERNS`` route with ``kind=None`` and keep classifying
+inside their own ``collect_by_url``.
+"""
+
+from __future__ import annotations
+
+import re
+import threading
+from collections import defaultdict
+from typing import Dict, Iterable, List, Mapping, NamedTuple, Optional, Pattern, Tuple, Type, Union
+
+from brightdata.utils.domains import extract_host, split_host
+
+
+class Route(NamedTuple):
+    scraper: Type
+    kind: Optional[str]
+
+
+def compile_kinds(patterns: Mapping[str, Union[str, Pattern]]) -> Optional[Tuple[Pattern, List[str]]]:
+    """
+    Fold ``{kind: regex}`` into one anchored alternation that keeps the
+    mapping's priority: ``^(?:(?=.*?p0)|(?=.*?p1)|…)`` – branches are tried in
+    order at position 0, so the first kind that matches anywhere wins.
+    Returns ``(combined, kinds)`` or None for an empty mapping.
+    """
+    if not patterns:
+        return None
+    kinds: List[str] = []
+    branches: List[str] = []
+    for i, (kind, rx) in enumerate(patterns.items()):
+        src   = rx if isinstance(rx, str) else rx.pattern
+        flags = 0 if isinstance(rx, str) else rx.flags
+        if flags & re.IGNORECASE:
+            src = f"(?i:{src})"
+        kinds.append(kind)
+        branches.append(f"(?P<k{i}>(?=.*?(?:{src})))")
+    return re.compile("^(?:" + "|".join(branches) + ")", re.S), kinds
+
+
+class UrlRouter:
+    """
+    Parameters
+    ----------
+    registry        : ``{second-level-domain: scraper class}`` (the live
+                      `register` table – later registrations are picked up
+                      after `invalidate`)
+    max_hosts       : cap of the host memo; it is simply reset when full
+    """
+
+    def __init__(self, registry: Mapping[str, Type], *, max_hosts: int = 100_000):
+        self._registry = registry
+        self.max_hosts = max_hosts
+        self._hosts: Dict[str, Optional[Type]] = {}
+        self._kinds: Dict[Type, Optional[Tuple[Pattern, List[str]]]] = {}
+        self._lock = threading.Lock()
+
+    def invalidate(self) -> None:
+        """Forget memoised hosts / compiled patterns (after a new `register`)."""
+        with self._lock:
+            self._hosts.clear()
+            self._kinds.clear()
+
+    # ───────────────────────────── routing ────────────────────────────
+    def scraper_for(self, url: str) -> Optional[Type]:
+        """Scraper class registered for *url*'s domain, or None."""
+        return self._scraper_for_host(split_host(url)[0])
+
+    def classify(self, cls: Type, url: str) -> Optional[str]:
+        """Endpoint kind of *url* according to ``cls.PATTERNS`` (None = no match)."""
+        return self._classify(cls, split_host(url)[1])
+
+    def route(self, url: str) -> Optional[Route]:
+        """``Route(scraper, kind)`` for *url*, or None when no scraper is registered."""
+        host, target = split_host(url)
+        cls = self._scraper_for_host(host)
+        if cls is None:
+            return None
+        return Route(cls, self._classify(cls, target))
+
+    def route_many(self, urls: Iterable[str]) -> List[Optional[Route]]:
+        """`route` for every URL, in input order."""
+        route = self.route
+        return [route(u) for u in urls]
+
+    def group(self, urls: Iterable[str]) -> Dict[Optional[Type], Dict[Optional[str], List[str]]]:
+        """``{scraper: {kind: [urls…]}}``; unroutable URLs land under ``None``."""
+        out: Dict[Optional[Type], Dict[Optional[str], List[str]]] = defaultdict(lambda: defaultdict(list))
+        for u in urls:
+            r = self.route(u)
+            if r is None:
+                out[None][None].append(u)
+            else:
+                out[r.scraper][r.kind].append(u)
+        return {cls: dict(kinds) for cls, kinds in out.items()}
+
+    # ───────────────────────────── internals ──────────────────────────
+    def _scraper_for_host(self, host: str) -> Optional[Type]:
+        try:
+            return self._hosts[host]
+        except KeyError:
+            pass
+        cls = self._registry.get(extract_host(host).domain)
+        with self._lock:
+            if len(self._hosts) >= self.max_hosts:
+                self._hosts.clear()
+            self._hosts[host] = cls
+        return cls
+
+    def _classify(self, cls: Type, target: str) -> Optional[str]:
+        try:
+            compiled = self._kinds[cls]
+        except KeyError:
+            compiled = compile_kinds(getattr(cls, "PATTERNS", None) or {})
+            with self._lock:
+                self._kinds[cls] = compiled
+        if compiled is None:
+            return None
+        rx, kinds = compiled
+        m = rx.match(target)
+        return kinds[int(m.lastgroup[1:])] if m else None
+
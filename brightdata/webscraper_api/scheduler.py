@@ -0,0 +1,256 @@
+# brightdata/webscraper_api/scheduler.py
+"""
+brightdata.webscraper_api.scheduler
+===================================
+One poller for *all* outstanding snapshots.
+
+`BrightdataEngine.poll_until_ready` runs its own sleep / poll loop per
+snapshot, so N snapshots mean N coroutines waking up at random times and
+N independent streams of `/progress` calls.  `SnapshotScheduler` owns every
+pending snapshot-id instead:
+
+► one driver task, sleeping until the *earliest* snapshot is due
+► `/progress` probes paced to an aggregate rate (``max_polls_per_sec``)
+► at most ``max_in_flight`` HTTP calls at any moment
+► one `asyncio.Future[ScrapeResult]` per snapshot, resolved on completion
+
+CPU wake-ups and API calls therefore scale with the poll *rate*, not with
+the number of snapshots.
+
+    sched = SnapshotScheduler(get_engine(), poll_interval=8)
+    futs  = {sid: sched.submit(sid, timeout=300) for sid in snapshot_ids}
+    done  = await asyncio.gather(*futs.values())
+    await sched.close()
+"""
+
+from __future__ import annotations
+
+import asyncio
+import heapq
+import itertools
+import logging
+import time
+from typing import Dict, List, Optional, Tuple
+
+from brightdata.models import ScrapeResult
+
+log = logging.getLogger(__name__)
+
+_TERMINAL = {"ready", "error", "failed"}
+
+
+class _Pending:
+    __slots__ = ("snapshot_id", "future", "deadline", "timeout")
+
+    def __init__(self, snapshot_id: str, future: asyncio.Future, timeout: float):
+        self.snapshot_id = snapshot_id
+        self.future      = future
+        self.timeout     = timeout
+        self.deadline    = time.monotonic() + timeout
+
+
+class SnapshotScheduler:
+    """
+    Central, rate-limited poller for Bright Data snapshots.
+
+    Parameters
+    ----------
+    engine            : the `BrightdataEngine` used for `/progress` + `/snapshot`
+    poll_interval     : seconds between two probes of the *same* snapshot;
+                        None → ``engine.poll_policy`` (adaptive) decides
+    max_polls_per_sec : aggregate ceiling for `/progress` calls
+    max_in_flight     : concurrent HTTP calls (probes + downloads)
+    """
+
+    def __init__(
+        self,
+        engine,
+        *,
+        poll_interval: Optional[float] = None,
+        max_polls_per_sec: float = 10.0,
+        max_in_flight: int = 16,
+    ):
+        if max_polls_per_sec <= 0:
+            raise ValueError("max_polls_per_sec must be > 0")
+        self._engine        = engine
+        self.poll_interval  = poll_interval
+        self._spacing       = 1.0 / max_polls_per_sec
+        self._max_in_flight = max_in_flight
+
+        self._pending: Dict[str, _Pending] = {}
+        self._due: List[Tuple[float, int, _Pending]] = [] # (due_at, seq, entry)
+        self._seq = itertools.count()
+        self._next_slot = 0.0
+
+        self._wakeup: Optional[asyncio.Event] = None
+        self._sem: Optional[asyncio.Semaphore] = None
+        self._driver: Optional[asyncio.Task] = None
+        self._inflight: set[asyncio.Task] = set()
+
+    # ───────────────────────────── public API ─────────────────────────────
+    @property
+    def pending(self) -> int:
+        """Number of snapshots still waiting for a final result."""
+        return len(self._pending)
+
+    def submit(self, snapshot_id: str, *, timeout: float = 600) -> asyncio.Future:
+        """
+        Start tracking *snapshot_id*; returns a future resolving to its final
+        `ScrapeResult` (status ``ready`` | ``error`` | ``timeout``).
+
+        Submitting an id that is already pending returns the same future;
+        one whose future is already done (e.g. cancelled by its caller) is
+        tracked afresh.
+        """
+        entry = self._pending.get(snapshot_id)
+        if entry is not None and not entry.future.done():
+            return entry.future
+
+        loop = asyncio.get_running_loop()
+        cached = self._engine._cached_result(snapshot_id)
+        if cached is not None:                  # ResultCache hit – nothing to poll
+            fut = loop.create_future()
+            fut.set_result(cached)
+            self._engine._snap_meta.mark_delivered(snapshot_id)
+            return fut
+
+        self._ensure_driver()
+        entry = _Pending(snapshot_id, loop.create_future(), timeout)
+        self._pending[snapshot_id] = entry
+        entry.future.add_done_callback(lambda _f, e=entry: self._drop(e))
+        # fixed interval → probe right away (legacy); adaptive → the policy
+        # already knows roughly when this dataset's snapshots become ready
+        first = 0.0 if self.poll_interval is not None else self._engine.next_poll_delay(snapshot_id)
+        self._schedule(entry, time.monotonic() + min(first, timeout))
+        return entry.future
+
+    def resume(self, journal, *, timeout: float = 600) -> Dict[str, asyncio.Future]:
+        """
+        Submit every snapshot still pending in *journal* (a `JobJournal`
+        written by an earlier, crashed process); returns ``{sid: future}``.
+        """
+        futures: Dict[str, asyncio.Future] = {}
+        for sid, record in journal.pending().items():
+            self._engine.restore_meta(record)
+            futures[sid] = self.submit(sid, timeout=timeout)
+        return futures
+
+    async def wait(self, snapshot_id: str, *, timeout: float = 600) -> ScrapeResult:
+        """`submit` + await – drop-in for ``engine.poll_until_ready``."""
+        return await self.submit(snapshot_id, timeout=timeout)
+
+    async def close(self) -> None:
+        """Stop the driver and cancel whatever is still pending."""
+        if self._driver is not None:
+            self._driver.cancel()
+            await asyncio.gather(self._driver, return_exceptions=True)
+            self._driver = None
+        for t in list(self._inflight):
+            t.cancel()
+        if self._inflight:
+            await asyncio.gather(*self._inflight, return_exceptions=True)
+        for entry in self._pending.values():
+            if not entry.future.done():
+                entry.future.cancel()
+        self._pending.clear()
+        self._due.clear()
+
+    async def __aenter__(self) -> "SnapshotScheduler":
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> bool:
+        await self.close()
+        return False
+
+    # ───────────────────────────── internals ──────────────────────────────
+    def _ensure_driver(self) -> None:
+        if self._driver is None or self._driver.done():
+            self._wakeup = asyncio.Event()
+            self._sem    = asyncio.Semaphore(self._max_in_flight)
+            self._driver = asyncio.create_task(self._run(), name="bd-snapshot-scheduler")
+
+    def _schedule(self, entry: _Pending, due_at: float) -> None:
+        heapq.heappush(self._due, (due_at, next(self._seq), entry))
+        self._wakeup.set()
+
+    async def _run(self) -> None:
+        while True:
+            self._wakeup.clear()
+            now = time.monotonic()
+
+            # everything that is due right now
+            batch: List[_Pending] = []
+            while self._due and self._due[0][0] <= now:
+                _, _, entry = heapq.heappop(self._due)
+                if self._pending.get(entry.snapshot_id) is entry:   # not replaced / resolved
+                    batch.append(entry)
+
+            for entry in batch:
+                await self._pace()
+                await self._sem.acquire()
+                task = asyncio.create_task(self._probe(entry))
+                self._inflight.add(task)
+                task.add_done_callback(self._inflight.discard)
+
+            # sleep until the earliest due snapshot (or a new submit)
+            delay = (self._due[0][0] - time.monotonic()) if self._due else None
+            if delay is None or delay > 0:
+                # asyncio.wait, not wait_for: before 3.12 wait_for can swallow
+                # a cancel that races the wakeup, and close() would hang
+                waiter = asyncio.ensure_future(self._wakeup.wait())
+                try:
+                    await asyncio.wait({waiter}, timeout=delay)
+                finally:
+                    waiter.cancel()
+
+    async def _pace(self) -> None:
+        """Space consecutive probes by 1/max_polls_per_sec."""
+        now = time.monotonic()
+        if self._next_slot > now:
+            await asyncio.sleep(self._next_slot - now)
+            now = self._next_slot
+        self._next_slot = now + self._spacing
+
+    async def _probe(self, entry: _Pending) -> None:
+        snapshot_id = entry.snapshot_id
+        try:
+            if entry.future.done():                        # cancelled by its caller
+                self._drop(entry)
+                return
+            status = await self._engine.get_status(snapshot_id)
+            if status in _TERMINAL:
+                res = await self._engine.fetch_result(snapshot_id)
+                self._resolve(entry, res)
+            elif time.monotonic() >= entry.deadline:
+                self._resolve(entry, self._timeout_result(entry))
+            else:
+                delay  = self._engine.next_poll_delay(snapshot_id, self.poll_interval)
+                due_at = min(time.monotonic() + delay, entry.deadline)
+                self._schedule(entry, due_at)
+        except asyncio.CancelledError:
+            raise
+        except Exception as exc:                           # never kill the driver
+            log.debug("scheduler probe %s failed: %s", snapshot_id, exc)
+            if not entry.future.done():
+                entry.future.set_exception(exc)
+            self._drop(entry)
+        finally:
+            self._sem.release()
+
+    def _resolve(self, entry: _Pending, res: ScrapeResult) -> None:
+        self._drop(entry)
+        if not entry.future.done():
+            entry.future.set_result(res)
+
+    def _drop(self, entry: _Pending) -> None:
+        if self._pending.get(entry.snapshot_id) is entry:  # not resubmitted meanwhile
+            del self._pending[entry.snapshot_id]
+
+    def _timeout_result(self, entry: _Pending) -> ScrapeResult:
+        return self._engine._make_result(
+            success=False,
+            status="timeout",
+            snapshot_id=entry.snapshot_id,
+            url=f"{self._engine.BASE_URL}/progress/{entry.snapshot_id}",
+            error=f"gave up after {entry.timeout}s",
+        )
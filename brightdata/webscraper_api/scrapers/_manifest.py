@@ -0,0 +1,12 @@
+# brightdata/webscraper_api/scrapers/_manifest.py
+# GENERATED by `python -m brightdata.other.build_manifest` – do not edit.
+"""Domain (second-level) → (scraper module, class name) of every bundled scraper."""
+
+MANIFEST = {'amazon': ('brightdata.webscraper_api.scrapers.amazon.scraper', 'AmazonScraper'),
+ 'digikey': ('brightdata.webscraper_api.scrapers.digikey.scraper', 'DigikeyScraper'),
+ 'instagram': ('brightdata.webscraper_api.scrapers.instagram.scraper', 'InstagramScraper'),
+ 'linkedin': ('brightdata.webscraper_api.scrapers.linkedin.scraper', 'LinkedInScraper'),
+ 'mouser': ('brightdata.webscraper_api.scrapers.mouser.scraper', 'MouserScraper'),
+ 'reddit': ('brightdata.webscraper_api.scrapers.reddit.scraper', 'RedditScraper'),
+ 'tiktok': ('brightdata.webscraper_api.scrapers.tiktok.scraper', 'TikTokScraper'),
+ 'x': ('brightdata.webscraper_api.scrapers.x.scraper', 'XScraper')}
@@ -13,7 +13,7 @@ import re, asyncio
 from collections import defaultdict
 
 from brightdata.webscraper_api.base_specialized_scraper import BrightdataBaseSpecializedScraper
-from brightdata.webscraper_api.registry import register
+from brightdata.webscraper_api.registry import register, get_router
 
 
 @register("amazon")
@@ -39,9 +39,9 @@ class AmazonScraper(BrightdataBaseSpecializedScraper):
 
     
     def classify_url(self, url: str) -> str:
-        for kind, rx in self.PATTERNS.items():
-            if rx.search(url):
-                return kind
+        kind = get_router().classify(type(self), url)
+        if kind is not None:
+            return kind
         raise ValueError(f"Unrecognised Amazon URL: {url}")
     
     
@@ -186,7 +186,7 @@ class AmazonScraper(BrightdataBaseSpecializedScraper):
     # =====================================================================
     # ASYNC variants (use _trigger_async)
     # =====================================================================
-    async def collect_by_url_async(
+    async def collect_by_urls_async(
         self, urls: Sequence[str], zipcodes: Optional[Sequence[str]] = None
     ) -> Dict[str, str]:
         buckets = self.dispatch_by_regex(urls, self.PATTERNS)
@@ -204,8 +204,9 @@ class AmazonScraper(BrightdataBaseSpecializedScraper):
                 self._trigger_async(payload, dataset_id=self._DATASET["collect"])
             )
         if "search" in buckets:
-            domains = self.config.get("domains", ["https://www.amazon.com"] * len(buckets["search"]))
-            pages   = self.config.get("pages",   [1] * len(buckets["search"]))
+            config  = getattr(self, "config", {})
+            domains = config.get("domains", ["https://www.amazon.com"] * len(buckets["search"]))
+            pages   = config.get("pages",   [1] * len(buckets["search"]))
             payload = [
                 {"keyword": kw, "url": domains[i], "pages_to_search": pages[i]}
                 for i, kw in enumerate(buckets["search"])
@@ -11,10 +11,9 @@ from __future__ import annotations
 import re, asyncio
 from collections import defaultdict
 from typing import Any, Dict, List, Optional, Sequence
-from urllib.parse import urlparse
 
 from brightdata.webscraper_api.base_specialized_scraper import BrightdataBaseSpecializedScraper
-from brightdata.webscraper_api.registry import register
+from brightdata.webscraper_api.registry import register, get_router
 
 # dataset-ids
 _DATASET_PEOPLE   = "gd_l1viktl72bvl7bjuj0"
@@ -31,6 +30,9 @@ class LinkedInScraper(BrightdataBaseSpecializedScraper):
     _RX_COMPANY = re.compile(r"^/company/[^/]+/?",  re.I)
     _RX_JOB     = re.compile(r"^/jobs/view/",       re.I)
 
+    # endpoint kind → path regex (compiled into the `UrlRouter`)
+    PATTERNS = {"people": _RX_PEOPLE, "company": _RX_COMPANY, "job": _RX_JOB}
+
     # ───────────────────────── constructor ─────────────────────────
     def __init__(self, bearer_token: Optional[str] = None, **kw):
         super().__init__(_DEFAULT_DATASET, bearer_token, **kw)
@@ -86,11 +88,7 @@ class LinkedInScraper(BrightdataBaseSpecializedScraper):
         
     
     def _classify(self, url: str) -> str | None:
-        path = urlparse(url).path
-        if self._RX_PEOPLE.match(path):  return "people"
-        if self._RX_COMPANY.match(path): return "company"
-        if self._RX_JOB.match(path):     return "job"
-        return None
+        return get_router().classify(type(self), url)
 
     # ─────────────────── PEOPLE: collect & discover ───────────────────
     def people_profiles__collect_by_url(self, urls: Sequence[str]) -> str:
@@ -167,11 +165,11 @@ class LinkedInScraper(BrightdataBaseSpecializedScraper):
     
     # individual async wrappers (examples)
     async def people_profiles__collect_by_url_async(self, urls: Sequence[str]) -> str:
-        return await self._trigger_async([{"url": u} for u in urls], _DATASET_PEOPLE)
+        return await self._trigger_async([{"url": u} for u in urls], dataset_id=_DATASET_PEOPLE)
 
     async def company_information__collect_by_url_async(self, urls: Sequence[str]) -> str:
-        return await self._trigger_async([{"url": u} for u in urls], _DATASET_COMPANY)
+        return await self._trigger_async([{"url": u} for u in urls], dataset_id=_DATASET_COMPANY)
 
     async def job_listing_information__collect_by_url_async(self, urls: Sequence[str]) -> str:
-        return await self._trigger_async([{"url": u} for u in urls], _DATASET_JOBS)
+        return await self._trigger_async([{"url": u} for u in urls], dataset_id=_DATASET_JOBS)
 
@@ -200,7 +200,7 @@ class TikTokScraper(BrightdataBaseSpecializedScraper):
     # ══════════════════════════════════════════════════════════════════════
     # 5.  Async mirrors
     # ══════════════════════════════════════════════════════════════════════
-    async def collect_by_url_async(
+    async def collect_by_urls_async(
         self,
         urls: Sequence[str],
         include_comments: bool = False,
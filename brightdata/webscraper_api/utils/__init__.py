@@ -2,15 +2,15 @@
 Web Scraper API utilities
 """
 
-from .poll import poll_until_ready, poll_until_ready_async
-from .async_poll import async_poll
+from .poll import poll_until_ready
+from .async_poll import fetch_snapshot_async, fetch_snapshots_async
 from .thread_poll import PollWorker
-from .concurrent_trigger import concurrent_trigger
+from .concurrent_trigger import trigger_keywords_concurrently
 
 __all__ = [
     'poll_until_ready',
-    'poll_until_ready_async', 
-    'async_poll',
+    'fetch_snapshot_async',
+    'fetch_snapshots_async',
     'PollWorker',
-    'concurrent_trigger',
+    'trigger_keywords_concurrently',
 ]
\ No newline at end of file
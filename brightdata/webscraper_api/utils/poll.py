@@ -20,7 +20,7 @@ import time
 from typing import Union, Callable, Optional
 from pprint import pprint
 from brightdata.models import ScrapeResult
-import tldextract
+from brightdata.utils.domains import root_domain
 
 
 
@@ -89,8 +89,7 @@ def poll_until_ready(
     start = time.time()
     status_url = f"{scraper.status_base_url}/{snapshot_id}"
     # Extract root_domain for reuse
-    ext = tldextract.extract(status_url)
-    root = ext.domain or None
+    root = root_domain(status_url)
 
     while True:
         res: ScrapeResult = scraper.get_data(snapshot_id)
@@ -24,7 +24,7 @@ def on_done(result):                                   # your callback
 worker = PollWorker(
     scraper       = scraper,
     snapshot_ids  = [snap_id],
-    interval      = 15,          # seconds between probes
+    interval      = 15,          # seconds between probes (None → adaptive)
     timeout       = 600,         # per snapshot
     callback      = on_done      # or output_dir="results/"
 )
@@ -34,7 +34,7 @@ worker.start()                   # returns immediately
 
 from __future__ import annotations
 import json, time, threading, pathlib, queue, os
-from typing import List, Callable, Optional
+from typing import Dict, List, Callable, Optional
 from ..base_specialized_scraper import  BrightdataBaseSpecializedScraper
 from brightdata.models import ScrapeResult
 
@@ -57,7 +57,7 @@ class PollWorker(threading.Thread):
         scraper: BrightdataBaseSpecializedScraper,
         snapshot_ids: List[str],
         *,
-        interval: int = 10,
+        interval: Optional[float] = None,
         timeout:  int = 600,
         callback: Optional[Callable[[ScrapeResult], None]] = None,
         output_dir: Optional[str] = None,
@@ -68,7 +68,9 @@ class PollWorker(threading.Thread):
 
         self.scraper      = scraper
         self.snapshot_ids = list(snapshot_ids)
-        self.interval     = max(1, interval)
+        # None → every snapshot gets its own delay from the engine's
+        #        AdaptivePollPolicy (learned per dataset_id)
+        self.interval     = max(1, interval) if interval is not None else None
         self.timeout      = timeout
         self.callback     = callback
         self.output_dir   = pathlib.Path(output_dir) if output_dir else None
@@ -82,6 +84,7 @@ class PollWorker(threading.Thread):
     def run(self) -> None:                                    # thread body
         start_time: dict[str, float] = {sid: time.time()
                                         for sid in self.snapshot_ids}
+        next_due: Dict[str, float] = dict(start_time)
 
         remaining = set(self.snapshot_ids)
 
@@ -97,13 +100,24 @@ class PollWorker(threading.Thread):
                     remaining.remove(sid)
                     continue
 
+                if next_due[sid] > now:                       # not due yet
+                    continue
+
                 res = self.scraper.get_data(sid)              # blocking GET
 
                 if res.status in {"ready", "error"}:
                     self._handle_result(res, sid)
                     remaining.remove(sid)
+                else:
+                    next_due[sid] = time.time() + self._delay_for(sid)
+
+            if remaining:
+                wake_at = min(next_due[sid] for sid in remaining)
+                time.sleep(max(0.0, wake_at - time.time()))
 
-            time.sleep(self.interval)
+    def _delay_for(self, snapshot_id: str) -> float:
+        """Fixed interval, or the adaptive delay the engine suggests."""
+        return self.scraper._engine.next_poll_delay(snapshot_id, self.interval)
 
     # ------------------------------------------------------------------ #
     # internal helpers
@@ -310,6 +310,26 @@ def test_10_environment_setup():
         return True  # Not a failure for import tests
 
 
+def test_11_manifest_up_to_date():
+    """Test 11: Bundled scraper manifest matches the @register() decorators"""
+    print("\n[Test 11] Checking scraper manifest...")
+    
+    try:
+        from brightdata.webscraper_api.registry import build_manifest
+        from brightdata.webscraper_api.scrapers._manifest import MANIFEST
+        
+        current = build_manifest()
+        if current == MANIFEST:
+            print(f"✓ Manifest lists all {len(MANIFEST)} scrapers")
+            return True
+        print("✗ Manifest is stale – run: python -m brightdata.other.build_manifest")
+        return False
+        
+    except Exception as e:
+        print(f"✗ Manifest check failed: {e}")
+        return False
+
+
 def main():
     """Run all import and initialization tests"""
     print("=" * 60)
@@ -327,6 +347,7 @@ def main():
         test_08_scraper_methods,
         test_09_auto_import,
         test_10_environment_setup,
+        test_11_manifest_up_to_date,
     ]
     
     passed = 0
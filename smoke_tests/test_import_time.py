@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""
+Import-time guard
+Checks that `import brightdata` stays cheap: no Playwright / Selenium /
+aiohttp / requests / dotenv at import, no .env read, and a time budget.
+Every measurement runs in a fresh interpreter.
+"""
+# To run: python -m smoke_tests.test_import_time
+
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).parent.parent
+
+HEAVY = ("playwright", "selenium", "aiohttp", "requests", "dotenv", "tldextract")
+
+# cumulative µs of the top-level package, as reported by -X importtime
+BUDGET_US = 20_000
+
+
+def _run(code: str, *flags: str) -> subprocess.CompletedProcess:
+    return subprocess.run(
+        [sys.executable, *flags, "-c", code],
+        cwd=ROOT, capture_output=True, text=True, timeout=60,
+    )
+
+
+def _cumulative_us(stderr: str, module: str) -> int:
+    """Cumulative import time of *module* from ``-X importtime`` output."""
+    for line in stderr.splitlines():
+        parts = [p.strip() for p in line.split("|")]
+        if len(parts) == 3 and parts[2] == module:
+            return int(parts[1])
+    raise LookupError(module)
+
+
+def test_01_no_heavy_modules():
+    """Test 01: `import brightdata` loads none of the heavy dependencies"""
+    print("\n[Test 01] Heavy modules after `import brightdata`...")
+    proc = _run(
+        "import sys, brightdata;"
+        f"print(','.join(m for m in {HEAVY!r} if m in sys.modules))"
+    )
+    loaded = [m for m in proc.stdout.strip().split(",") if m]
+    if proc.returncode or loaded:
+        print(f"✗ Loaded at import: {loaded or proc.stderr.strip()}")
+        return False
+    print("✓ None loaded")
+    return True
+
+
+def test_02_import_budget():
+    """Test 02: `import brightdata` fits the time budget"""
+    print("\n[Test 02] Import time of `brightdata`...")
+    best = min(
+        _cumulative_us(_run("import brightdata", "-X", "importtime").stderr, "brightdata")
+        for _ in range(3)
+    )
+    if best > BUDGET_US:
+        print(f"✗ {best / 1000:.1f} ms > budget {BUDGET_US / 1000:.1f} ms")
+        return False
+    print(f"✓ {best / 1000:.1f} ms (budget {BUDGET_US / 1000:.1f} ms)")
+    return True
+
+
+def test_03_lazy_names_resolve():
+    """Test 03: every public name still resolves on first access"""
+    print("\n[Test 03] Resolving public names...")
+    proc = _run(
+        "import brightdata, brightdata.webscraper_api as w;"
+        "[getattr(brightdata, n) for n in brightdata.__all__];"
+        "[getattr(w, n) for n in w.__all__]"
+    )
+    if proc.returncode:
+        print(f"✗ {proc.stderr.strip().splitlines()[-1]}")
+        return False
+    print("✓ All names resolve")
+    return True
+
+
+def test_04_scraper_without_browser_stack():
+    """Test 04: importing a specialised scraper skips Playwright / Selenium"""
+    print("\n[Test 04] Heavy modules after importing AmazonScraper...")
+    proc = _run(
+        "import sys;"
+        "from brightdata.webscraper_api.scrapers.amazon.scraper import AmazonScraper;"
+        "print(','.join(m for m in ('playwright', 'selenium', 'requests') if m in sys.modules))"
+    )
+    loaded = [m for m in proc.stdout.strip().split(",") if m]
+    if proc.returncode or loaded:
+        print(f"✗ Loaded: {loaded or proc.stderr.strip()}")
+        return False
+    print("✓ Browser stack not loaded")
+    return True
+
+
+def main():
+    """Run the import-time checks"""
+    print("=" * 60)
+    print("Import-time guard")
+    print("=" * 60)
+
+    tests = [
+        test_01_no_heavy_modules,
+        test_02_import_budget,
+        test_03_lazy_names_resolve,
+        test_04_scraper_without_browser_stack,
+    ]
+
+    passed = 0
+    failed = 0
+
+    for test in tests:
+        try:
+            if test():
+                passed += 1
+            else:
+                failed += 1
+        except Exception as e:
+            print(f"\n✗ Test {test.__name__} crashed: {e}")
+            failed += 1
+
+    print("\n" + "=" * 60)
+    print(f"Summary: {passed} passed, {failed} failed out of {len(tests)} tests")
+    print("=" * 60)
+
+    return failed == 0
+
+
+if __name__ == "__main__":
+    success = main()
+    sys.exit(0 if success else 1)
@@ -212,6 +212,10 @@ def test_09_method_availability():
         ("download_source_safe", "Safe download"),
         ("get_source_async", "Async fetch"),
         ("get_source_safe_async", "Safe async fetch"),
+        ("get_sources_async", "Pooled bulk async fetch (streaming)"),
+        ("get_sources", "Pooled bulk sync fetch"),
+        ("pooling", "Pooled-session block"),
+        ("close", "Close pooled sessions"),
         ("test_unlocker", "Test method"),
         ("_make_result", "Result factory (private)"),
     ]
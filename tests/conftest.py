@@ -0,0 +1,80 @@
+# tests/conftest.py
+"""
+Shared fixtures for the offline unit tests.
+
+`local_api` runs a tiny aiohttp app on 127.0.0.1 in a background thread,
+so code under test can call it from any number of ``asyncio.run`` loops.
+Every request is recorded as ``(method, path)`` in ``server.calls``;
+``server.script[path]`` is a list of statuses answered (and consumed)
+before the normal reply – ``0`` drops the connection instead.
+``server.bodies[path]`` replaces the normal reply with a list of byte
+chunks, each written (and flushed) separately.
+"""
+
+import asyncio
+import threading
+
+import pytest
+from aiohttp import web
+
+
+class LocalServer:
+    def __init__(self) -> None:
+        self.calls = []
+        self.script = {}
+        self.bodies = {}
+        self.url = ""
+        self._loop = asyncio.new_event_loop()
+        self._runner = None
+
+    async def _handle(self, request: web.Request) -> web.Response:
+        self.calls.append((request.method, request.path))
+        pending = self.script.get(request.path)
+        if pending:
+            status = pending.pop(0)
+            if status == 0:
+                request.transport.close()
+                raise ConnectionResetError
+            return web.Response(status=status)
+        if request.path in self.bodies:
+            resp = web.StreamResponse()
+            await resp.prepare(request)
+            for chunk in self.bodies[request.path]:
+                await resp.write(chunk)
+                await asyncio.sleep(0.01)          # separate reads on the client
+            await resp.write_eof()
+            return resp
+        if request.path.startswith("/progress/"):
+            return web.json_response({"status": "running"})
+        if request.path == "/trigger":
+            return web.json_response({"snapshot_id": "s_new"})
+        if request.path.startswith("/snapshot/"):
+            return web.Response(text='{"n": 1}\n{"n": 2}\n')
+        body = await request.read()
+        return web.Response(text=f"ok {request.path} {len(body)}")
+
+    async def _start(self) -> None:
+        app = web.Application()
+        app.router.add_route("*", "/{tail:.*}", self._handle)
+        self._runner = web.AppRunner(app)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, "127.0.0.1", 0)
+        await site.start()
+        port = site._server.sockets[0].getsockname()[1]
+        self.url = f"http://127.0.0.1:{port}"
+
+    def start(self) -> None:
+        threading.Thread(target=self._loop.run_forever, daemon=True).start()
+        asyncio.run_coroutine_threadsafe(self._start(), self._loop).result(5)
+
+    def stop(self) -> None:
+        asyncio.run_coroutine_threadsafe(self._runner.cleanup(), self._loop).result(5)
+        self._loop.call_soon_threadsafe(self._loop.stop)
+
+
+@pytest.fixture
+def local_api():
+    server = LocalServer()
+    server.start()
+    yield server
+    server.stop()
@@ -0,0 +1,99 @@
+# tests/test_autotune.py
+import asyncio
+
+import pytest
+
+from brightdata.browserapi.autotune import AIMDController, ResizableLimiter
+
+
+def _window(ctl, latency, *, ok=True, saturated=True, n=None):
+    change = None
+    for _ in range(n or ctl.window):
+        change = ctl.record(latency, ok, saturated=saturated) or change
+    return change
+
+
+def test_grows_additively_only_when_saturated():
+    ctl = AIMDController(initial=4, window=10, max_limit=6)
+    assert _window(ctl, 1.0) == 5
+    assert _window(ctl, 1.0, saturated=False) is None
+    assert ctl.limit == 5
+    assert _window(ctl, 1.0) == 6
+    assert _window(ctl, 1.0) is None                 # at max_limit
+    assert ctl.increases == 2
+
+
+def test_latency_blowup_cuts_multiplicatively():
+    ctl = AIMDController(initial=8, window=10, latency_factor=2.0, decrease=0.5)
+    _window(ctl, 1.0)                                # baseline p95 = 1 s
+    assert ctl.limit == 9
+    assert _window(ctl, 3.0) == 4
+    assert ctl.last_reason.startswith("p95")
+
+
+def test_error_burst_cuts_without_waiting_for_the_window():
+    ctl = AIMDController(initial=8, window=20, max_error_rate=0.1, min_limit=2)
+    results = [ctl.record(None, False) for _ in range(3)]
+    assert results == [None, None, 4]
+    assert ctl.last_reason == "error burst"
+    for _ in range(6):
+        ctl.record(None, False)
+    assert ctl.limit == 2                            # never below min_limit
+
+
+def test_slow_handshakes_cut():
+    ctl = AIMDController(initial=8, window=5, handshake_factor=3.0)
+    for _ in range(5):
+        ctl.record_handshake(0.5)
+    _window(ctl, 1.0)
+    for _ in range(5):
+        ctl.record_handshake(2.0)
+    assert _window(ctl, 1.0, saturated=False) == 4
+    assert ctl.last_reason.startswith("handshake")
+
+
+def test_invalid_decrease():
+    with pytest.raises(ValueError):
+        AIMDController(decrease=1.0)
+
+
+def test_limiter_is_fifo_and_resizable():
+    order = []
+
+    async def worker(lim, name, hold):
+        async with lim:
+            order.append(name)
+            await hold.wait()
+
+    async def main():
+        lim = ResizableLimiter(1)
+        hold = asyncio.Event()
+        tasks = [asyncio.create_task(worker(lim, n, hold)) for n in "abcd"]
+        await asyncio.sleep(0)
+        assert order == ["a"] and lim.saturated()
+        lim.set_limit(3)                             # grow → waiters let in now
+        await asyncio.sleep(0)
+        assert order == ["a", "b", "c"] and lim.in_flight == 3
+        lim.set_limit(1)                             # shrink → applies as permits return
+        hold.set()
+        await asyncio.gather(*tasks)
+        assert order == ["a", "b", "c", "d"]
+        assert lim.in_flight == 0 and not lim.saturated()
+
+    asyncio.run(main())
+
+
+def test_cancelled_waiter_passes_its_permit_on():
+    async def main():
+        lim = ResizableLimiter(1)
+        await lim.acquire()
+        waiter = asyncio.create_task(lim.acquire())
+        nxt = asyncio.create_task(lim.acquire())
+        await asyncio.sleep(0)
+        lim.release()                                # handed to `waiter` …
+        waiter.cancel()                              # … which is cancelled first
+        await asyncio.gather(waiter, return_exceptions=True)
+        await asyncio.wait_for(nxt, 1)               # permit reached the next one
+        assert lim.in_flight == 1
+
+    asyncio.run(main())
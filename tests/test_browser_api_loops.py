@@ -0,0 +1,108 @@
+# tests/test_browser_api_loops.py
+"""Loop-bound state of BrowserAPI, with stand-in sessions (no browser)."""
+import asyncio
+
+import pytest
+
+from brightdata.browserapi import browser_api as browser_api_mod
+from brightdata.browserapi.browser_api import BrowserAPI
+from brightdata.browserapi.browser_pool import BrowserPool
+from brightdata.browserapi.browserapi_engine import BrowserapiEngine
+
+
+class FakeSession:
+    opened = []
+
+    def __init__(self):
+        self.loop = asyncio.get_running_loop()
+        self.closed = False
+        FakeSession.opened.append(self)
+
+    @classmethod
+    async def create(cls):
+        await asyncio.sleep(0)
+        return cls()
+
+    def is_connected(self):
+        return not self.closed
+
+    def holds_context(self, domain):
+        return False
+
+    async def fetch_page(self, url, **kw):
+        # a session must only ever be used on the loop that opened it
+        assert asyncio.get_running_loop() is self.loop
+        return "<html>ok</html>", 0.01
+
+    async def close(self):
+        self.closed = True
+
+
+@pytest.fixture(autouse=True)
+def fake_sessions(monkeypatch):
+    FakeSession.opened = []
+    monkeypatch.setattr(BrowserapiEngine, "create", FakeSession.create)
+    return FakeSession
+
+
+@pytest.mark.parametrize("strategy,kw", [
+    ("noop", {"prewarm": 2}),
+    ("semaphore", {"prewarm": 1, "max_concurrent": 2}),
+    ("pool", {"pool_size": 2}),
+])
+def test_sync_fetch_gets_fresh_state_per_loop(strategy, kw):
+    api = BrowserAPI(strategy=strategy, **kw)
+    for _ in range(3):
+        res = api.fetch("https://example.com/")
+        assert res.success, res.error
+    assert api._warmers == {} and api._pools == {}
+    assert FakeSession.opened and all(s.closed for s in FakeSession.opened)
+
+
+def test_async_state_is_per_loop_and_closed():
+    api = BrowserAPI(strategy="noop", prewarm=2)
+
+    async def batch():
+        results = await asyncio.gather(*(api.fetch_async(f"https://a.com/{i}") for i in range(4)))
+        assert all(r.success for r in results)
+        return api._warmers[asyncio.get_running_loop()]
+
+    async def main():
+        first = await batch()
+        assert await batch() is first                 # same loop → same warmer
+        await api.close()
+        assert api._warmers == {}
+
+    asyncio.run(main())
+    assert all(s.closed for s in FakeSession.opened)
+
+
+def test_caller_pool_is_rejected_on_other_loops():
+    pool = BrowserPool(size=1, session_factory=FakeSession.create)
+    api = BrowserAPI(strategy="pool", pool=pool)
+    with pytest.raises(RuntimeError):
+        api.fetch("https://example.com/")
+
+    async def use():
+        return await api.fetch_async("https://example.com/")
+
+    assert asyncio.run(use()).success
+    with pytest.raises(RuntimeError):                 # second loop – refused
+        asyncio.run(use())
+
+
+def test_no_finaliser_runs_event_loops():
+    assert "__del__" not in vars(browser_api_mod.BrowserAPI)
+
+
+def test_warmer_refuses_a_second_loop():
+    from brightdata.browserapi.warmer import SessionWarmer
+
+    warmer = SessionWarmer(target=1, session_factory=FakeSession.create)
+
+    async def use():
+        warmer.discard(await warmer.take())
+
+    asyncio.run(use())
+    with pytest.raises(RuntimeError):
+        asyncio.run(use())
@@ -0,0 +1,80 @@
+# tests/test_browser_pool.py
+"""BrowserPool shutdown, with stand-in sessions (no browser)."""
+import asyncio
+
+from brightdata.browserapi.browser_pool import BrowserPool
+
+
+class SlowSession:
+    opened = []
+
+    def __init__(self):
+        self.closed = False
+        SlowSession.opened.append(self)
+
+    @classmethod
+    async def create(cls):
+        await asyncio.sleep(0.02)
+        return cls()
+
+    def is_connected(self):
+        return not self.closed
+
+    def holds_context(self, domain):
+        return False
+
+    async def close(self):
+        await asyncio.sleep(0.01)
+        self.closed = True
+
+
+def _pool(**kw):
+    SlowSession.opened = []
+    return BrowserPool(session_factory=SlowSession.create, **kw)
+
+
+def test_close_waits_for_browsers_retired_during_close():
+    pool = _pool(size=4, spares=2)
+
+    async def main():
+        pool._condition()
+        pool._refill()                  # background warm-up, still connecting
+        await asyncio.sleep(0)
+        await pool.close()
+        return len(pool._background)
+
+    assert asyncio.run(main()) == 0
+    assert len(SlowSession.opened) == 2
+    assert all(s.closed for s in SlowSession.opened)
+
+
+def test_refill_queued_before_close_connects_nothing():
+    pool = _pool(size=4, spares=2)
+
+    async def main():
+        pool._condition()
+        pool._refill()                  # task created, not yet started
+        await pool.close()
+
+    asyncio.run(main())
+    assert SlowSession.opened == []
+
+
+def test_waiter_fails_when_the_pool_closes():
+    pool = _pool(size=1, spares=0)
+
+    async def main():
+        held = await pool.acquire()
+        waiter = asyncio.ensure_future(pool.acquire(timeout=5))
+        await asyncio.sleep(0.01)
+        await pool.close()
+        try:
+            await waiter
+        except RuntimeError as e:
+            result = str(e)
+        await pool.release(held)
+        await asyncio.sleep(0.02)
+        return result, held.session.closed
+
+    assert asyncio.run(main()) == ("BrowserPool is closed", True)
+    assert len(SlowSession.opened) == 1
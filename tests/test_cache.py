@@ -0,0 +1,86 @@
+# tests/test_cache.py
+import pickle
+from datetime import datetime
+
+import pytest
+
+from brightdata.models import ScrapeResult
+from brightdata.webscraper_api.cache import (
+    CACHE_SID_PREFIX,
+    MemoryResultCache,
+    ResultCache,
+    SQLiteResultCache,
+    cache_key,
+    cache_sid,
+)
+
+
+def _ok(url="https://a.com/x"):
+    return ScrapeResult(success=True, url=url, status="ready", data=[{"a": 1}])
+
+
+def test_cache_key_is_canonical():
+    a = cache_key("gd_1", [{"url": "HTTPS://A.com/x/#frag"}, {"url": " https://b.com "}])
+    b = cache_key("gd_1", [{"url": "https://b.com/"}, {"url": "https://a.com/x"}])
+    assert a == b
+    assert a.startswith("gd_1:")
+    assert a != cache_key("gd_1", [{"url": "https://a.com/y"}, {"url": "https://b.com"}])
+    assert a != cache_key("gd_1", [{"url": "https://b.com"}, {"url": "https://a.com/x"}],
+                          include_errors=False)
+
+
+def test_cache_sid_differs_per_dataset():
+    payload = [{"url": "https://a.com/x"}]
+    sid_1 = cache_sid(cache_key("gd_1", payload))
+    sid_2 = cache_sid(cache_key("gd_2", payload))
+    assert sid_1 != sid_2
+    assert sid_1.startswith(CACHE_SID_PREFIX)
+    assert sid_1 == cache_sid(cache_key("gd_1", payload))
+
+
+def test_memory_cache_ttl_and_lru(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr("brightdata.webscraper_api.cache.time.time", lambda: now[0])
+    cache = MemoryResultCache(max_entries=2, default_ttl=60, ttls={"gd_short": 5})
+    cache.set("gd_long:1", _ok())
+    cache.set("gd_short:2", _ok())
+    now[0] += 10
+    assert cache.get("gd_short:2") is None           # per-dataset ttl
+    assert cache.get("gd_long:1") is not None
+    cache.set("gd_long:3", _ok())
+    cache.set("gd_long:4", _ok())                    # evicts the LRU entry
+    assert cache.get("gd_long:1") is None
+    assert (cache.hits, cache.misses) == (1, 2)
+
+
+def test_failures_are_not_cached(tmp_path):
+    cache = SQLiteResultCache(tmp_path / "c.sqlite")
+    cache.set("gd_1:x", ScrapeResult(success=False, url="u", status="error"))
+    assert cache.get("gd_1:x") is None
+    cache.set("gd_1:y", _ok())
+    assert cache.get("gd_1:y").data == [{"a": 1}]
+    cache.close()
+
+
+def test_result_cache_is_abstract():
+    with pytest.raises(TypeError):
+        ResultCache()
+
+
+def test_sqlite_cache_stores_json_not_pickles(tmp_path):
+    cache = SQLiteResultCache(tmp_path / "c.sqlite")
+    sent = datetime(2024, 5, 1, 12, 30)
+    res = ScrapeResult(success=True, url="u", status="ready", data=[{"a": 1}],
+                       request_sent_at=sent, snapshot_polled_at=[sent])
+    cache.set("gd_1:x", res)
+    (blob,) = cache._conn.execute("SELECT result FROM results").fetchone()
+    assert isinstance(blob, str) and '"a": 1' in blob
+    hit = cache.get("gd_1:x")
+    assert hit.request_sent_at == sent and hit.snapshot_polled_at == [sent]
+
+    # a pickled row (older cache file) is never unpickled – just dropped
+    with cache._conn:
+        cache._conn.execute("UPDATE results SET result = ?", (pickle.dumps(res),))
+    assert cache.get("gd_1:x") is None
+    assert cache._conn.execute("SELECT COUNT(*) FROM results").fetchone() == (0,)
+    cache.close()
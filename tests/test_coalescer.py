@@ -0,0 +1,34 @@
+# tests/test_coalescer.py
+from brightdata.models import ScrapeResult
+from brightdata.webscraper_api.coalescer import split_result_by_input
+
+
+def _result(rows):
+    return ScrapeResult(
+        success=True, url="batch", status="ready", data=rows,
+        snapshot_id="s_1", cost=0.003, row_count=len(rows),
+    )
+
+
+def test_split_matches_rows_to_inputs():
+    rows = [
+        {"input": {"url": "https://a.com/1"}, "title": "a"},
+        {"input": {"url": "https://b.com/2"}, "title": "b1"},
+        {"url": "https://b.com/2", "title": "b2"},
+    ]
+    out = split_result_by_input(_result(rows), ["https://a.com/1", "https://b.com/2"])
+    assert out["https://a.com/1"].data == rows[:1]
+    assert out["https://b.com/2"].row_count == 2
+    assert out["https://b.com/2"].cost == 0.002
+    assert all(r.success and r.snapshot_id == "s_1" for r in out.values())
+
+
+def test_split_unmatched_input_is_a_failure():
+    rows = [{"input": {"url": "https://a.com/1"}}]
+    out = split_result_by_input(_result(rows), ["https://a.com/1", "https://c.com/3"])
+    missing = out["https://c.com/3"]
+    assert not missing.success
+    assert missing.status == "error"
+    assert missing.error == "no matching record"
+    assert missing.data is None and missing.cost == 0.0
+    assert out["https://a.com/1"].success
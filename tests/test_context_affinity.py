@@ -0,0 +1,120 @@
+# tests/test_context_affinity.py
+"""BrowserapiEngine context affinity with a stand-in browser (no Playwright)."""
+import asyncio
+
+from brightdata.browserapi.browserapi_engine import BrowserapiEngine
+from brightdata.browserapi.interception import PROFILES
+
+
+class FakePage:
+    def __init__(self):
+        self.closed = False
+
+    def is_closed(self):
+        return self.closed
+
+    async def goto(self, url):
+        pass
+
+    async def close(self):
+        self.closed = True
+
+
+class FakeContext:
+    def __init__(self):
+        self.closed = False
+
+    async def new_page(self):
+        assert not self.closed, "page opened on a closed context"
+        return FakePage()
+
+    async def route(self, pattern, handler):
+        pass
+
+    async def close(self):
+        self.closed = True
+
+
+class FakeBrowser:
+    async def new_context(self, **kw):
+        return FakeContext()
+
+
+def _engine(max_contexts):
+    eng = BrowserapiEngine(None, FakeBrowser())
+    eng.max_affine_contexts = max_contexts
+    return eng
+
+
+def test_new_context_is_not_evicted_while_being_served():
+    eng = _engine(1)
+
+    async def main():
+        for url in ("https://a.com/", "https://b.com/", "https://c.com/"):
+            entry, page = await eng._affine_page(url, PROFILES["none"], (800, 600))
+            assert not entry.context.closed
+            await page.goto(url)
+            await eng._park(entry, page, True)
+        return eng
+
+    asyncio.run(main())
+    assert [e.domain for e in eng._affine.values()] == ["c"]
+
+
+def test_busy_contexts_are_kept_over_the_cap():
+    eng = _engine(1)
+
+    async def main():
+        a, page_a = await eng._affine_page("https://a.com/", PROFILES["none"], (800, 600))
+        b, page_b = await eng._affine_page("https://b.com/", PROFILES["none"], (800, 600))
+        assert not a.context.closed and not b.context.closed     # both in use
+        await eng._park(a, page_a, True)
+        await eng._park(b, page_b, True)
+        c, page_c = await eng._affine_page("https://c.com/", PROFILES["none"], (800, 600))
+        assert a.context.closed and b.context.closed and not c.context.closed
+        assert eng.holds_context("c") and not eng.holds_context("a")
+
+    asyncio.run(main())
+
+
+class SlowBrowser(FakeBrowser):
+    def __init__(self, fail_first=False):
+        self.opened = 0
+        self.fail_first = fail_first
+
+    async def new_context(self, **kw):
+        self.opened += 1
+        await asyncio.sleep(0.01)
+        if self.fail_first and self.opened == 1:
+            raise RuntimeError("CDP hiccup")
+        return FakeContext()
+
+
+def test_concurrent_fetches_share_one_new_context():
+    browser = SlowBrowser()
+    eng = BrowserapiEngine(None, browser)
+
+    async def main():
+        return await asyncio.gather(*(
+            eng._affine_page("https://a.com/x", PROFILES["none"], (800, 600)) for _ in range(3)
+        ))
+
+    served = asyncio.run(main())
+    assert browser.opened == 1
+    assert len({id(entry) for entry, _ in served}) == 1
+    assert served[0][0].busy == 3
+    assert list(eng._affine) == [("a", PROFILES["none"], (800, 600))] and eng._opening == {}
+
+
+def test_waiters_open_the_context_when_the_opener_fails():
+    browser = SlowBrowser(fail_first=True)
+    eng = BrowserapiEngine(None, browser)
+
+    async def main():
+        return await asyncio.gather(*(
+            eng._affine_page("https://a.com/x", PROFILES["none"], (800, 600)) for _ in range(2)
+        ), return_exceptions=True)
+
+    first, second = asyncio.run(main())
+    assert isinstance(first, RuntimeError)
+    assert second[0].busy == 1 and browser.opened == 2
@@ -0,0 +1,50 @@
+# tests/test_domains.py
+import socket
+
+import pytest
+
+from brightdata.utils import domains
+from brightdata.utils.domains import extract, extract_host, root_domain, split_host
+
+
+@pytest.fixture
+def no_network(monkeypatch):
+    def refuse(*a, **kw):
+        raise AssertionError("network access during a PSL lookup")
+
+    monkeypatch.setattr(socket, "create_connection", refuse)
+    monkeypatch.setattr(socket.socket, "connect", refuse)
+    monkeypatch.setattr(domains, "_EXTRACTOR", None)     # force a fresh load
+    extract_host.cache_clear()
+
+
+@pytest.mark.parametrize("url,host,target", [
+    ("https://user@Shop.Example.com:8443/a?b#frag", "shop.example.com", "/a?b"),
+    ("//cdn.example.org/x.js", "cdn.example.org", "/x.js"),
+    ("example.com", "example.com", ""),
+    ("http://[::1]:8080/p", "[::1]", "/p"),
+    ("https://www.amazon.co.uk?q=1", "www.amazon.co.uk", "?q=1"),
+])
+def test_split_host(url, host, target):
+    assert split_host(url) == (host, target)
+
+
+@pytest.mark.parametrize("url,root", [
+    ("https://www.amazon.co.uk/dp/B0", "amazon"),
+    ("https://a.b.example.com.au/", "example"),
+    ("https://foo.github.io/", "github"),       # private suffixes off, as in tldextract
+    ("https://x.com/user", "x"),
+    ("https://localhost:3000/", "localhost"),
+    ("https://com/", None),
+])
+def test_root_domain_offline(no_network, url, root):
+    assert root_domain(url) == root
+
+
+def test_extract_is_memoised_per_host(no_network):
+    extract("https://www.amazon.com/dp/1")
+    extract("https://www.amazon.com/dp/2?x=y")
+    info = extract_host.cache_info()
+    assert (info.misses, info.hits) == (1, 1)
+    res = extract("https://www.amazon.com/")
+    assert (res.subdomain, res.domain, res.suffix) == ("www", "amazon", "com")
@@ -0,0 +1,82 @@
+# tests/test_download.py
+import asyncio
+import gzip
+import io
+
+import pytest
+
+from brightdata.webscraper_api import engine as engine_mod
+from brightdata.webscraper_api.engine import BrightdataEngine
+from brightdata.webscraper_api.retry import RetryPolicy
+
+ROWS = ['{"n": 1}', '{"n": 2}']
+
+
+@pytest.fixture
+def engine(local_api):
+    eng = BrightdataEngine(
+        bearer_token="test",
+        retry_policy=RetryPolicy(base_delay=0.01, max_delay=0.01,
+                                 building_base=0.01, building_timeout=0.2),
+    )
+    eng.BASE_URL = local_api.url
+    return eng
+
+
+def _download(engine, sid, path, **kw):
+    return asyncio.run(engine.download_snapshot_to(sid, path, **kw))
+
+
+def test_writes_to_part_then_renames(engine, tmp_path, monkeypatch):
+    opened = []
+    real_open_sink = engine_mod._open_sink
+
+    def _spy(path, compression):
+        opened.append(path)
+        return real_open_sink(path, compression)
+
+    monkeypatch.setattr(engine_mod, "_open_sink", _spy)
+    out = tmp_path / "out.jsonl"
+    res = _download(engine, "s_1", out)
+
+    assert opened == [tmp_path / "out.jsonl.part"]
+    assert res.success and res.saved_to == out
+    assert (res.row_count, res.field_count, res.data) == (2, 1, None)
+    assert out.read_text().splitlines() == ROWS
+    assert list(tmp_path.iterdir()) == [out]                # no .part left behind
+
+
+def test_refuses_to_overwrite_by_default(engine, local_api, tmp_path):
+    out = tmp_path / "out.jsonl"
+    out.write_text("keep me")
+    with pytest.raises(FileExistsError):
+        _download(engine, "s_1", out)
+    assert out.read_text() == "keep me"
+    assert local_api.calls == []
+
+    assert _download(engine, "s_1", out, overwrite=True).success
+    assert out.read_text().splitlines() == ROWS
+
+
+def test_gzip_output_decompresses(engine, local_api, tmp_path):
+    local_api.bodies["/snapshot/s_2"] = [b'{"n": 1}\n{"n"', b': 2}\n']
+    out = tmp_path / "out.jsonl.gz"
+    assert _download(engine, "s_2", out, compression="gzip", chunk_size=4).row_count == 2
+    assert gzip.decompress(out.read_bytes()).decode().splitlines() == ROWS
+
+
+def test_zstd_output_decompresses(engine, tmp_path):
+    zstandard = pytest.importorskip("zstandard")
+    out = tmp_path / "out.jsonl.zst"
+    assert _download(engine, "s_3", out, compression="zstd").success
+    with zstandard.ZstdDecompressor().stream_reader(io.BytesIO(out.read_bytes())) as r:
+        assert r.read().decode().splitlines() == ROWS
+
+
+def test_still_building_gives_up_without_leaving_files(engine, local_api, tmp_path):
+    local_api.bodies["/snapshot/s_4"] = [b'{"status": "building", "message": "wait"}\n']
+    local_api.script["/snapshot/s_4"] = [202]
+    res = _download(engine, "s_4", tmp_path / "out.jsonl")
+    assert not res.success and res.error == "building_timeout"
+    assert list(tmp_path.iterdir()) == []
+    assert len(local_api.calls) > 2
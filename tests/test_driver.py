@@ -0,0 +1,75 @@
+# tests/test_driver.py
+"""Shared Playwright driver bookkeeping, with async_playwright() stubbed out."""
+import asyncio
+
+import pytest
+
+from brightdata.browserapi import driver as driver_mod
+from brightdata.browserapi.driver import _DRIVERS, get_driver
+
+
+class FakePlaywright:
+    def __init__(self):
+        self.stopped = False
+        self.chromium = object()
+
+    async def stop(self):
+        self.stopped = True
+
+
+class FakeStarter:
+    def __init__(self, fail=False):
+        self.fail = fail
+
+    async def start(self):
+        await asyncio.sleep(0)
+        if self.fail:
+            raise RuntimeError("no driver")
+        return FakePlaywright()
+
+
+@pytest.fixture(autouse=True)
+def fake_playwright(monkeypatch):
+    monkeypatch.setattr(driver_mod, "async_playwright", lambda: FakeStarter())
+
+
+def test_last_lease_stops_the_driver_and_drops_the_entry():
+    async def main():
+        loop = asyncio.get_running_loop()
+        a, b = await get_driver().lease(), await get_driver().lease()
+        driver = _DRIVERS[loop]
+        assert driver.starts == 1 and driver.users == 2
+        playwright = driver.playwright
+        await a.stop()
+        await a.stop()                                  # idempotent
+        assert _DRIVERS[loop] is driver
+        await b.stop()
+        assert playwright.stopped and loop not in _DRIVERS
+
+    for _ in range(3):
+        asyncio.run(main())
+    assert _DRIVERS == {}
+
+
+def test_failed_start_leaves_no_entry(monkeypatch):
+    monkeypatch.setattr(driver_mod, "async_playwright", lambda: FakeStarter(fail=True))
+
+    async def main():
+        with pytest.raises(RuntimeError):
+            await get_driver().lease()
+
+    asyncio.run(main())
+    assert _DRIVERS == {}
+
+
+def test_lease_after_stop_reregisters_the_driver():
+    async def main():
+        loop = asyncio.get_running_loop()
+        driver = get_driver()
+        await (await driver.lease()).stop()
+        lease = await driver.lease()                    # caller kept the object
+        assert _DRIVERS[loop] is driver and driver.starts == 2
+        await lease.stop()
+        assert loop not in _DRIVERS
+
+    asyncio.run(main())
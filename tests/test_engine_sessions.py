@@ -0,0 +1,75 @@
+# tests/test_engine_sessions.py
+import asyncio
+import gc
+
+import aiohttp
+
+from brightdata.webscraper_api.engine import BrightdataEngine
+
+
+def _open_sessions():
+    gc.collect()
+    return [o for o in gc.get_objects()
+            if isinstance(o, aiohttp.ClientSession) and not o.closed]
+
+
+def _engine(url: str, **kw) -> BrightdataEngine:
+    eng = BrightdataEngine(bearer_token="test", **kw)
+    eng.BASE_URL = url
+    return eng
+
+
+def test_pooled_session_closed_with_its_loop(local_api):
+    eng = _engine(local_api.url, pooled=True)
+    before = len(_open_sessions())
+    for i in range(20):
+        assert asyncio.run(eng.get_status(f"s_{i}")) == "running"
+    assert eng._sessions == {}
+    assert len(_open_sessions()) == before
+    assert len(local_api.calls) == 20
+
+
+def test_pooled_session_reused_within_one_loop(local_api):
+    eng = _engine(local_api.url, pooled=True)
+
+    async def main():
+        await asyncio.gather(*(eng.get_status(f"s_{i}") for i in range(10)))
+        assert len(eng._sessions) == 1
+        await eng.close()
+        assert eng._sessions == {}
+
+    asyncio.run(main())
+
+
+def test_pooling_is_scoped_to_its_loop(local_api):
+    eng = _engine(local_api.url)
+
+    async def other_loop():
+        await eng.get_status("other")
+        return eng._use_pool(), asyncio.get_running_loop() in eng._sessions
+
+    async def main():
+        async with eng.pooling():
+            async with eng.pooling():                   # nested → same session
+                await eng.get_status("a")
+            assert eng._use_pool()
+            assert len(eng._sessions) == 1
+            # a concurrent caller on another loop keeps throw-away sessions
+            assert await asyncio.to_thread(asyncio.run, other_loop()) == (False, False)
+        assert not eng.pooled
+        assert eng._pooling == {} and eng._sessions == {}
+
+    asyncio.run(main())
+
+
+def test_async_with_leaves_a_shared_engine_unpooled(local_api):
+    eng = _engine(local_api.url)
+
+    async def main():
+        async with eng:
+            await eng.get_status("a")
+            assert len(eng._sessions) == 1
+        assert not eng.pooled and not eng._use_pool()
+        assert eng._pooling == {} and eng._sessions == {}
+
+    asyncio.run(main())
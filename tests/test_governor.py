@@ -0,0 +1,72 @@
+# tests/test_governor.py
+import asyncio
+import time
+from email.utils import format_datetime
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from brightdata.webscraper_api.engine import BrightdataEngine
+from brightdata.webscraper_api.governor import (
+    EndpointLimit,
+    RateGovernor,
+    _Bucket,
+    _parse_retry_after,
+)
+
+
+def test_parse_retry_after():
+    assert _parse_retry_after("7") == 7.0
+    assert _parse_retry_after("-3") == 0.0
+    assert _parse_retry_after(None) is None
+    assert _parse_retry_after("soon") is None
+    when = datetime.now(timezone.utc) + timedelta(seconds=30)
+    assert 28 <= _parse_retry_after(format_datetime(when, usegmt=True)) <= 30
+
+
+def test_retry_after_closes_the_endpoint_gate():
+    gov = RateGovernor(backoff_max=60)
+    assert gov.throttled("trigger", "12", attempt=0) == 12.0
+    bucket = gov._buckets["trigger"]
+    assert bucket.blocked_until - time.monotonic() == pytest.approx(12.0, abs=0.1)
+    assert gov._buckets["progress"].blocked_until == 0.0       # other classes unaffected
+    assert gov.stats()["trigger"]["throttled"] == 1
+
+
+def test_retry_after_is_capped_and_backoff_grows(monkeypatch):
+    monkeypatch.setattr("brightdata.webscraper_api.governor.random.random", lambda: 0.0)
+    gov = RateGovernor(backoff_base=1.0, backoff_max=10.0)
+    assert gov.throttled("progress", "3600", 0) == 10.0
+    assert [gov.throttled("snapshot", None, a) for a in range(5)] == [1, 2, 4, 8, 10]
+
+
+def test_bucket_reservations_follow_rate_and_burst():
+    bucket = _Bucket(EndpointLimit(rate=10, burst=2))
+    now = bucket.updated
+    assert [bucket.reserve(now) for _ in range(4)] == pytest.approx([0, 0, 0.1, 0.2])
+    bucket.blocked_until = now + 5
+    assert bucket.reserve(now + 1) == pytest.approx(4.0)
+
+
+def test_slot_waits_out_a_429_gate():
+    gov = RateGovernor(limits={"progress": EndpointLimit(rate=1000, burst=10, max_in_flight=2)})
+
+    async def main():
+        gov.throttled("progress", "0.1", 0)
+        t0 = time.monotonic()
+        async with gov.slot("progress"):
+            return time.monotonic() - t0
+
+    assert asyncio.run(main()) >= 0.09
+
+
+def test_engine_retries_429_after_retry_after(local_api):
+    eng = BrightdataEngine(bearer_token="test", governor=RateGovernor(backoff_base=0.01))
+    eng.BASE_URL = local_api.url
+    local_api.script["/trigger"] = [429, 429]
+    local_api.script["/progress/s_1"] = [429]
+    assert asyncio.run(eng.get_status("s_1")) == "running"
+    assert eng.governor.stats()["progress"]["throttled"] == 1
+    # a 429 means the POST was refused, so even a trigger may be re-sent
+    assert asyncio.run(eng.trigger([{"url": "https://a.com"}], dataset_id="gd_1")) == "s_new"
+    assert local_api.calls.count(("POST", "/trigger")) == 3
@@ -0,0 +1,108 @@
+# tests/test_interception.py
+import asyncio
+import re
+
+import pytest
+
+from brightdata.browserapi.interception import (
+    PROFILES,
+    InterceptionProfile,
+    Interceptor,
+    _glob_to_regex,
+    resolve_profile,
+)
+
+
+@pytest.mark.parametrize("glob, url, hit", [
+    ("**/*.png",            "https://a.com/x/y/logo.png",   True),
+    ("**/*.png",            "https://a.com/logo.png?v=1",   False),
+    ("https://a.com/*.js",  "https://a.com/app.js",         True),
+    ("https://a.com/*.js",  "https://a.com/lib/app.js",     False),   # * stops at /
+    ("**/*.{css,woff2}",    "https://cdn.b.com/f.woff2",    True),
+    ("**/*.{css,woff2}",    "https://cdn.b.com/f.woff",     False),
+    ("**/a+b(1).js",        "https://c.com/a+b(1).js",      True),    # regex chars escaped
+])
+def test_glob_to_regex(glob, url, hit):
+    assert bool(re.fullmatch(_glob_to_regex(glob), url)) is hit
+
+
+def test_blocks_by_type_pattern_and_domain():
+    default = PROFILES["default"]
+    assert default.blocks("image", "https://a.com/x", "a")
+    assert default.blocks("other", "https://a.com/x.jpg", "a")
+    assert not default.blocks("script", "https://a.com/app.js", "a")
+
+    html = PROFILES["html-only"]
+    assert not html.blocks("document", "https://a.com/", "a")
+    assert html.blocks("xhr", "https://a.com/api", "a")
+
+    third = PROFILES["no-third-party"]
+    assert not third.blocks("script", "https://www.a.com/app.js", "a")
+    assert third.blocks("script", "https://cdn.other.net/app.js", "a")
+
+    no_media = PROFILES["no-media"]
+    assert no_media.blocks("script", "https://www.google-analytics.com/ga.js", "a")
+    assert not no_media.blocks("script", "https://a.com/app.js", "a")
+
+    assert not PROFILES["none"].blocks("image", "https://a.com/x.png", "a")
+
+
+def test_route_globs():
+    assert PROFILES["none"].route_globs == ()
+    assert PROFILES["default"].route_globs == ("**/*",)
+    globs = resolve_profile(block_patterns=["**/*.png", "**/ads/**"])
+    assert globs.route_globs == ("**/*.png", "**/ads/**")
+
+
+class FakeContext:
+    def __init__(self):
+        self.routes = []
+
+    async def route(self, glob, handler):
+        self.routes.append(glob)
+
+
+class FakeRequest:
+    def __init__(self, url, resource_type="image", navigation=False):
+        self.url = url
+        self.resource_type = resource_type
+        self._navigation = navigation
+        self.frame = type("Frame", (), {"parent_frame": None})()
+
+    def is_navigation_request(self):
+        return self._navigation
+
+
+class FakeRoute:
+    def __init__(self, request):
+        self.request = request
+        self.outcome = None
+
+    async def abort(self):
+        self.outcome = "abort"
+
+    async def fallback(self):
+        self.outcome = "fallback"
+
+
+def test_install_routes_only_what_the_profile_needs():
+    async def installed(profile):
+        ctx = FakeContext()
+        await Interceptor(profile, "a").install(ctx)
+        return ctx.routes
+
+    assert asyncio.run(installed(PROFILES["none"])) == []
+    assert asyncio.run(installed(InterceptionProfile(block_patterns=("**/*.png",)))) == ["**/*.png"]
+    assert asyncio.run(installed(PROFILES["no-media"])) == ["**/*"]
+
+
+def test_handler_never_blocks_the_main_navigation():
+    handler = Interceptor(PROFILES["html-only"], "a")
+
+    async def outcome(request):
+        route = FakeRoute(request)
+        await handler(route)
+        return route.outcome
+
+    assert asyncio.run(outcome(FakeRequest("https://a.com/", "image", navigation=True))) == "fallback"
+    assert asyncio.run(outcome(FakeRequest("https://a.com/x.png"))) == "abort"
@@ -0,0 +1,109 @@
+# tests/test_journal.py
+import asyncio
+
+from brightdata.webscraper_api.engine import BrightdataEngine
+from brightdata.webscraper_api.journal import JobJournal
+from brightdata.webscraper_api.scheduler import SnapshotScheduler
+
+from .test_scheduler import FakeEngine
+
+
+def _crash(journal: JobJournal) -> None:
+    """Drop the handle without closing – what a killed process leaves behind."""
+    journal._fh.flush()
+
+
+def test_pending_jobs_survive_a_crash_and_a_torn_line(tmp_path):
+    path = tmp_path / "jobs.jsonl"
+    j = JobJournal(path)
+    j.record_trigger("s_1", dataset_id="gd_1", payload=[{"url": "a"}], key="gd_1:a")
+    j.record_trigger("s_2", dataset_id="gd_1", payload=[{"url": "b"}], key="gd_1:b")
+    j.record_state("s_1", "done")
+    _crash(j)
+    with open(path, "a", encoding="utf-8") as fh:
+        fh.write('{"event": "done", "sid": "s_2"')          # torn mid-write
+
+    with JobJournal(path) as again:
+        assert list(again.pending()) == ["s_2"]
+        assert again.pending_for("gd_1:b")["payload"] == [{"url": "b"}]
+        assert again.pending_for("gd_1:a") is None
+        again.record_state("s_2", "failed", error="http_404")
+        assert again.pending() == {}
+    assert JobJournal(path).pending() == {}
+
+
+def test_compact_keeps_only_pending(tmp_path):
+    path = tmp_path / "jobs.jsonl"
+    with JobJournal(path) as j:
+        for i in range(5):
+            j.record_trigger(f"s_{i}", dataset_id="gd_1", payload=[], key=f"k{i}")
+        for i in range(4):
+            j.record_state(f"s_{i}", "done")
+        assert j.compact() == 1
+        j.record_trigger("s_9", dataset_id="gd_1", payload=[])
+    assert len(path.read_text().splitlines()) == 2
+    assert set(JobJournal(path).pending()) == {"s_4", "s_9"}
+
+
+def test_engine_reuses_a_journaled_snapshot(tmp_path, local_api):
+    path = tmp_path / "jobs.jsonl"
+    payload = [{"url": "https://a.com/x"}]
+
+    first = BrightdataEngine(bearer_token="test", journal=JobJournal(path))
+    first.BASE_URL = local_api.url
+    sid = asyncio.run(first.trigger(payload, dataset_id="gd_1"))
+    assert sid == "s_new"
+    _crash(first.journal)
+
+    # restarted process: same input → the existing snapshot, no second POST
+    second = BrightdataEngine(bearer_token="test", journal=JobJournal(path))
+    second.BASE_URL = local_api.url
+    assert asyncio.run(second.trigger(payload, dataset_id="gd_1")) == sid
+    assert local_api.calls == [("POST", "/trigger")]
+
+
+def test_scheduler_resumes_pending_jobs(tmp_path):
+    path = tmp_path / "jobs.jsonl"
+    with JobJournal(path) as j:
+        j.record_trigger("s_a", dataset_id="gd_1", payload=[])
+        j.record_trigger("s_b", dataset_id="gd_1", payload=[])
+        j.record_state("s_a", "done")
+
+    engine = FakeEngine({"s_b": 1})
+    engine.restored = []
+    engine.restore_meta = lambda rec: engine.restored.append(rec["sid"])
+
+    async def main():
+        async with SnapshotScheduler(engine, poll_interval=0.01) as sched:
+            futs = sched.resume(JobJournal(path))
+            return {sid: (await f).status for sid, f in futs.items()}
+
+    assert asyncio.run(main()) == {"s_b": "ready"}
+    assert engine.restored == ["s_b"]
+
+
+def test_stale_jobs_fall_back_to_a_fresh_trigger(tmp_path):
+    path = tmp_path / "jobs.jsonl"
+    with JobJournal(path, max_pending_age=60) as j:
+        j.record_trigger("s_old", dataset_id="gd_1", payload=[], key="k")
+        j._pending["s_old"]["ts"] -= 3600                  # triggered an hour ago
+        j.record_trigger("s_new", dataset_id="gd_1", payload=[], key="k2")
+        assert j.pending_for("k") is None
+        assert list(j.pending()) == ["s_new"]
+        assert j.compact() == 1
+    assert list(JobJournal(path).pending()) == ["s_new"]
+
+
+def test_failed_status_probe_closes_the_job(tmp_path, local_api):
+    path = tmp_path / "jobs.jsonl"
+    engine = BrightdataEngine(bearer_token="test", journal=JobJournal(path))
+    engine.BASE_URL = local_api.url
+    payload = [{"url": "https://a.com/x"}]
+    sid = asyncio.run(engine.trigger(payload, dataset_id="gd_1"))
+    local_api.script[f"/progress/{sid}"] = [404]          # gone past retention
+
+    assert asyncio.run(engine.get_status(sid)) == "error"
+    assert engine.journal.pending() == {}
+    # the dead snapshot is not handed out again
+    asyncio.run(engine.trigger(payload, dataset_id="gd_1"))
+    assert local_api.calls.count(("POST", "/trigger")) == 2
@@ -0,0 +1,56 @@
+# tests/test_meta_store.py
+import pytest
+
+from brightdata.models import ScrapeResult
+from brightdata.webscraper_api.meta_store import SnapshotMetaStore
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr("brightdata.webscraper_api.meta_store.time.time", lambda: now[0])
+    return now
+
+
+def test_delivered_entries_expire_after_ttl(clock):
+    store = SnapshotMetaStore(delivered_ttl=60)
+    store.create("s_1", dataset_id="gd_1")
+    store.mark_delivered("s_1")
+    clock[0] += 59
+    assert store.purge() == 0 and "s_1" in store
+    clock[0] += 2
+    assert store.purge() == 1 and "s_1" not in store
+
+
+def test_cap_evicts_delivered_never_pending(clock):
+    store = SnapshotMetaStore(max_entries=2)
+    store.create("cache_abc", dataset_id="gd_1", cached=object())
+    store.create("s_pending", dataset_id="gd_1")
+    store.create("s_done", dataset_id="gd_1")
+    store.mark_delivered("s_done")
+    store.create("s_new", dataset_id="gd_1")
+    # only the delivered entry may go; pending ones stay above the cap
+    assert "s_done" not in store
+    assert {"cache_abc", "s_pending", "s_new"} <= set(store._entries)
+    assert store.evicted == 1
+
+
+def test_untouched_pending_entries_expire(clock):
+    store = SnapshotMetaStore(pending_ttl=100)
+    store.create("s_old")
+    store.create("s_polled")
+    clock[0] += 80
+    store.record_poll("s_polled")          # touching keeps it alive
+    clock[0] += 30
+    assert store.purge() == 1
+    assert "s_old" not in store and "s_polled" in store
+
+
+def test_nbytes_counts_cached_payload():
+    store = SnapshotMetaStore()
+    plain = store.create("s_1", dataset_id="gd_1").nbytes()
+    rows = [{"title": str(i) * 1000} for i in range(10)]
+    hit = ScrapeResult(success=True, url="u", status="ready", data=rows)
+    cached = store.create("cache_1", dataset_id="gd_1", cached=hit).nbytes()
+    assert cached - plain > 10_000
+    assert store.stats()["bytes"] >= plain + cached
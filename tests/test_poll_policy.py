@@ -0,0 +1,62 @@
+# tests/test_poll_policy.py
+from datetime import datetime, timedelta
+
+import pytest
+
+from brightdata.webscraper_api.poll_policy import AdaptivePollPolicy
+
+
+def _policy(**kw):
+    kw.setdefault("min_interval", 1.0)
+    kw.setdefault("max_interval", 30.0)
+    return AdaptivePollPolicy(**kw)
+
+
+def test_unknown_dataset_grows_geometrically():
+    policy = _policy(initial_interval=2.0, growth=2.0, max_interval=10.0)
+    assert [policy.next_delay("gd_new", 0, polls) for polls in range(5)] == [2, 2, 4, 8, 10]
+
+
+def test_learned_dataset_jumps_ahead_then_polls_densely():
+    policy = _policy(spread=0.1)
+    for ready in (19.0, 20.0, 21.0):
+        policy.observe("gd_1", ready)
+    assert policy.expected("gd_1") == 20.0
+    # 2 s margin around 20 s: jump to ~18 s, then min_interval
+    assert policy.next_delay("gd_1", elapsed=0) == 18.0
+    assert policy.next_delay("gd_1", elapsed=19) == 1.0
+    assert policy.next_delay("gd_1", elapsed=21.5) == 1.0
+
+
+def test_overdue_backs_off_up_to_max():
+    policy = _policy(growth=1.5, spread=0.1)
+    policy.observe("gd_1", 20.0)
+    assert policy.next_delay("gd_1", elapsed=32) == pytest.approx(1.0 + 10 * 0.5)
+    assert policy.next_delay("gd_1", elapsed=1000) == 30.0
+
+
+def test_observe_meta_uses_midpoint_of_last_two_polls():
+    policy = _policy()
+    sent = datetime(2025, 1, 1, 12, 0, 0)
+    meta = {
+        "dataset_id": "gd_1",
+        "request_sent_at": sent,
+        "snapshot_polled_at": [sent + timedelta(seconds=s) for s in (5, 10, 14)],
+    }
+    assert policy.observe_meta(meta) == 12.0
+    assert policy.observe_meta({"dataset_id": "gd_1"}) is None
+    only_data = {"dataset_id": "gd_2", "request_sent_at": sent,
+                 "data_received_at": sent + timedelta(seconds=7)}
+    assert policy.observe_meta(only_data) == 7.0
+
+
+def test_window_keeps_recent_samples_only():
+    policy = _policy(window=3)
+    for ready in (100, 100, 100, 5, 5, 5):
+        policy.observe("gd_1", ready)
+    assert policy.expected("gd_1") == 5
+
+
+def test_invalid_bounds():
+    with pytest.raises(ValueError):
+        AdaptivePollPolicy(min_interval=5, max_interval=1)
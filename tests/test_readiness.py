@@ -0,0 +1,78 @@
+# tests/test_readiness.py
+from brightdata.browserapi.readiness import (
+    DEFAULT_RULE,
+    FALLBACK_SELECTOR,
+    Readiness,
+    ReadinessEngine,
+    ReadinessRule,
+)
+
+URL = "https://www.shop.com/p/1"
+
+
+def _ready(ms, matched="div#__next"):
+    return Readiness(True, ms, matched, 500)
+
+
+def test_matched_selector_narrows_the_rule():
+    eng = ReadinessEngine()
+    assert eng.rule_for(URL) is DEFAULT_RULE
+    eng.observe(URL, _ready(800))
+    assert eng.rule_for(URL).selectors == ("div#__next",)
+    assert eng.rule_for("https://other.com/").selectors == DEFAULT_RULE.selectors
+
+
+def test_selector_outside_the_configured_rule_is_ignored():
+    eng = ReadinessEngine({"shop": ReadinessRule(selectors=("div.product",))})
+    eng.observe(URL, _ready(800, matched="#main"))
+    assert eng.rule_for(URL).selectors == ("div.product",)
+
+
+def test_fallback_selector_is_not_learned():
+    eng = ReadinessEngine()
+    eng.observe(URL, _ready(800, matched=FALLBACK_SELECTOR))
+    assert eng.rule_for(URL).selectors == DEFAULT_RULE.selectors
+    eng.observe(URL, _ready(800))
+    eng.observe(URL, _ready(800, matched=FALLBACK_SELECTOR))
+    assert eng.rule_for(URL).selectors == ("div#__next",)
+
+
+def test_max_wait_capped_only_after_min_samples():
+    eng = ReadinessEngine(min_samples=3)
+    for ms in (1200, 2500):
+        eng.observe(URL, _ready(ms))
+        assert eng.rule_for(URL).max_wait_ms == DEFAULT_RULE.max_wait_ms
+    eng.observe(URL, _ready(900))
+    assert eng.rule_for(URL).max_wait_ms == 5000              # 2 × slowest
+    for _ in range(3):
+        eng.observe("https://fast.com/", _ready(100))
+    assert eng.rule_for("https://fast.com/").max_wait_ms == 1000   # floor
+
+
+def test_timeout_resets_what_was_learned():
+    eng = ReadinessEngine(min_samples=1)
+    eng.observe(URL, _ready(1000))
+    assert eng.rule_for(URL).max_wait_ms == 2000
+    eng.observe(URL, Readiness(False, 2000, None, 0))
+    assert eng.rule_for(URL) == DEFAULT_RULE
+
+
+def test_learning_can_be_switched_off():
+    eng = ReadinessEngine(learn=False, min_samples=1)
+    eng.observe(URL, _ready(1000))
+    assert eng.rule_for(URL) is DEFAULT_RULE
+
+
+def test_save_load_round_trip(tmp_path):
+    path = tmp_path / "ready.json"
+    eng = ReadinessEngine({"zara": ReadinessRule(selectors=("div.pd",), max_wait_ms=9000)},
+                          min_samples=2, path=path)
+    eng.observe(URL, _ready(1500))
+    eng.observe(URL, _ready(2000))
+    assert eng.save() == path
+
+    again = ReadinessEngine(min_samples=2, path=path)
+    assert again.rules == eng.rules
+    assert again.rule_for(URL) == eng.rule_for(URL)
+    assert again.rule_for(URL).max_wait_ms == 4000
+    assert again.rule_for("https://www.zara.com/x").selectors == ("div.pd",)
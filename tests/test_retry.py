@@ -0,0 +1,94 @@
+# tests/test_retry.py
+import asyncio
+import time
+
+import aiohttp
+import pytest
+
+from brightdata.webscraper_api.engine import BrightdataEngine
+from brightdata.webscraper_api.retry import RetryPolicy
+
+
+def test_classify():
+    assert RetryPolicy.classify(503) == "5xx"
+    assert RetryPolicy.classify(429) == "429"
+    assert RetryPolicy.classify(404) == "4xx"
+    assert RetryPolicy.classify(asyncio.TimeoutError()) == "timeout"
+    assert RetryPolicy.classify(aiohttp.ServerDisconnectedError()) == "connect"
+    assert RetryPolicy.classify(ValueError()) == "other"
+
+
+def test_retry_delay_bounds(monkeypatch):
+    monkeypatch.setattr("brightdata.webscraper_api.retry.random.uniform", lambda a, b: b)
+    policy = RetryPolicy(max_attempts=3, base_delay=1.0, max_delay=3.0, deadline=100)
+    started = time.monotonic()
+    assert policy.retry_delay(503, 0, started) == 1.0
+    assert policy.retry_delay(503, 1, started) == 2.0
+    assert policy.retry_delay(503, 2, started) is None          # attempts used up
+    assert policy.retry_delay(404, 0, started) is None          # permanent
+    assert policy.retry_delay(503, 0, started - 99.5) is None   # past the deadline
+    assert RetryPolicy(max_delay=3.0, base_delay=1.0).backoff(10) == 3.0
+
+
+def test_building_delay_grows_to_cap(monkeypatch):
+    monkeypatch.setattr("brightdata.webscraper_api.retry.random.uniform", lambda a, b: b)
+    policy = RetryPolicy(building_base=2.0, building_max_delay=5.0)
+    assert [policy.building_delay(i) for i in range(4)] == [2.0, 3.0, 4.5, 5.0]
+
+
+def test_only_unsent_requests_count_as_unsent():
+    assert RetryPolicy.may_have_been_sent(asyncio.TimeoutError())
+    assert RetryPolicy.may_have_been_sent(aiohttp.ServerDisconnectedError())
+    refused = aiohttp.ClientConnectorError(None, OSError(111, "refused"))
+    assert not RetryPolicy.may_have_been_sent(refused)
+
+
+@pytest.fixture
+def engine(local_api):
+    eng = BrightdataEngine(
+        bearer_token="test",
+        retry_policy=RetryPolicy(base_delay=0.01, max_delay=0.01, building_base=0.01),
+    )
+    eng.BASE_URL = local_api.url
+    return eng
+
+
+def test_get_is_retried_on_5xx_and_disconnect(engine, local_api):
+    local_api.script["/progress/s_1"] = [503, 0]
+    assert asyncio.run(engine.get_status("s_1")) == "running"
+    assert len(local_api.calls) == 3
+
+
+@pytest.mark.parametrize("failure", [500, 0])
+def test_trigger_is_not_resent_after_it_was_sent(engine, local_api, failure):
+    local_api.script["/trigger"] = [failure]
+    assert asyncio.run(engine.trigger([{"url": "https://a.com"}], dataset_id="gd_1")) is None
+    assert local_api.calls == [("POST", "/trigger")]
+
+
+def test_iter_result_retries_transient_and_paces_building(engine, local_api, monkeypatch):
+    waits = []
+    monkeypatch.setattr(engine.retry_policy, "building_delay", lambda n: waits.append(n) or 0.0)
+    local_api.script["/snapshot/s_2"] = [502, 202, 202]
+
+    async def main():
+        return [row async for row in engine.iter_result("s_2")]
+
+    assert asyncio.run(main()) == [{"n": 1}, {"n": 2}]
+    assert len(local_api.calls) == 4
+    assert waits == [0, 1]
+
+
+def test_download_restarts_after_a_dropped_transfer(engine, local_api, tmp_path):
+    local_api.script["/snapshot/s_3"] = [0, 202]
+    res = asyncio.run(engine.download_snapshot_to("s_3", tmp_path / "out.jsonl"))
+    assert res.success and res.row_count == 2
+    assert (tmp_path / "out.jsonl").read_text().splitlines() == ['{"n": 1}', '{"n": 2}']
+    assert len(local_api.calls) == 3
+
+
+def test_fetch_result_retries_only_within_request(engine, local_api):
+    local_api.script["/snapshot/s_4"] = [502] * 10
+    res = asyncio.run(engine.fetch_result("s_4"))
+    assert not res.success and res.error == "http_502"
+    assert len(local_api.calls) == engine.retry_policy.max_attempts
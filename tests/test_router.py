@@ -0,0 +1,103 @@
+# tests/test_router.py
+"""UrlRouter against the routing it replaced (per-URL PSL lookup + regex loops)."""
+import re
+from urllib.parse import urlparse
+
+import pytest
+import tldextract
+
+from brightdata.webscraper_api.registry import _import_all_scrapers, _COLLECT_REGISTRY
+from brightdata.webscraper_api.router import UrlRouter, compile_kinds
+
+_OFFLINE = tldextract.TLDExtract(cache_dir=None, suffix_list_urls=(), fallback_to_snapshot=True)
+
+URLS = [
+    "https://www.amazon.com/dp/B0CRMZHDG8",
+    "https://amazon.co.uk/gp/product/B01/ref=x",
+    "https://www.amazon.de/Foo/product-reviews/B0C?pageNumber=2",
+    "https://www.amazon.com/sp?seller=A1B2",
+    "https://www.amazon.com/s?k=usb+hub",
+    "https://www.amazon.com/stores/page/ABC",
+    "HTTPS://WWW.AMAZON.COM/DP/B0CRMZHDG8#reviews",
+    "https://www.linkedin.com/in/some-person/",
+    "https://linkedin.com/pub/x/1/2/3",
+    "https://www.linkedin.com/company/acme",
+    "https://www.linkedin.com/jobs/view/12345/?ref=x",
+    "https://www.linkedin.com/feed/in/not-a-profile",
+    "https://de.linkedin.com/IN/Someone",
+    "https://www.reddit.com/r/python/",
+    "https://old.reddit.com/r/python/comments/abc/title/",
+    "https://www.instagram.com/p/C123/",
+    "https://www.tiktok.com/@user/video/1",
+    "https://x.com/user/status/1",
+    "https://www.digikey.com/en/products/detail/x/y/1",
+    "https://eu.mouser.com/ProductDetail/1",
+    "https://user:pw@www.amazon.com:443/dp/B0?x=1",
+    "https://example.com/dp/B0",
+    "https://amazon.example.com/dp/B0",
+    "https://notamazon.com/dp/B0",
+    "amazon.com/dp/B0",
+]
+
+
+def _old_scraper_for(url):
+    host = urlparse(url if "://" in url else f"//{url}").hostname or ""
+    return _COLLECT_REGISTRY.get(_OFFLINE(host.lower()).domain)
+
+
+def _old_kind(cls, url):
+    patterns = getattr(cls, "PATTERNS", None) or {}
+    if cls.__name__ == "LinkedInScraper":           # matched the path only
+        path = urlparse(url).path
+        return next((k for k, rx in patterns.items() if rx.match(path)), None)
+    return next((k for k, rx in patterns.items() if rx.search(url)), None)
+
+
+@pytest.fixture(scope="module")
+def router():
+    _import_all_scrapers()
+    return UrlRouter(_COLLECT_REGISTRY)
+
+
+@pytest.mark.parametrize("url", URLS)
+def test_route_matches_the_old_routing(router, url):
+    cls = _old_scraper_for(url)
+    route = router.route(url)
+    if cls is None:
+        assert route is None
+    else:
+        assert route.scraper is cls
+        assert route.kind == _old_kind(cls, url)
+
+
+def test_route_many_and_group_agree_with_route(router):
+    routes = router.route_many(URLS)
+    assert routes == [router.route(u) for u in URLS]
+    grouped = router.group(URLS)
+    assert sorted(u for kinds in grouped.values() for us in kinds.values() for u in us) == sorted(URLS)
+    assert "https://example.com/dp/B0" in grouped[None][None]
+
+
+def test_compile_kinds_keeps_priority_and_flags():
+    rx, kinds = compile_kinds({
+        "a": re.compile(r"/x/"),
+        "b": re.compile(r"/x/y", re.I),
+    })
+    assert kinds[int(rx.match("/x/y").lastgroup[1:])] == "a"
+    assert kinds[int(rx.match("/X/Y").lastgroup[1:])] == "b"
+    assert rx.match("/z") is None
+    assert compile_kinds({}) is None
+
+
+def test_invalidate_picks_up_new_registrations(router):
+    registry = {}
+    r = UrlRouter(registry)
+    assert r.scraper_for("https://newsite.com/a") is None
+
+    class NewScraper:
+        PATTERNS = {"item": re.compile(r"/item/")}
+
+    registry["newsite"] = NewScraper
+    assert r.scraper_for("https://newsite.com/a") is None      # memoised miss
+    r.invalidate()
+    assert r.route("https://newsite.com/item/1") == (NewScraper, "item")
@@ -0,0 +1,143 @@
+# tests/test_scheduler.py
+import asyncio
+import time
+
+import pytest
+
+from brightdata.models import ScrapeResult
+from brightdata.webscraper_api.scheduler import SnapshotScheduler
+
+
+class FakeEngine:
+    """Just enough of BrightdataEngine for the scheduler."""
+
+    BASE_URL = "https://api.test"
+
+    def __init__(self, ready_after, cached=None):
+        self.ready_after = dict(ready_after)     # sid → probes until "ready"
+        self.cached = dict(cached or {})
+        self.probes = []
+        self.delivered = []
+        self._snap_meta = self
+
+    def mark_delivered(self, sid):
+        self.delivered.append(sid)
+
+    def _cached_result(self, sid):
+        return self.cached.get(sid)
+
+    async def get_status(self, sid):
+        self.probes.append(sid)
+        if self.ready_after[sid] is None:
+            raise RuntimeError("boom")
+        return "ready" if self.probes.count(sid) >= self.ready_after[sid] else "running"
+
+    async def fetch_result(self, sid):
+        return ScrapeResult(success=True, url=sid, status="ready", data=[sid], snapshot_id=sid)
+
+    def next_poll_delay(self, sid, poll_interval=None):
+        return poll_interval if poll_interval is not None else 0.0
+
+    def _make_result(self, **kw):
+        return ScrapeResult(**kw)
+
+
+def test_results_complete_in_readiness_order():
+    engine = FakeEngine({"s_slow": 3, "s_fast": 1, "s_mid": 2})
+
+    async def main():
+        done = []
+        async with SnapshotScheduler(engine, poll_interval=0.01, max_polls_per_sec=1000) as sched:
+            futs = [sched.submit(sid) for sid in ("s_slow", "s_fast", "s_mid")]
+            for fut in asyncio.as_completed(futs):
+                done.append((await fut).snapshot_id)
+            assert sched.pending == 0
+        return done
+
+    assert asyncio.run(main()) == ["s_fast", "s_mid", "s_slow"]
+    # first round probes in submission order
+    assert engine.probes[:3] == ["s_slow", "s_fast", "s_mid"]
+    assert engine.probes.count("s_slow") == 3
+
+
+def test_submit_twice_returns_the_same_future():
+    engine = FakeEngine({"s_1": 2})
+
+    async def main():
+        async with SnapshotScheduler(engine, poll_interval=0.01) as sched:
+            assert sched.submit("s_1") is sched.submit("s_1")
+            await sched.wait("s_1")
+
+    asyncio.run(main())
+    assert engine.probes.count("s_1") == 2
+
+
+def test_cancelled_future_is_dropped_and_resubmittable():
+    engine = FakeEngine({"s_1": 3})
+
+    async def main():
+        async with SnapshotScheduler(engine, poll_interval=0.01) as sched:
+            first = sched.submit("s_1")
+            first.cancel()
+            await asyncio.sleep(0)
+            assert sched.pending == 0
+            second = sched.submit("s_1")
+            assert second is not first
+            res = await second
+            await asyncio.sleep(0.05)           # no orphaned probe chain left
+            return res
+
+    assert asyncio.run(main()).status == "ready"
+    assert engine.probes.count("s_1") == 3
+
+
+def test_probes_are_paced_to_the_aggregate_rate():
+    engine = FakeEngine({f"s_{i}": 1 for i in range(5)})
+
+    async def main():
+        async with SnapshotScheduler(engine, poll_interval=0.0, max_polls_per_sec=50) as sched:
+            t0 = time.monotonic()
+            await asyncio.gather(*(sched.submit(f"s_{i}") for i in range(5)))
+            return time.monotonic() - t0
+
+    assert asyncio.run(main()) >= 4 / 50 * 0.9
+
+
+def test_close_cancels_pending_and_timeout_resolves():
+    engine = FakeEngine({"s_never": 10**6, "s_short": 10**6})
+
+    async def main():
+        sched = SnapshotScheduler(engine, poll_interval=0.01)
+        never = sched.submit("s_never", timeout=60)
+        short = await sched.wait("s_short", timeout=0.05)
+        assert short.status == "timeout" and not short.success
+        await sched.close()
+        assert never.cancelled()
+        assert sched.pending == 0
+
+    asyncio.run(main())
+
+
+def test_probe_error_fails_only_its_snapshot():
+    engine = FakeEngine({"s_bad": None, "s_ok": 1})
+
+    async def main():
+        async with SnapshotScheduler(engine, poll_interval=0.01) as sched:
+            bad, ok = sched.submit("s_bad"), sched.submit("s_ok")
+            with pytest.raises(RuntimeError):
+                await bad
+            assert (await ok).success
+
+    asyncio.run(main())
+
+
+def test_cache_hit_is_delivered_without_probing():
+    hit = ScrapeResult(success=True, url="u", status="ready", data=[1], cache_hit=True)
+    engine = FakeEngine({}, cached={"cache_x": hit})
+
+    async def main():
+        async with SnapshotScheduler(engine) as sched:
+            return await sched.submit("cache_x")
+
+    assert asyncio.run(main()) is hit
+    assert engine.probes == [] and engine.delivered == ["cache_x"]
@@ -0,0 +1,91 @@
+# tests/test_scrape_urls_iter.py
+import asyncio
+import contextlib
+
+import pytest
+
+from brightdata import auto
+from brightdata.auto import scrape_urls_async, scrape_urls_iter
+
+from .test_scheduler import FakeEngine
+
+URLS = {                                   # url → snapshot id
+    "https://www.amazon.com/dp/SLOW": "s_slow",
+    "https://www.amazon.com/dp/FAST": "s_fast",
+    "https://www.amazon.com/dp/MID":  "s_mid",
+}
+
+
+class PoolingFakeEngine(FakeEngine):
+    """FakeEngine + what scrape_urls_iter needs on top of the scheduler."""
+
+    fetched = None
+
+    @contextlib.asynccontextmanager
+    async def pooling(self):
+        yield self
+
+    async def fetch_result(self, sid):
+        self.fetched.append(sid)
+        return await super().fetch_result(sid)
+
+
+@pytest.fixture
+def engine(monkeypatch):
+    eng = PoolingFakeEngine({"s_slow": 6, "s_fast": 1, "s_mid": 3})
+    eng.triggered, eng.fetched = [], []
+
+    async def fake_trigger(url, bearer_token=None, **kw):
+        eng.triggered.append(url)
+        await asyncio.sleep(0)
+        return URLS[url]
+
+    monkeypatch.setattr(auto, "get_engine", lambda token=None: eng)
+    monkeypatch.setattr(auto, "trigger_scrape_url_async", fake_trigger)
+    return eng
+
+
+def test_yields_in_completion_order(engine):
+    async def main():
+        return [(u, r.snapshot_id) async for u, r in
+                scrape_urls_iter(list(URLS), poll_interval=0.01, max_polls_per_sec=1000)]
+
+    assert asyncio.run(main()) == [
+        ("https://www.amazon.com/dp/FAST", "s_fast"),
+        ("https://www.amazon.com/dp/MID",  "s_mid"),
+        ("https://www.amazon.com/dp/SLOW", "s_slow"),
+    ]
+
+
+def test_breaking_out_cancels_the_remaining_polls(engine):
+    async def main():
+        it = scrape_urls_iter(list(URLS), poll_interval=0.01, max_polls_per_sec=1000)
+        async with contextlib.aclosing(it):
+            async for url, _ in it:
+                break
+        probes = len(engine.probes)
+        await asyncio.sleep(0.1)
+        return url, probes
+
+    url, probes = asyncio.run(main())
+    assert url == "https://www.amazon.com/dp/FAST"
+    assert len(engine.probes) == probes                   # nothing polled after close
+    assert engine.fetched == ["s_fast"]
+    assert engine.probes.count("s_slow") < 6
+
+
+def test_duplicate_urls_are_triggered_and_yielded_once(engine):
+    fast = "https://www.amazon.com/dp/FAST"
+    mid  = "https://www.amazon.com/dp/MID"
+
+    async def main():
+        pairs = [(u, r.snapshot_id) async for u, r in
+                 scrape_urls_iter([fast, mid, fast, fast], poll_interval=0.01,
+                                  max_polls_per_sec=1000)]
+        return pairs, await scrape_urls_async([mid, fast, mid], poll_interval=0.01,
+                                              max_polls_per_sec=1000)
+
+    pairs, collected = asyncio.run(main())
+    assert pairs == [(fast, "s_fast"), (mid, "s_mid")]
+    assert engine.triggered == [fast, mid, mid, fast]
+    assert list(collected) == [mid, fast]
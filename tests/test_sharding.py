@@ -0,0 +1,61 @@
+# tests/test_sharding.py
+from brightdata import auto
+from brightdata.auto import _shard_urls, scrape_urls_sharded
+
+AMAZON   = [f"https://www.amazon.com/dp/B{i:03d}" for i in range(6)]
+LINKEDIN = [f"https://www.linkedin.com/in/p{i}" for i in range(2)]
+OTHER    = ["https://example.com/a", "https://example.com/b"]
+
+
+def _fake_scrape_urls_async(calls=None):
+    """Stands in for the engine-backed scrape: result = "res:<url>"."""
+    async def fake(urls, **options):
+        if calls is not None:
+            calls.append((list(urls), options))
+        return {u: f"res:{u}" for u in urls}
+    return fake
+
+
+def test_shards_keep_scraper_groups_together():
+    shards = _shard_urls(AMAZON[:2] + LINKEDIN + OTHER, workers=3)
+    assert sorted(map(sorted, shards)) == sorted(
+        [sorted(AMAZON[:2]), sorted(LINKEDIN), sorted(OTHER)]
+    )
+
+
+def test_big_groups_are_cut_and_shards_balanced():
+    urls = AMAZON + LINKEDIN
+    shards = _shard_urls(urls + AMAZON[:3], workers=2)     # duplicates dropped
+    assert sorted(u for s in shards for u in s) == sorted(urls)
+    assert sorted(map(len, shards)) == [4, 4]
+    assert any(set(s) >= set(LINKEDIN) for s in shards)
+
+
+def test_never_more_shards_than_urls():
+    assert sorted(_shard_urls(OTHER, workers=8)) == [[OTHER[0]], [OTHER[1]]]
+    assert _shard_urls(OTHER, workers=1) == [OTHER]
+    assert _shard_urls([], workers=4) == []
+
+
+def test_single_shard_runs_in_process(monkeypatch):
+    calls, seen = [], []
+    monkeypatch.setattr(auto, "scrape_urls_async", _fake_scrape_urls_async(calls))
+    urls = OTHER + OTHER[:1]
+
+    res = scrape_urls_sharded(urls, workers=1, on_result=lambda u, r: seen.append(u),
+                              coalesce=True)
+    assert res == {u: f"res:{u}" for u in OTHER}
+    assert calls == [(OTHER, calls[0][1])]                   # one call, de-duplicated
+    assert calls[0][1]["coalesce"] is True
+    assert seen == OTHER
+
+
+def test_worker_results_are_merged(monkeypatch):
+    # fork: the children inherit the stubbed scrape
+    monkeypatch.setattr(auto, "scrape_urls_async", _fake_scrape_urls_async())
+    urls, seen = AMAZON + LINKEDIN + OTHER, []
+
+    res = scrape_urls_sharded(urls, workers=3, batch_size=2, start_method="fork",
+                              on_result=lambda u, r: seen.append(u))
+    assert res == {u: f"res:{u}" for u in urls}
+    assert sorted(seen) == sorted(urls)
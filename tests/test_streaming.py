@@ -0,0 +1,90 @@
+# tests/test_streaming.py
+import asyncio
+
+import pytest
+
+from brightdata.utils.streaming import NDJSONDecoder, iter_ndjson
+from brightdata.webscraper_api.engine import BrightdataEngine
+from brightdata.webscraper_api.journal import JobJournal
+from brightdata.webscraper_api.retry import RetryPolicy
+
+
+def test_decoder_joins_a_row_split_across_chunks():
+    dec = NDJSONDecoder()
+    assert dec.feed(b'{"a": 1}\n{"b": ') == [{"a": 1}]
+    assert dec.feed(b'"x y') == []
+    assert dec.feed(b'z"}\n\n{"c"') == [{"b": "x yz"}]
+    assert dec.feed(b": 3}\n") == [{"c": 3}]
+    assert dec.close() == []
+    assert dec.records == 3
+
+
+def test_decoder_flushes_a_trailing_line_without_newline():
+    assert list(iter_ndjson([b'{"a": 1}\n{"a"', b": 2}"])) == [{"a": 1}, {"a": 2}]
+
+
+@pytest.fixture
+def engine(local_api, tmp_path):
+    eng = BrightdataEngine(
+        bearer_token="test",
+        retry_policy=RetryPolicy(base_delay=0.01, max_delay=0.01, building_base=0.01),
+        journal=JobJournal(tmp_path / "jobs.jsonl"),
+    )
+    eng.BASE_URL = local_api.url
+    return eng
+
+
+def _collect(engine, sid, **kw):
+    async def main():
+        return [row async for row in engine.iter_result(sid, **kw)]
+    return asyncio.run(main())
+
+
+def test_iter_result_streams_split_rows_and_a_trailing_line(engine, local_api):
+    local_api.bodies["/snapshot/s_1"] = [b'{"n": 1}\n{"n"', b': 2, "t": "a', b'b"}\n{"n": 3}']
+    rows = _collect(engine, "s_1", chunk_size=4)
+    assert rows == [{"n": 1}, {"n": 2, "t": "ab"}, {"n": 3}]
+
+
+def test_iter_result_waits_out_building(engine, local_api):
+    local_api.script["/snapshot/s_2"] = [202, 202]
+    assert _collect(engine, "s_2", building_retry=0.01) == [{"n": 1}, {"n": 2}]
+    assert len(local_api.calls) == 3
+
+
+def test_iter_result_waits_out_the_building_placeholder(engine, local_api):
+    local_api.bodies["/snapshot/s_3"] = [b'{"status": "building", "message": "wait"}\n']
+
+    async def main():
+        it = engine.iter_result("s_3", building_retry=0.01)
+        first = asyncio.ensure_future(it.__anext__())
+        await asyncio.sleep(0.05)
+        assert not first.done()                     # placeholder is not a row
+        del local_api.bodies["/snapshot/s_3"]
+        return [await first] + [row async for row in it]
+
+    assert asyncio.run(main()) == [{"n": 1}, {"n": 2}]
+
+
+def test_journal_closed_only_after_the_last_row(engine, local_api):
+    engine.journal.record_trigger("s_4", dataset_id="gd_1", payload=[])
+    seen = []
+
+    async def main():
+        async for row in engine.iter_result("s_4"):
+            seen.append((row["n"], "s_4" in engine.journal.pending()))
+
+    asyncio.run(main())
+    assert seen == [(1, True), (2, True)]
+    assert engine.journal.pending() == {}
+
+
+def test_iter_result_abandoned_midway_keeps_the_job_pending(engine, local_api):
+    engine.journal.record_trigger("s_5", dataset_id="gd_1", payload=[])
+
+    async def main():
+        async for row in engine.iter_result("s_5"):
+            break
+
+    asyncio.run(main())
+    assert "s_5" in engine.journal.pending()
@@ -0,0 +1,79 @@
+# tests/test_web_unlocker.py
+import asyncio
+import gc
+
+import aiohttp
+import pytest
+
+from brightdata.models import ScrapeResult
+from brightdata.web_unlocker import WebUnlocker
+
+
+@pytest.fixture
+def unlocker(local_api):
+    u = WebUnlocker("token", "zone")
+    u._endpoint = f"{local_api.url}/request"
+    return u
+
+
+class _FakeFetch:
+    """Stands in for get_source_async; records start order and overlap."""
+
+    def __init__(self):
+        self.started = []
+        self.in_flight = {}
+        self.peak = {}
+
+    async def __call__(self, url):
+        host = url.split("/")[2]
+        self.started.append(url)
+        self.in_flight[host] = self.in_flight.get(host, 0) + 1
+        self.peak[host] = max(self.peak.get(host, 0), self.in_flight[host])
+        await asyncio.sleep(0.01)
+        self.in_flight[host] -= 1
+        return ScrapeResult(success=True, url=url, status="ready", data=url)
+
+
+def _run(unlocker, urls, **kw):
+    async def main():
+        return [item async for item in unlocker.get_sources_async(urls, **kw)]
+
+    return asyncio.run(main())
+
+
+def test_hosts_are_served_round_robin(unlocker, monkeypatch):
+    fake = _FakeFetch()
+    monkeypatch.setattr(unlocker, "get_source_async", fake)
+    urls = [f"https://big.com/{i}" for i in range(4)] + ["https://b.com/1", "https://c.com/1"]
+    out = _run(unlocker, urls, concurrency=3)
+    # the first wave takes one URL per host, not three from big.com
+    assert fake.started[:3] == ["https://big.com/0", "https://b.com/1", "https://c.com/1"]
+    assert sorted(u for u, _ in out) == sorted(urls)
+
+
+def test_per_host_caps_in_flight(unlocker, monkeypatch):
+    fake = _FakeFetch()
+    monkeypatch.setattr(unlocker, "get_source_async", fake)
+    urls = [f"https://big.com/{i}" for i in range(6)] + [f"https://b.com/{i}" for i in range(2)]
+    out = _run(unlocker, urls, concurrency=8, per_host=2)
+    assert fake.peak == {"big.com": 2, "b.com": 2}
+    assert len(out) == len(urls)
+
+
+def test_get_sources_closes_its_session(unlocker, local_api):
+    urls = [f"https://h{i % 3}.com/{i}" for i in range(9)]
+    for _ in range(3):
+        got = unlocker.get_sources(urls, concurrency=4)
+        assert list(got) == urls and all(r.success for r in got.values())
+    assert unlocker._sessions == {} and unlocker._pooling == {}
+    gc.collect()
+    assert not [o for o in gc.get_objects()
+                if isinstance(o, aiohttp.ClientSession) and not o.closed]
+    assert len(local_api.calls) == 27
+
+
+def test_pooled_unlocker_does_not_leak_per_loop(unlocker):
+    unlocker.pooled = True
+    for _ in range(3):
+        unlocker.get_sources(["https://a.com/1", "https://b.com/1"])
+    assert unlocker._sessions == {}